@@ -6,6 +6,7 @@ import os
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 import shutil
 
 # Configure environment
@@ -26,6 +27,14 @@ OUTPUT_DIRS = {
     "heatmaps": "output/visualizations/heatmaps"
 }
 
+# Translation table for turning snake_case keys into display labels
+_UND2SPACE = str.maketrans("_", " ")
+
+@lru_cache(maxsize=None)
+def _pretty(key: str) -> str:
+    """Convert a snake_case key such as 'network_policy' into 'Network Policy'"""
+    return key.translate(_UND2SPACE).title()
+
 def ensure_output_dirs():
     """Ensure all output directories exist"""
     for dir_path in OUTPUT_DIRS.values():
@@ -142,7 +151,7 @@ def print_mock_investigation():
     json_output_path = os.path.join(OUTPUT_DIRS["investigations"], f"{investigation_id}.json")
     with open(json_output_path, "w") as f:
         json.dump(mock_result, f, indent=2)
-    logger.info(f"Investigation result saved to {json_output_path}")
+    logger.info("Investigation result saved to %s", json_output_path)
     
     # Generate summary report in markdown format
     summary_output_path = os.path.join(OUTPUT_DIRS["investigations"], f"{investigation_id}_summary.md")
@@ -150,7 +159,7 @@ def print_mock_investigation():
         f.write(f"# Kubernetes Root Cause Analysis Summary\n\n")
         f.write(f"**Investigation ID**: {investigation_id}\n")
         f.write(f"**Date/Time**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"**Status**: {mock_result['investigation_phase'].replace('_', ' ').title()}\n\n")
+        f.write(f"**Status**: {_pretty(mock_result['investigation_phase'])}\n\n")
         
         f.write("## Initial Symptoms\n\n")
         f.write(f"```\n{mock_result['initial_symptoms'].strip()}\n```\n\n")
@@ -158,7 +167,7 @@ def print_mock_investigation():
         f.write("## Root Causes\n\n")
         for cause in mock_result.get("root_causes", []):
             confidence = cause.get("confidence", 0) * 100
-            f.write(f"### {cause.get('category').replace('_', ' ').title()}: {cause.get('component')} ({confidence:.1f}%)\n\n")
+            f.write(f"### {_pretty(cause.get('category'))}: {cause.get('component')} ({confidence:.1f}%)\n\n")
             f.write(f"{cause.get('description')}\n\n")
             f.write("**Supporting Evidence**:\n")
             for evidence in cause.get("supporting_evidence", []):
@@ -179,7 +188,7 @@ def print_mock_investigation():
         f.write("| Area | Confidence |\n")
         f.write("|------|------------|\n")
         for area, score in mock_result.get("confidence_scores", {}).items():
-            f.write(f"| {area.replace('_', ' ').title()} | {score*100:.1f}% |\n")
+            f.write(f"| {_pretty(area)} | {score*100:.1f}% |\n")
         f.write("\n")
         
         f.write("## Specialist Agent Findings\n\n")
@@ -192,7 +201,7 @@ def print_mock_investigation():
                 f.write(f"- {issue}\n")
             f.write("\n")
     
-    logger.info(f"Investigation summary saved to {summary_output_path}")
+    logger.info("Investigation summary saved to %s", summary_output_path)
     
     try:
         # Import visualization utilities
@@ -204,12 +213,12 @@ def print_mock_investigation():
         # Investigation graph
         graph_output_path = os.path.join(OUTPUT_DIRS["graphs"], f"{investigation_id}_graph.html")
         generate_investigation_graph(mock_result, graph_output_path)
-        logger.info(f"Investigation graph saved to {graph_output_path}")
+        logger.info("Investigation graph saved to %s", graph_output_path)
         
         # Confidence heatmap
         heatmap_output_path = os.path.join(OUTPUT_DIRS["heatmaps"], f"{investigation_id}_heatmap.html")
         generate_confidence_heatmap(mock_result, heatmap_output_path)
-        logger.info(f"Confidence heatmap saved to {heatmap_output_path}")
+        logger.info("Confidence heatmap saved to %s", heatmap_output_path)
         
         # Create index file to link all visualizations
         index_path = os.path.join(OUTPUT_DIRS["visualizations"], "index.html")
@@ -296,7 +305,7 @@ def print_mock_investigation():
 </body>
 </html>
 """)
-        logger.info(f"Visualization index saved to {index_path}")
+        logger.info("Visualization index saved to %s", index_path)
         
         # Clean up any files in the root directory if they exist
         root_files = [
@@ -307,7 +316,7 @@ def print_mock_investigation():
         
         for file_path in root_files:
             if os.path.exists(file_path):
-                logger.info(f"Moving {file_path} to organized directory structure")
+                logger.info("Moving %s to organized directory structure", file_path)
                 if file_path.endswith(".json"):
                     shutil.move(file_path, os.path.join(OUTPUT_DIRS["investigations"], f"{investigation_id}.json"))
                 elif "graph" in file_path:
@@ -316,7 +325,7 @@ def print_mock_investigation():
                     shutil.move(file_path, os.path.join(OUTPUT_DIRS["heatmaps"], f"{investigation_id}_heatmap.html"))
         
     except Exception as e:
-        logger.error(f"Error generating visualizations: {e}")
+        logger.error("Error generating visualizations: %s", e)
     
     # Print summary to console
     print("\n=== Investigation Summary ===")
@@ -118,7 +118,7 @@ def create_k8s_rca_workflow() -> StateGraph:
             from_agent="network",
             to_agent="master",
             message=f"Completed network analysis with {evidence_count} evidence items ({int(confidence*100)}% confidence)",
-            data={"findings_keys": list(findings.keys())}
+            data={"findings_keys": tuple(findings)}
         )
         
         # Save a snapshot of interactions
@@ -147,7 +147,7 @@ def create_k8s_rca_workflow() -> StateGraph:
             from_agent="metrics",
             to_agent="master",
             message=f"Completed metrics analysis with {evidence_count} evidence items ({int(confidence*100)}% confidence)",
-            data={"findings_keys": list(findings.keys())}
+            data={"findings_keys": tuple(findings)}
         )
         
         # Save a snapshot of interactions
@@ -176,7 +176,7 @@ def create_k8s_rca_workflow() -> StateGraph:
             from_agent="cluster",
             to_agent="master",
             message=f"Completed cluster analysis with {evidence_count} evidence items ({int(confidence*100)}% confidence)",
-            data={"findings_keys": list(findings.keys())}
+            data={"findings_keys": tuple(findings)}
         )
         
         # Save a snapshot of interactions
@@ -266,7 +266,7 @@ def create_k8s_rca_workflow() -> StateGraph:
             action="routing",
             details=f"Routing to specialist agent(s): {nodes_to_activate}"
         )
-        logger.info(f"Routing to specialist agent(s): {nodes_to_activate}")
+        logger.info("Routing to specialist agent(s): %s", nodes_to_activate)
         
         # If only one node, return it as string, otherwise as list
         if len(nodes_to_activate) == 1:
@@ -333,7 +333,7 @@ def run_investigation(symptoms: str) -> Dict[str, Any]:
     }
     
     # Run the investigation
-    logger.info(f"Starting investigation with symptoms: {symptoms}")
+    logger.info("Starting investigation with symptoms: %s", symptoms)
     result = k8s_rca_app.invoke(initial_state)
     
     # Log completion and save final interactions
@@ -1,24 +1,16 @@
+from __future__ import annotations
+
 import sys
 import argparse
 import logging
 import os
+from dataclasses import asdict, is_dataclass
+from typing import TYPE_CHECKING
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 from .core.config import LOG_FORMAT, LOG_FILE
-from .core.analyzer import EnhancedClusterAnalyzer, AnalysisResult
-from .react.exceptions import ReActAbortError
-import json
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE)
-    ]
-)
+if TYPE_CHECKING:
+    from .core.analyzer import AnalysisResult
 
 console = Console()
 
@@ -38,28 +30,37 @@ def main():
     args = parser.parse_args()
     
     # Ensure log directory exists
-    if not os.path.exists(args.log_dir):
-        os.makedirs(args.log_dir)
+    os.makedirs(args.log_dir, exist_ok=True)
+    
+    # Configure logging only once we know the requested level and format;
+    # stderr is left clean in JSON mode so output can be piped to tooling
+    handlers = [logging.FileHandler(os.path.join(args.log_dir, os.path.basename(LOG_FILE)))]
+    if args.format != 'json':
+        handlers.append(logging.StreamHandler(sys.stderr))
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format=LOG_FORMAT,
+        handlers=handlers,
+        force=True
+    )
+    
+    # Heavy imports are deferred until argparse has succeeded so that --help
+    # and usage errors do not pay for loading the analyzer/LLM stack
+    from .core.analyzer import EnhancedClusterAnalyzer
+    from .react.exceptions import ReActAbortError
     
     try:
-        if len(sys.argv) == 1 or not args.question:
+        # Build the analyzer (and its LLM client) exactly once for either mode
+        analyzer = EnhancedClusterAnalyzer(
+            llm_provider=os.getenv("LLM_PROVIDER"),
+            llm_model=os.getenv("LLM_MODEL")
+        )
+        
+        if not args.question:
             # No question provided, run in interactive mode
-            try:
-                analyzer = EnhancedClusterAnalyzer(
-                    llm_provider=os.getenv("LLM_PROVIDER", None),
-                    llm_model=os.getenv("LLM_MODEL", None)
-                )
-                analyzer.run_interactive_mode()
-            except Exception as e:
-                console.print(f"\n[bold red]Fatal error: {str(e)}[/bold red]")
-                return 1
+            analyzer.run_interactive_mode()
         else:
             # Question provided, run in analysis mode
-            analyzer = EnhancedClusterAnalyzer(
-                llm_provider=os.getenv("LLM_PROVIDER", None),
-                llm_model=os.getenv("LLM_MODEL", None)
-            )
-            
             try:
                 console.print("\n[bold blue]Analyzing question...[/bold blue]")
                 context = {
@@ -79,34 +80,30 @@ def main():
                             console.print(f"Error: {result.error}")
                     # If using JSON format, output JSON
                     elif args.format == 'json':
-                        try:
-                            result_dict = {
-                                "success": result.success,
-                                "answer": result.answer,
-                                "error": result.error,
-                                "pressure_points": [p.to_dict() for p in result.pressure_points] if result.pressure_points else [],
-                                "critical_points": [p.to_dict() for p in result.critical_points] if result.critical_points else [],
-                                "metadata": result.metadata,
-                                "context": result.context,
-                                "interactions": result.interactions
-                            }
-                            console.print(json.dumps(result_dict, indent=2))
-                        except TypeError as e:
-                            console.print(json.dumps({"success": False, "error": f"Result serialization failed: {e}"}, indent=2))
+                        import json
+                        # Stream straight to stdout: no intermediate string and
+                        # no Rich markup pass over machine-readable output
+                        result_dict = {
+                            "success": result.success,
+                            "answer": result.answer,
+                            "error": result.error,
+                            "pressure_points": result.pressure_points,
+                            "critical_points": result.critical_points,
+                            "metadata": result.metadata,
+                            "context": result.context,
+                            "interactions": result.interactions
+                        }
+                        json.dump(result_dict, sys.stdout, indent=2, default=_json_default)
+                        sys.stdout.write('\n')
+                        sys.stdout.flush()
                     # Otherwise use the full rich display
                     else:
                         display_analysis_result(result, console)
                     
-                    # Print location of execution log if it exists
-                    if hasattr(result, 'metadata') and result.metadata.get('log_file'):
-                        console.print(f"\n[bold cyan]Detailed execution log saved to: {result.metadata['log_file']}[/bold cyan]")
-                    else:
-                        # Try to find the log file based on session ID if possible
-                        session_id = result.metadata.get('session_id')
-                        if session_id:
-                            log_file_path = os.path.join(args.log_dir, f"react_execution_{session_id}.log")
-                            if os.path.exists(log_file_path):
-                                console.print(f"\n[bold cyan]Detailed execution log saved to: {log_file_path}[/bold cyan]")
+                    # Print location of execution log if the analyzer wrote one
+                    log_file = (result.metadata or {}).get('log_file')
+                    if log_file:
+                        console.print(f"\n[bold cyan]Detailed execution log saved to: {log_file}[/bold cyan]")
                     
                     return 0
             except ReActAbortError:
@@ -119,8 +116,18 @@ def main():
     
     return 0
 
+def _json_default(obj):
+    """Serialize result objects (PressurePoint, ToolResult, ...) for JSON output."""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
 def display_analysis_result(result: AnalysisResult, console: Console):
     """Display the AnalysisResult object using Rich components."""
+    from rich.panel import Panel
+    
     console.print("\n[bold green]--- Analysis Result ---[/bold green]")
 
     if result.success:
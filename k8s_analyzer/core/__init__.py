@@ -1,17 +1,21 @@
 """
 Core module for the Kubernetes Analyzer.
+
+Names are resolved lazily (PEP 562) so that importing a lightweight
+submodule such as ``core.config`` or ``core.exceptions`` does not pull in
+the analyzer and its LLM/tool dependencies.
 """
 
-from .analyzer import (
-    EnhancedClusterAnalyzer,
-    AnalysisResult,
-    PressurePoint,
-)
+import importlib
 
-from .exceptions import (
-    LLMConfigError,
-    AnalyzerError
-)
+# Maps each public name to the submodule that defines it
+_LAZY_ATTRS = {
+    'EnhancedClusterAnalyzer': '.analyzer',
+    'AnalysisResult': '.analyzer',
+    'PressurePoint': '.analyzer',
+    'LLMConfigError': '.exceptions',
+    'AnalyzerError': '.exceptions',
+}
 
 __all__ = [
     'EnhancedClusterAnalyzer',
@@ -20,3 +24,15 @@ __all__ = [
     'LLMConfigError',
     'AnalyzerError'
 ]
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache so subsequent lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
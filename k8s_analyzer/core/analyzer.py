@@ -1,29 +1,101 @@
+import asyncio
 import logging
+import sys
 import json
-import subprocess
-from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass
-from datetime import datetime
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt
+from typing import Callable, Dict, Any, Optional, List, Union
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from ..llm.openai import OpenAILLM
 from ..llm.gemini import GeminiLLM
 from ..react.agent import ReActAgent
-from ..tools.kubectl import KubectlTool
+from ..tools.config import KUBECTL_CONTEXT
+from ..tools.kubectl import KubectlTool, _shared_api_client
+from ..tools.result import ToolResult
 from .config import LLM_PROVIDER, LLM_MODEL
-from .exceptions import LLMConfigError, AnalyzerError
-from ..tools import ToolRegistry, BaseTool, ToolRegistryError
+from .exceptions import LLMConfigError, AnalyzerError, ToolExecutionError
+from ..tools import ToolRegistry, BaseTool, ToolError, ToolRegistryError
 # Import the new concrete tools
-from ..tools.health_tools import CheckNodeStatusTool, CheckClusterEventsTool
+from ..tools.health_tools import CheckNodeStatusTool, CheckClusterEventsTool, HealthSnapshotTool
 from ..tools.workload_tools import CheckPodStatusTool
 # (Add imports for other concrete tools as they are created)
 
-console = Console()
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
 
-@dataclass
+# Rich is only needed for interactive display, so the console is created on first use
+_console = None
+
+def _get_console():
+    """Get the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+# LOG_FORMAT never prints thread or process fields, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+
+# Quantity suffix multipliers: CPU is normalized to millicores, memory to bytes
+_CPU_SUFFIXES = {'n': 1e-6, 'u': 1e-3, 'm': 1.0}
+_MEMORY_SUFFIXES = {
+    'Ki': 1024.0, 'Mi': 1024.0 ** 2, 'Gi': 1024.0 ** 3, 'Ti': 1024.0 ** 4,
+    'k': 1e3, 'M': 1e6, 'G': 1e9, 'T': 1e12,
+}
+
+# Clusters report a small set of distinct quantity strings ('100m', '128Mi', ...)
+# across many pods, so parsed values are memoized rather than re-parsed per pod
+@lru_cache(maxsize=4096)
+def _parse_cpu_quantity(cpu_str: str) -> float:
+    """Parse a CPU quantity (e.g. '200m', '1', '250000n') to millicores."""
+    try:
+        multiplier = _CPU_SUFFIXES.get(cpu_str[-1:])
+        if multiplier is not None:
+            return float(cpu_str[:-1]) * multiplier
+        return float(cpu_str) * 1000
+    except (ValueError, TypeError):
+        return 0
+
+@lru_cache(maxsize=4096)
+def _parse_memory_quantity(mem_str: str) -> float:
+    """Parse a memory quantity (e.g. '100Mi', '1G', '1048576') to bytes."""
+    try:
+        multiplier = _MEMORY_SUFFIXES.get(mem_str[-2:])
+        if multiplier is not None:
+            return float(mem_str[:-2]) * multiplier
+        multiplier = _MEMORY_SUFFIXES.get(mem_str[-1:])
+        if multiplier is not None:
+            return float(mem_str[:-1]) * multiplier
+        return float(mem_str)
+    except (ValueError, TypeError):
+        return 0
+
+# Usage above this fraction of the limit is reported as a pressure point
+PRESSURE_THRESHOLD_RATIO = 0.8
+
+# slots=True needs Python 3.10+; on 3.9 the dataclasses keep their __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _dumps_indented(value: Any) -> str:
+    """Pretty-print a value as 2-space indented JSON, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles these
+    return json.dumps(value, indent=2)
+
+# Metrics checked for pressure, with the parser for their quantity strings
+_PRESSURE_METRICS = (
+    ('cpu', _parse_cpu_quantity),
+    ('memory', _parse_memory_quantity),
+)
+
+@dataclass(**_DATACLASS_SLOTS)
 class PressurePoint:
     """Represents a resource pressure point in the cluster."""
     resource_name: str
@@ -33,6 +105,12 @@ class PressurePoint:
     threshold: float
     severity: str
     
+    def __post_init__(self):
+        # These come from a handful of distinct values, so share one object each
+        self.resource_type = sys.intern(self.resource_type)
+        self.metric_name = sys.intern(self.metric_name)
+        self.severity = sys.intern(self.severity)
+    
     @property
     def pressure_ratio(self) -> float:
         """Calculate the pressure ratio."""
@@ -42,29 +120,19 @@ class PressurePoint:
         return f"{self.resource_name} ({self.resource_type}) - {self.metric_name}: {self.current_value}/{self.threshold} ({self.severity})"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AnalysisResult:
     """Results of a cluster analysis."""
     success: bool = True
     answer: str = ""
     error: str = ""
-    pressure_points: List[PressurePoint] = None
-    critical_points: List[str] = None
-    metadata: Dict[str, Any] = None
-    context: Dict[str, Any] = None
-    interactions: List[Dict[str, Any]] = None
-    
-    def __post_init__(self):
-        if self.pressure_points is None:
-            self.pressure_points = []
-        if self.critical_points is None:
-            self.critical_points = []
-        if self.metadata is None:
-            self.metadata = {}
-        if self.context is None:
-            self.context = {}
-        if self.interactions is None:
-            self.interactions = []
+    pressure_points: List[PressurePoint] = field(default_factory=list)
+    critical_points: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    context: Dict[str, Any] = field(default_factory=dict)
+    interactions: List[Dict[str, Any]] = field(default_factory=list)
+    # Pretty-printed JSON of dict/list metadata values, filled on first display
+    _metadata_json: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
 
 class EnhancedClusterAnalyzer:
@@ -106,29 +174,18 @@ class EnhancedClusterAnalyzer:
             # Register the tool classes with the new registry
             self.logger.info("Registering default tools with new agent registry...")
             successfully_registered_names = []
-            # --- Use the UPDATED DEFAULT_TOOL_CLASSES --- 
-            for name, tool_class in DEFAULT_TOOL_CLASSES.items():
+            # Classes were validated at import time (see _VALIDATED_DEFAULT_TOOLS)
+            for name, tool_class in _VALIDATED_DEFAULT_TOOLS:
                 try:
-                    # Pre-check inheritance
-                    if not issubclass(tool_class, BaseTool):
-                         raise TypeError(f"Tool class {tool_class.__name__} must inherit from BaseTool")
-                         
-                    # Attempt registration
                     tool_registry.register_tool(name=name, tool_class=tool_class)
-                    self.logger.debug(f"Successfully registered tool: {name}")
+                    self.logger.debug("Successfully registered tool: %s", name)
                     successfully_registered_names.append(name)
-                except TypeError as e:
-                     # Catch inheritance errors specifically
-                     self.logger.error(f"Registration Error for '{name}': {e}")
                 except ToolRegistryError as e:
                      # Catch specific registry errors (like already registered)
-                     self.logger.warning(f"Skipping registration for '{name}': {e}")
+                     self.logger.warning("Skipping registration for '%s': %s", name, e)
                      # If it was already registered, consider it successful for logging purposes
                      if "already registered" in str(e):
                           successfully_registered_names.append(name)
-                except Exception as e:
-                     # Catch any other unexpected errors during registration/init
-                     self.logger.error(f"Failed to register/initialize tool '{name}': {e}", exc_info=True)
 
             # Initialize the agent with the populated registry
             self.agent = ReActAgent(
@@ -136,11 +193,32 @@ class EnhancedClusterAnalyzer:
                  tools=tool_registry # Pass the populated registry
             )
 
-        # Update logging for clarity using the tracked names
-        if successfully_registered_names:
-             self.logger.info(f"Analyzer agent configured with tools: {successfully_registered_names}")
-        else:
-             self.logger.warning("Agent initialized, but no tools were successfully registered.")
+            # Update logging for clarity using the tracked names
+            if successfully_registered_names:
+                 self.logger.info("Analyzer agent configured with tools: %s", successfully_registered_names)
+            else:
+                 self.logger.warning("Agent initialized, but no tools were successfully registered.")
+
+        # Resolve the agent's entry points once rather than probing on every question
+        self._reset = (
+            getattr(self.agent, 'reset_state', None)
+            or getattr(self.agent, 'reset', None)
+            or (lambda: None)
+        )
+        self._analyze_call = self._resolve_analyze_call(self.agent)
+
+        # Index tools by name once so hot paths don't rescan the list
+        self.tools = list(tools or [])
+        self._tools_by_name = {getattr(tool, 'name', ''): tool for tool in self.tools}
+        self._kubectl = self._tools_by_name.get('kubectl')
+        
+        # Typed Kubernetes API clients are created lazily on first use and
+        # shared for the lifetime of the analyzer (see _get_k8s_apis)
+        self._k8s_apis_loaded = False
+        self._api_client = None
+        self._k8s = None
+        self._apps = None
+        self._metrics = None
 
         self.logger.info("Initialization complete")
     
@@ -156,7 +234,7 @@ class EnhancedClusterAnalyzer:
         Returns:
             AnalysisResult containing the analysis
         """
-        self.logger.info(f"Analyzing question: {question}")
+        self.logger.info("Analyzing question: %s", question)
         
         if not question:
             return AnalysisResult(
@@ -165,45 +243,32 @@ class EnhancedClusterAnalyzer:
             )
         
         try:
-            # Reset agent if it's a React agent
-            if hasattr(self.agent, 'reset_state'):
-                self.agent.reset_state()
-            elif hasattr(self.agent, 'reset'):
-                self.agent.reset()
+            # Reset agent state between questions
+            self._reset()
             
             # Handle context information
             analysis_context = context or {}
             
-            # Prepare arguments for the agent call, including log_dir
-            call_args = {
-                "question": question,
-                "context": analysis_context,
-                "log_dir": log_dir # Pass log_dir here
-            }
-            
-            # Use agent's analyze method or analyze_question based on what's available
-            if hasattr(self.agent, 'analyze_question'): # Prefer analyze_question if available
-                 raw_result = self.agent.analyze_question(**call_args)
-            elif hasattr(self.agent, 'analyze'):
-                 # If analyze doesn't accept log_dir, remove it from call_args or adjust analyze
-                 # Assuming analyze_question is the target method based on previous work
-                 # If analyze is the only method, this might need adjustment
-                 # For now, assuming analyze_question exists and takes log_dir
-                 del call_args['log_dir'] # Example: Remove if analyze doesn't take it
-                 raw_result = self.agent.analyze(question, context=analysis_context)
-            else:
+            if self._analyze_call is None:
                 return AnalysisResult(
                     success=False,
                     error="Agent doesn't have analyze or analyze_question method"
                 )
+            raw_result = self._analyze_call(question, analysis_context, log_dir)
             
             # Convert raw result to AnalysisResult
             if isinstance(raw_result, dict):
+                metadata = dict(raw_result.get('metadata') or {})
+                # Record where the agent wrote its execution log so callers
+                # never have to reconstruct or probe for the path
+                log_file = getattr(self.agent, 'log_file', None)
+                if log_file:
+                    metadata['log_file'] = log_file
                 return AnalysisResult(
                     success=raw_result.get('success', True),
                     answer=raw_result.get('answer', ''),
                     error=raw_result.get('error', ''),
-                    metadata=raw_result.get('metadata', {}),
+                    metadata=metadata,
                     context=analysis_context
                 )
             elif isinstance(raw_result, AnalysisResult):
@@ -215,13 +280,176 @@ class EnhancedClusterAnalyzer:
                     context=analysis_context
                 )
         except Exception as e:
-            self.logger.error(f"Error during question analysis: {str(e)}", exc_info=True)
+            self.logger.error("Error during question analysis: %s", e, exc_info=True)
             return AnalysisResult(
                 success=False,
                 error=f"Analysis failed: {str(e)}",
-                context=context
+                context=context or {}
+            )
+    
+    @staticmethod
+    def _resolve_analyze_call(agent) -> Optional[Callable[[str, Dict[str, Any], str], Any]]:
+        """
+        Pick the agent method used to answer questions.
+        
+        Returns:
+            A callable taking (question, context, log_dir), or None if the agent
+            has neither analyze_question nor analyze
+        """
+        # Prefer analyze_question, which also takes the log directory
+        analyze_question = getattr(agent, 'analyze_question', None)
+        if analyze_question is not None:
+            return lambda question, context, log_dir: analyze_question(
+                question=question, context=context, log_dir=log_dir
             )
+        analyze = getattr(agent, 'analyze', None)
+        if analyze is not None:
+            return lambda question, context, log_dir: analyze(question, context=context)
+        return None
     
+    def _get_kubectl_tool(self) -> Optional[BaseTool]:
+        """
+        Resolve the kubectl tool once and reuse it.
+        
+        Explicitly passed tools take precedence; otherwise the tool is taken
+        from the agent's ToolRegistry on first use.
+        """
+        if self._kubectl is None:
+            registry = getattr(self.agent, 'tools', None)
+            if isinstance(registry, ToolRegistry):
+                try:
+                    self._kubectl = registry.get_tool('kubectl')
+                except ToolError as e:
+                    self.logger.warning("Kubectl tool unavailable from agent registry: %s", e)
+        return self._kubectl
+    
+    def _get_k8s_apis(self) -> bool:
+        """
+        Create the typed Kubernetes API clients once per analyzer instance.
+
+        The APIs use the process-wide pooled ApiClient for KUBECTL_CONTEXT,
+        the same cluster and client as the kubectl tools, so every call
+        reuses the same keep-alive connections instead of forking kubectl.
+
+        Returns:
+            True if the API clients are available, False to fall back to kubectl
+        """
+        if self._k8s_apis_loaded:
+            return self._k8s is not None
+        self._k8s_apis_loaded = True
+
+        # A kubectl tool passed in through tools= is the caller's chosen way to reach the cluster
+        if 'kubectl' in self._tools_by_name:
+            return False
+        api_client = _shared_api_client(KUBECTL_CONTEXT or None, self.logger)
+        if api_client is None:
+            return False
+
+        from kubernetes import client
+        self._api_client = api_client
+        self._k8s = client.CoreV1Api(api_client)
+        self._apps = client.AppsV1Api(api_client)
+        self._metrics = client.CustomObjectsApi(api_client)
+        return True
+
+    def _list_resource_via_api(self, resource_type: str) -> Optional[Dict[str, Any]]:
+        """
+        List a resource type across all namespaces through the typed API.
+
+        Args:
+            resource_type: The resource type to list (pods, nodes, services, etc.)
+
+        Returns:
+            The list in kubectl's `-o json` shape, or None if the type has no
+            typed API mapping or the API client is unavailable
+        """
+        if not self._get_k8s_apis():
+            return None
+
+        list_calls = {
+            "pods": self._k8s.list_pod_for_all_namespaces,
+            "nodes": self._k8s.list_node,
+            "services": self._k8s.list_service_for_all_namespaces,
+            "events": self._k8s.list_event_for_all_namespaces,
+            "namespaces": self._k8s.list_namespace,
+            "persistentvolumes": self._k8s.list_persistent_volume,
+            "persistentvolumeclaims": self._k8s.list_persistent_volume_claim_for_all_namespaces,
+            "deployments": self._apps.list_deployment_for_all_namespaces,
+            "statefulsets": self._apps.list_stateful_set_for_all_namespaces,
+            "daemonsets": self._apps.list_daemon_set_for_all_namespaces,
+            "replicasets": self._apps.list_replica_set_for_all_namespaces,
+        }
+        list_call = list_calls.get(resource_type.lower())
+        if list_call is None:
+            return None
+        return self._api_client.sanitize_for_serialization(list_call())
+
+    def _fetch_pod_metrics_via_api(self) -> Optional[Dict[str, Any]]:
+        """
+        Fetch pod usage from metrics.k8s.io joined with container limits.
+
+        Usage and limits are returned as numbers (millicores / bytes) rather
+        than quantity strings, so they are not parsed a second time.
+
+        Returns:
+            Dict with an 'items' list of {'metadata', 'usage', 'limits'} entries
+            (the shape analyze_pressure_points consumes), or None if the API
+            client is unavailable
+        """
+        if not self._get_k8s_apis():
+            return None
+
+        pod_metrics = self._metrics.list_cluster_custom_object("metrics.k8s.io", "v1beta1", "pods")
+        # Only running pods report usage; resource_version="0" is served from
+        # the API server's watch cache instead of a quorum read from etcd
+        pods = self._k8s.list_pod_for_all_namespaces(
+            field_selector="status.phase=Running",
+            resource_version="0",
+            resource_version_match="NotOlderThan"
+        )
+
+        # Sum container limits per pod (millicores / bytes). Usage covers every
+        # container, so a pod has a limit only if all of its containers set one
+        limits_by_pod = {}
+        for pod in pods.items:
+            cpu_limit: Optional[float] = 0.0
+            mem_limit: Optional[float] = 0.0
+            for container in pod.spec.containers or []:
+                limits = (container.resources and container.resources.limits) or {}
+                if cpu_limit is not None:
+                    cpu_limit = cpu_limit + self._parse_cpu_value(limits['cpu']) if 'cpu' in limits else None
+                if mem_limit is not None:
+                    mem_limit = mem_limit + self._parse_memory_value(limits['memory']) if 'memory' in limits else None
+            limits_by_pod[(pod.metadata.namespace, pod.metadata.name)] = (cpu_limit, mem_limit)
+
+        # Live usage readings are almost all distinct, so they bypass the parse memo
+        parse_cpu = _parse_cpu_quantity.__wrapped__
+        parse_memory = _parse_memory_quantity.__wrapped__
+        items = []
+        for pod in pod_metrics.get('items', []):
+            metadata = pod.get('metadata', {})
+            cpu_usage = 0.0
+            mem_usage = 0.0
+            for container in pod.get('containers', []):
+                usage = container.get('usage', {})
+                cpu_usage += parse_cpu(usage.get('cpu', '0'))
+                mem_usage += parse_memory(usage.get('memory', '0'))
+
+            item = {
+                'metadata': metadata,
+                'usage': {'cpu': cpu_usage, 'memory': mem_usage},
+                'limits': {}
+            }
+            cpu_limit, mem_limit = limits_by_pod.get((metadata.get('namespace'), metadata.get('name')), (None, None))
+            # Only report limits that are actually set on the whole pod
+            if cpu_limit:
+                item['limits']['cpu'] = cpu_limit
+            if mem_limit:
+                item['limits']['memory'] = mem_limit
+            items.append(item)
+
+        return {'items': items}
+
     def analyze_pressure_points(self) -> AnalysisResult:
         """
         Analyze resource pressure points in the cluster.
@@ -232,67 +460,66 @@ class EnhancedClusterAnalyzer:
         self.logger.info("Analyzing cluster pressure points")
         
         try:
-            # Get kubectl tool
-            kubectl_tool = None
-            for tool in self.tools:
-                if getattr(tool, 'name', '') == 'kubectl':
-                    kubectl_tool = tool
-                    break
-            
-            if not kubectl_tool:
-                return AnalysisResult(
-                    success=False,
-                    error="Kubectl tool not found in analyzer tools"
-                )
+            # Prefer the metrics API over forking kubectl
+            metrics_result = self._fetch_pod_metrics_via_api()
             
-            # Get pod metrics
-            metrics_result = kubectl_tool.execute(command="top", resource="pods", all_namespaces=True)
+            if metrics_result is not None:
+                pods = metrics_result['items']
+            else:
+                kubectl_tool = self._get_kubectl_tool()
+                
+                if not kubectl_tool:
+                    return AnalysisResult(
+                        success=False,
+                        error="Kubectl tool not found in analyzer tools"
+                    )
+                
+                # Get pod metrics, streamed item by item when the tool supports it
+                if hasattr(kubectl_tool, 'stream_items'):
+                    pods = kubectl_tool.stream_items(command="top", resource="pods", all_namespaces=True)
+                else:
+                    metrics_result = kubectl_tool.execute(command="top", resource="pods", all_namespaces=True)
+                    if isinstance(metrics_result, ToolResult):
+                        if not metrics_result.success:
+                            raise ToolExecutionError(metrics_result.error or "kubectl top failed")
+                        metrics_result = metrics_result.data
+                    pods = (metrics_result or {}).get('items', [])
             
             pressure_points = []
             
-            # Process the metrics data
-            if 'items' in metrics_result:
-                for pod in metrics_result['items']:
-                    metadata = pod.get('metadata', {})
-                    usage = pod.get('usage', {})
-                    limits = pod.get('limits', {})
-                    
-                    # Check CPU pressure
-                    if 'cpu' in usage and 'cpu' in limits:
-                        cpu_usage = self._parse_cpu_value(usage['cpu'])
-                        cpu_limit = self._parse_cpu_value(limits['cpu'])
-                        
-                        if cpu_usage > 0.8 * cpu_limit:
-                            pressure_points.append(PressurePoint(
-                                resource_name=metadata.get('name', 'unknown'),
-                                resource_type='Pod',
-                                metric_name='cpu',
-                                current_value=cpu_usage,
-                                threshold=cpu_limit,
-                                severity='warning' if cpu_usage < cpu_limit else 'critical'
-                            ))
+            # Process the metrics data: one pass per pod over the metric table,
+            # with a PressurePoint allocated only for pods over the threshold
+            for pod in pods:
+                usage = pod.get('usage', {})
+                limits = pod.get('limits', {})
+                
+                for metric_name, parse in _PRESSURE_METRICS:
+                    if metric_name not in usage or metric_name not in limits:
+                        continue
+                    current = usage[metric_name]
+                    limit = limits[metric_name]
+                    # The metrics API path already yields numbers; kubectl yields quantity strings
+                    if isinstance(current, str):
+                        current = parse(current)
+                    if isinstance(limit, str):
+                        limit = parse(limit)
                     
-                    # Check Memory pressure
-                    if 'memory' in usage and 'memory' in limits:
-                        mem_usage = self._parse_memory_value(usage['memory'])
-                        mem_limit = self._parse_memory_value(limits['memory'])
-                        
-                        if mem_usage > 0.8 * mem_limit:
-                            pressure_points.append(PressurePoint(
-                                resource_name=metadata.get('name', 'unknown'),
-                                resource_type='Pod',
-                                metric_name='memory',
-                                current_value=mem_usage,
-                                threshold=mem_limit,
-                                severity='warning' if mem_usage < mem_limit else 'critical'
-                            ))
+                    if current > PRESSURE_THRESHOLD_RATIO * limit:
+                        pressure_points.append(PressurePoint(
+                            resource_name=pod.get('metadata', {}).get('name', 'unknown'),
+                            resource_type='Pod',
+                            metric_name=metric_name,
+                            current_value=current,
+                            threshold=limit,
+                            severity='warning' if current < limit else 'critical'
+                        ))
             
             return AnalysisResult(
                 success=True,
                 pressure_points=pressure_points
             )
         except Exception as e:
-            self.logger.error(f"Error during pressure point analysis: {str(e)}", exc_info=True)
+            self.logger.error("Error during pressure point analysis: %s", e, exc_info=True)
             return AnalysisResult(
                 success=False,
                 error=f"Pressure point analysis failed: {str(e)}"
@@ -300,28 +527,11 @@ class EnhancedClusterAnalyzer:
     
     def _parse_cpu_value(self, cpu_str: str) -> float:
         """Parse CPU value from a string (e.g., '200m') to a float."""
-        try:
-            if cpu_str.endswith('m'):
-                return float(cpu_str[:-1])
-            else:
-                return float(cpu_str) * 1000
-        except (ValueError, TypeError):
-            return 0
+        return _parse_cpu_quantity(cpu_str)
     
     def _parse_memory_value(self, mem_str: str) -> float:
         """Parse memory value from a string (e.g., '100Mi') to a float."""
-        try:
-            # Remove the unit suffix
-            if mem_str.endswith('Ki'):
-                return float(mem_str[:-2]) * 1024
-            elif mem_str.endswith('Mi'):
-                return float(mem_str[:-2]) * 1024 * 1024
-            elif mem_str.endswith('Gi'):
-                return float(mem_str[:-2]) * 1024 * 1024 * 1024
-            else:
-                return float(mem_str)
-        except (ValueError, TypeError):
-            return 0
+        return _parse_memory_quantity(mem_str)
     
     def run_interactive_mode(self) -> AnalysisResult:
         """
@@ -330,11 +540,39 @@ class EnhancedClusterAnalyzer:
         Returns:
             AnalysisResult containing the interactions
         """
+        console = _get_console()
+        try:
+            return asyncio.run(self.run_interactive_mode_async())
+        except KeyboardInterrupt:
+            console.print("\n[bold yellow]Exiting...[/bold yellow]")
+            return AnalysisResult(success=True)
+    
+    async def run_interactive_mode_async(self) -> AnalysisResult:
+        """
+        Run the interactive loop on an asyncio event loop.
+        
+        Input is read with prompt_toolkit's prompt_async when available so the
+        loop never blocks on keystrokes; analyses run in a worker thread.
+        
+        Returns:
+            AnalysisResult containing the interactions
+        """
+        console = _get_console()
         self.logger.info("Starting interactive mode")
         console.print("\n[bold blue]Enhanced Kubernetes Cluster Analyzer (ReAct Mode)[/bold blue]")
         console.print("=" * 60)
         console.print("Type 'exit' or 'quit' to end the session\n")
         
+        try:
+            from prompt_toolkit import PromptSession
+            session = PromptSession()
+            
+            async def read_question() -> str:
+                return await session.prompt_async("Ask about your cluster: > ")
+        except ImportError:
+            async def read_question() -> str:
+                return await asyncio.to_thread(console.input, "[bold green]Ask about your cluster: > [/bold green]")
+        
         interactions = []
         success = True
         error = ""
@@ -342,7 +580,7 @@ class EnhancedClusterAnalyzer:
         try:
             while True:
                 try:
-                    question = input("[bold green]Ask about your cluster: > [/bold green]").strip()
+                    question = (await read_question()).strip()
                     if question.lower() in ['exit', 'quit']:
                         console.print("\n[bold yellow]Exiting...[/bold yellow]")
                         break
@@ -350,7 +588,7 @@ class EnhancedClusterAnalyzer:
                         continue
                     
                     console.print("\n[bold blue]Starting ReAct analysis loop...[/bold blue]")
-                    result = self.analyze_question(question)
+                    result = await self.a_analyze_question(question)
                     
                     interactions.append({
                         "question": question,
@@ -362,11 +600,11 @@ class EnhancedClusterAnalyzer:
                     else:
                         self._display_result(result)
                         
-                except KeyboardInterrupt:
+                except (KeyboardInterrupt, EOFError):
                     console.print("\n[bold yellow]Exiting...[/bold yellow]")
                     break
                 except Exception as e:
-                    self.logger.error(f"Unhandled exception in interactive mode: {e}", exc_info=True)
+                    self.logger.error("Unhandled exception in interactive mode: %s", e, exc_info=True)
                     console.print(f"\n[bold red]An unexpected error occurred: {str(e)}[/bold red]")
                     error = str(e)
                     success = False
@@ -377,7 +615,7 @@ class EnhancedClusterAnalyzer:
                 interactions=interactions
             )
         except Exception as e:
-            self.logger.error(f"Error in interactive mode: {str(e)}", exc_info=True)
+            self.logger.error("Error in interactive mode: %s", e, exc_info=True)
             return AnalysisResult(
                 success=False,
                 error=f"Interactive mode failed: {str(e)}",
@@ -394,36 +632,113 @@ class EnhancedClusterAnalyzer:
         Returns:
             AnalysisResult containing the analysis
         """
-        self.logger.info(f"Analyzing resource type: {resource_type}")
+        return self.analyze_resources([resource_type])[resource_type]
+    
+    def analyze_resources(self, resource_types: List[str]) -> Dict[str, AnalysisResult]:
+        """
+        Analyze several resource types with as few cluster round-trips as possible.
         
-        try:
-            # Get kubectl tool
-            kubectl_tool = None
-            for tool in self.tools:
-                if getattr(tool, 'name', '') == 'kubectl':
-                    kubectl_tool = tool
-                    break
+        Types with a typed API mapping are listed through the shared API client;
+        the rest are fetched with one batched `kubectl get a,b,c` call and split
+        back out by kind.
+        
+        Args:
+            resource_types: The resource types to analyze (pods, nodes, services, etc.)
             
-            if not kubectl_tool:
-                return AnalysisResult(
+        Returns:
+            Dict mapping each resource type to its AnalysisResult
+        """
+        self.logger.info("Analyzing resource types: %s", resource_types)
+        
+        results: Dict[str, AnalysisResult] = {}
+        kubectl_types: List[str] = []
+        
+        for resource_type in resource_types:
+            try:
+                # Prefer the typed API; kubectl covers types without a mapping
+                resources = self._list_resource_via_api(resource_type)
+            except Exception as e:
+                self.logger.error("Error analyzing resource type %s: %s", resource_type, e, exc_info=True)
+                results[resource_type] = AnalysisResult(
                     success=False,
-                    error="Kubectl tool not found in analyzer tools"
+                    error=f"Resource analysis failed: {str(e)}"
+                )
+                continue
+            
+            if resources is None:
+                kubectl_types.append(resource_type)
+            else:
+                results[resource_type] = AnalysisResult(
+                    success=True,
+                    answer=f"Analysis of {resource_type} completed",
+                    metadata={"resources": resources}
                 )
+        
+        if kubectl_types:
+            results.update(self._analyze_resources_via_kubectl(kubectl_types))
+        
+        return results
+    
+    def _analyze_resources_via_kubectl(self, resource_types: List[str]) -> Dict[str, AnalysisResult]:
+        """Fetch all given resource types with a single kubectl call and demultiplex by kind."""
+        try:
+            kubectl_tool = self._get_kubectl_tool()
             
-            # Get the resources
-            resources = kubectl_tool.execute(command="get", resource=resource_type, all_namespaces=True)
+            if not kubectl_tool:
+                return {
+                    resource_type: AnalysisResult(
+                        success=False,
+                        error="Kubectl tool not found in analyzer tools"
+                    )
+                    for resource_type in resource_types
+                }
             
-            return AnalysisResult(
-                success=True,
-                answer=f"Analysis of {resource_type} completed",
-                metadata={"resources": resources}
-            )
+            # Get all the resources in one round-trip
+            resources = kubectl_tool.execute(command="get", resource=",".join(resource_types), all_namespaces=True)
+            
+            if isinstance(resources, ToolResult):
+                if not resources.success:
+                    raise ToolExecutionError(resources.error)
+                resources = resources.data
+            
+            if len(resource_types) == 1:
+                by_type = {resource_types[0]: resources}
+            else:
+                items = resources.get('items', []) if isinstance(resources, dict) else []
+                by_type = {
+                    resource_type: {"apiVersion": "v1", "kind": "List", "items": []}
+                    for resource_type in resource_types
+                }
+                for item in items:
+                    kind = str(item.get('kind', '')).lower()
+                    for resource_type in resource_types:
+                        if self._kind_matches(kind, resource_type):
+                            by_type[resource_type]["items"].append(item)
+                            break
+            
+            return {
+                resource_type: AnalysisResult(
+                    success=True,
+                    answer=f"Analysis of {resource_type} completed",
+                    metadata={"resources": by_type[resource_type]}
+                )
+                for resource_type in resource_types
+            }
         except Exception as e:
-            self.logger.error(f"Error analyzing resource type {resource_type}: {str(e)}", exc_info=True)
-            return AnalysisResult(
-                success=False,
-                error=f"Resource analysis failed: {str(e)}"
-            )
+            self.logger.error("Error analyzing resource types %s: %s", resource_types, e, exc_info=True)
+            return {
+                resource_type: AnalysisResult(
+                    success=False,
+                    error=f"Resource analysis failed: {str(e)}"
+                )
+                for resource_type in resource_types
+            }
+    
+    @staticmethod
+    def _kind_matches(kind: str, resource_type: str) -> bool:
+        """Check whether a lowercased object kind belongs to a kubectl resource type (e.g. 'pod' / 'pods')."""
+        resource_type = resource_type.lower()
+        return resource_type in (kind, kind + "s", kind + "es")
     
     def aggregate_results(self, results: List[AnalysisResult]) -> AnalysisResult:
         """
@@ -435,22 +750,25 @@ class EnhancedClusterAnalyzer:
         Returns:
             AnalysisResult containing the aggregated results
         """
-        self.logger.info(f"Aggregating {len(results)} analysis results")
+        self.logger.info("Aggregating %s analysis results", len(results))
         
         try:
             # Start with a success result
             aggregated = AnalysisResult(success=True)
+            # Collect text parts and join once instead of repeated concatenation
+            error_parts = []
+            answer_parts = []
             
             # Combine data from all results
             for result in results:
                 # If any result failed, the aggregated result is failed
                 if not result.success:
                     aggregated.success = False
-                    aggregated.error += f"{result.error}; "
+                    error_parts.append(result.error)
                 
                 # Combine answers
                 if result.answer:
-                    aggregated.answer += f"{result.answer}\n"
+                    answer_parts.append(result.answer)
                 
                 # Combine pressure points
                 aggregated.pressure_points.extend(result.pressure_points)
@@ -462,20 +780,80 @@ class EnhancedClusterAnalyzer:
                 if result.metadata:
                     aggregated.metadata.update(result.metadata)
             
-            # Clean up the combined error message
-            if aggregated.error:
-                aggregated.error = aggregated.error.rstrip("; ")
+            aggregated.error = "; ".join(part for part in error_parts if part)
+            aggregated.answer = "\n".join(answer_parts)
             
             return aggregated
         except Exception as e:
-            self.logger.error(f"Error aggregating results: {str(e)}", exc_info=True)
+            self.logger.error("Error aggregating results: %s", e, exc_info=True)
             return AnalysisResult(
                 success=False,
                 error=f"Results aggregation failed: {str(e)}"
             )
     
+    async def a_analyze_question(self, question: str, context: Optional[Dict[str, Any]] = None, log_dir: str = "logs") -> AnalysisResult:
+        """Async variant of analyze_question; the ReAct loop runs in a worker thread."""
+        return await asyncio.to_thread(self.analyze_question, question, context, log_dir)
+    
+    async def a_analyze_resource(self, resource_type: str) -> AnalysisResult:
+        """
+        Async variant of analyze_resource.
+        
+        The blocking API/kubectl call runs in a worker thread so several
+        resource types can be fetched concurrently.
+        """
+        return await asyncio.to_thread(self.analyze_resource, resource_type)
+    
+    async def a_analyze_pressure_points(self) -> AnalysisResult:
+        """Async variant of analyze_pressure_points (see a_analyze_resource)."""
+        return await asyncio.to_thread(self.analyze_pressure_points)
+    
+    async def a_analyze_all(self, resource_types: List[str], include_pressure_points: bool = False) -> AnalysisResult:
+        """
+        Analyze several resource types concurrently and aggregate the results.
+        
+        Args:
+            resource_types: Resource types to analyze (pods, nodes, services, etc.)
+            include_pressure_points: Also run pressure point analysis alongside
+            
+        Returns:
+            AnalysisResult aggregated from all analyses, with per-type resources
+            under metadata['resources']
+        """
+        self.logger.info("Analyzing %s resource types concurrently", len(resource_types))
+        
+        # Create the shared API client up front so worker threads don't race to build it
+        await asyncio.to_thread(self._get_k8s_apis)
+        
+        tasks = [self.a_analyze_resource(resource_type) for resource_type in resource_types]
+        if include_pressure_points:
+            tasks.append(self.a_analyze_pressure_points())
+        # Each task produces its own AnalysisResult, so no locking is required
+        results = await asyncio.gather(*tasks)
+        
+        aggregated = self.aggregate_results(list(results))
+        # Keep each type's resources instead of letting metadata.update() overwrite them
+        aggregated.metadata["resources"] = {
+            resource_type: result.metadata.get("resources")
+            for resource_type, result in zip(resource_types, results)
+        }
+        return aggregated
+    
+    def analyze_all(self, resource_types: List[str], include_pressure_points: bool = False) -> AnalysisResult:
+        """Synchronous wrapper around a_analyze_all."""
+        return asyncio.run(self.a_analyze_all(resource_types, include_pressure_points=include_pressure_points))
+    
     def _display_result(self, result: AnalysisResult):
         """Display the analysis result."""
+        console = _get_console()
+        # Piped/CI output gets plain text; Rich layout only pays off on a terminal
+        if not console.is_terminal:
+            self._display_result_plain(result)
+            return
+        
+        from rich.panel import Panel
+        from rich.table import Table
+        
         console.print("\n[bold green]--- Analysis Result ---[/bold green]")
         
         # Display answer
@@ -508,14 +886,51 @@ class EnhancedClusterAnalyzer:
         # Display metadata if any
         if result.metadata:
             console.print("\n[bold cyan]--- Metadata ---[/bold cyan]")
+            metadata_json = self._get_metadata_json(result)
             for key, value in result.metadata.items():
-                if isinstance(value, dict) or isinstance(value, list):
-                    console.print(f"[cyan]{key}:[/cyan] {json.dumps(value, indent=2)}")
+                if key in metadata_json:
+                    console.print(f"[cyan]{key}:[/cyan] {metadata_json[key]}")
                 else:
                     console.print(f"[cyan]{key}:[/cyan] {value}")
     
+    @staticmethod
+    def _get_metadata_json(result: AnalysisResult) -> Dict[str, str]:
+        """Serialize structured metadata values once per result; redisplays reuse them."""
+        if result._metadata_json is None:
+            result._metadata_json = {
+                key: _dumps_indented(value)
+                for key, value in result.metadata.items()
+                if isinstance(value, (dict, list))
+            }
+        return result._metadata_json
+    
+    def _display_result_plain(self, result: AnalysisResult):
+        """Write the analysis result as plain text, with pressure points as TSV rows."""
+        lines = ["--- Analysis Result ---", result.answer or "No answer provided."]
+        
+        if result.pressure_points:
+            lines.append("resource\ttype\tmetric\tvalue\tthreshold\tseverity")
+            lines.extend(
+                f"{p.resource_name}\t{p.resource_type}\t{p.metric_name}\t{p.current_value}\t{p.threshold}\t{p.severity}"
+                for p in result.pressure_points
+            )
+        
+        if result.metadata:
+            lines.append("--- Metadata ---")
+            metadata_json = self._get_metadata_json(result)
+            lines.extend(
+                f"{key}: {metadata_json.get(key, value)}"
+                for key, value in result.metadata.items()
+            )
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+    
     def _display_final_answer(self, result: Dict[str, Any]):
         """Display the final analysis result from the ReAct agent."""
+        from rich.panel import Panel
+        from rich.table import Table
+        
+        console = _get_console()
         console.print("\n[bold_green]--- Final Analysis ---[/bold_green]")
         
         # Display main response
@@ -552,7 +967,18 @@ DEFAULT_TOOL_CLASSES = {
     "check_node_status": CheckNodeStatusTool,
     "check_pod_status": CheckPodStatusTool,
     "check_cluster_events": CheckClusterEventsTool,
+    "health_snapshot": HealthSnapshotTool,
     # --- Add other CONCRETE tools here as they are created ---
     # e.g., "get_deployments": GetDeploymentsTool, 
 }
-# --- End Default Tool Classes Definition --- 
\ No newline at end of file
+# --- End Default Tool Classes Definition ---
+
+def _validate_tool_classes(tool_classes: Dict[str, Any]) -> tuple:
+    """Check every tool class inherits from BaseTool and freeze the mapping."""
+    for name, tool_class in tool_classes.items():
+        if not (isinstance(tool_class, type) and issubclass(tool_class, BaseTool)):
+            raise TypeError(f"Default tool '{name}' must be a BaseTool subclass, got {tool_class!r}")
+    return tuple(tool_classes.items())
+
+# Validated once at import so analyzer construction only has to register them
+_VALIDATED_DEFAULT_TOOLS = _validate_tool_classes(DEFAULT_TOOL_CLASSES)
@@ -27,10 +27,35 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", os.getenv("GEMINI_API_KEY", ""))  # For backward compatibility
 MAX_TOKENS = int(os.getenv("MAX_TOKENS", "1024"))  # Default max tokens
 TEMPERATURE = float(os.getenv("TEMPERATURE", "0.7"))  # Default temperature
+# Request bare JSON output through the provider API (OpenAI JSON mode, Gemini
+# response_mime_type). Off by default: the ReAct agent expects free-text
+# reasoning ahead of its ```json block, which JSON mode does not allow.
+LLM_JSON_MODE = os.getenv("LLM_JSON_MODE", "false").lower() == "true"
+# Stream completions and stop reading once the first top-level JSON object
+# with a "type" key (the ReAct decision) closes. Off by default: replies that
+# are not ReAct decisions are read to the end either way.
+LLM_STREAM = os.getenv("LLM_STREAM", "false").lower() == "true"
+
+# Response cache for deterministic (temperature 0) LLM calls
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "10000"))  # entries
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "3600"))  # seconds
+LLM_SEMANTIC_CACHE_SIZE = int(os.getenv("LLM_SEMANTIC_CACHE_SIZE", "1000"))  # entries
+LLM_SEMANTIC_CACHE_THRESHOLD = float(os.getenv("LLM_SEMANTIC_CACHE_THRESHOLD", "0.92"))  # cosine similarity
+LLM_EMBEDDING_MODEL = os.getenv("LLM_EMBEDDING_MODEL", "text-embedding-3-small")
+# Concurrent async cache lookups share one embeddings request
+LLM_EMBED_BATCH_SIZE = int(os.getenv("LLM_EMBED_BATCH_SIZE", "32"))  # prompts per request
+LLM_EMBED_BATCH_WAIT = float(os.getenv("LLM_EMBED_BATCH_WAIT", "0.02"))  # seconds to wait for more prompts
+
+# Client-side rate limits per provider (0 disables the limit)
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "0"))  # requests per minute
+OPENAI_TPM = int(os.getenv("OPENAI_TPM", "0"))  # tokens per minute
+GEMINI_RPM = int(os.getenv("GEMINI_RPM", "0"))
+GEMINI_TPM = int(os.getenv("GEMINI_TPM", "0"))
 
 # Retry Configuration
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
+RETRY_DELAY = 5  # seconds, base of the exponential backoff
+MAX_RETRY_DELAY = 60  # seconds, cap on a single backoff wait
 
 # Default Models
 DEFAULT_OPENAI_MODEL = "gpt-4-mini"
@@ -1,10 +1,10 @@
 """LLM module for K8s Analyzer."""
 
-from typing import Optional, Type
+from typing import Dict, Optional, Type
 from .base import BaseLLM
 from .openai import OpenAILLM
 from .gemini import GeminiLLM
-from .config import LLM_PROVIDER, LLM_MODEL, validate_config
+from .config import LLM_PROVIDER, LLM_MODEL, _NORMALIZED_PROVIDERS, validate_config
 from .exceptions import LLMError, LLMConfigError
 
 __all__ = [
@@ -16,12 +16,19 @@ __all__ = [
     "LLMConfigError"
 ]
 
+# Map providers to implementations
+_LLM_CLASSES: Dict[str, Type[BaseLLM]] = {
+    "openai": OpenAILLM,
+    "gemini": GeminiLLM
+}
+
 def get_llm(provider: Optional[str] = None, model: Optional[str] = None) -> BaseLLM:
     """
     Factory function to get an LLM instance based on configuration.
     
     Args:
-        provider: Optional provider override (openai or gemini)
+        provider: Optional provider override; must be a lowercase name
+            ('openai' or 'gemini'), it is not case-folded here
         model: Optional model override
         
     Returns:
@@ -37,14 +44,9 @@ def get_llm(provider: Optional[str] = None, model: Optional[str] = None) -> Base
     # Validate configuration
     validate_config()
     
-    # Map providers to implementations
-    llm_classes: dict[str, Type[BaseLLM]] = {
-        "openai": OpenAILLM,
-        "gemini": GeminiLLM
-    }
-    
-    llm_class = llm_classes.get(provider.lower())
-    if not llm_class:
-        raise LLMConfigError(f"Unknown LLM provider: {provider}")
+    if provider not in _NORMALIZED_PROVIDERS:
+        raise LLMConfigError(
+            f"Unknown LLM provider: {provider} (expected one of {sorted(_NORMALIZED_PROVIDERS)}, lowercase)"
+        )
         
-    return llm_class(model=model)
+    return _LLM_CLASSES[provider](model=model)
@@ -1,29 +1,425 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import AsyncIterable, Awaitable, Callable, Dict, Any, Iterable, List, Optional, Tuple, Type, TypeVar
+from email.utils import parsedate_to_datetime
+import asyncio
+import atexit
+import functools
+import importlib.util
+import json
 import logging
+import os
+import random
+import re
+import time
+import weakref
+import httpx
+from ..core.config import MAX_RETRIES, RETRY_DELAY, MAX_RETRY_DELAY
 from ..core.exceptions import LLMConfigError, LLMAPIError
+from .cache import LLMCache, SemanticLLMCache, response_cache
+
+# Pooled HTTP clients shared by every LLM instance of a given provider/model,
+# so repeated analyses reuse keep-alive connections instead of re-handshaking
+_CLIENT_CACHE: Dict[Tuple[str, Optional[str]], httpx.Client] = {}
+
+# HTTP/2 lets concurrent requests share one connection instead of opening one
+# per in-flight call. It needs the 'h2' package (httpx[http2] in requirements);
+# without it the clients quietly stay on HTTP/1.1.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Pool sizing for bursty agent workloads: keep up to 20 idle connections warm
+# for 30s so back-to-back calls skip the TCP+TLS handshake
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+def get_http_client(provider: str, model: Optional[str] = None) -> httpx.Client:
+    """
+    Get the pooled HTTP client for a provider/model, creating it on first use.
+    
+    Args:
+        provider: LLM provider name (openai, gemini)
+        model: Model name the client is used for
+        
+    Returns:
+        A shared httpx.Client
+    """
+    key = (provider, model)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = httpx.Client(http2=_HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        _CLIENT_CACHE[key] = client
+    return client
+
+def close_http_client(provider: str, model: Optional[str] = None) -> None:
+    """Close and forget the pooled HTTP client for a provider/model, if one exists."""
+    client = _CLIENT_CACHE.pop((provider, model), None)
+    if client is not None:
+        client.close()
+
+# Async clients are bound to the event loop they first ran on, so they are
+# pooled per loop and dropped together with it
+_ASYNC_CLIENT_CACHE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, Optional[str]], httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+# Default cap on in-flight requests for BaseLLM.abatch
+DEFAULT_MAX_CONCURRENCY = 8
+
+def get_async_http_client(provider: str, model: Optional[str] = None) -> httpx.AsyncClient:
+    """
+    Get the pooled async HTTP client for a provider/model on the running event loop.
+    
+    Args:
+        provider: LLM provider name (openai, gemini)
+        model: Model name the client is used for
+        
+    Returns:
+        A shared httpx.AsyncClient
+    """
+    clients = _ASYNC_CLIENT_CACHE.setdefault(asyncio.get_running_loop(), {})
+    key = (provider, model)
+    client = clients.get(key)
+    if client is None:
+        client = httpx.AsyncClient(http2=_HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        clients[key] = client
+    return client
+
+@atexit.register
+def _close_http_clients() -> None:
+    """Close all pooled HTTP clients."""
+    while _CLIENT_CACHE:
+        _, client = _CLIENT_CACHE.popitem()
+        client.close()
+
+def _reset_http_clients() -> None:
+    """Forget pooled clients without closing them; the parent process still owns their sockets."""
+    _CLIENT_CACHE.clear()
+    _ASYNC_CLIENT_CACHE.clear()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_http_clients)
+
+T = TypeVar("T")
+
+def _retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Read the server's requested wait from Retry-After(-ms) headers, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            return float(value) / 1000
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            # HTTP-date form
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def retrying(method):
+    """
+    Decorate a BaseLLM request method so RETRYABLE_ERRORS are retried with backoff.
+    
+    Works for both plain and async methods (see BaseLLM._retry / _aretry), so
+    providers declare their retry policy once instead of wrapping each call.
+    """
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            return await self._aretry(lambda: method(self, *args, **kwargs))
+        return async_wrapper
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self._retry(lambda: method(self, *args, **kwargs))
+    return wrapper
+
+# Skeleton of the result returned when a reply is not valid JSON; copy before filling in
+_NON_JSON_TEMPLATE: Dict[str, Any] = {"success": True, "warning": "Non-JSON response"}
+
+# Receives each text delta of a streamed response as it arrives
+ChunkCallback = Callable[[str], None]
+
+# Characters that change JsonObjectScanner state inside an object / inside a string
+_STRUCTURAL_RE = re.compile(r'[{}"]')
+_STRING_SPECIAL_RE = re.compile(r'["\\]')
+
+# Decision types of the ReAct agent's reply object
+DECISION_TYPES = frozenset({"action", "parallel_actions", "final_answer"})
+
+def is_decision(obj: Any) -> bool:
+    """Whether a parsed JSON value is a ReAct decision (not e.g. an event quoted in the reasoning)."""
+    return isinstance(obj, dict) and obj.get("type") in DECISION_TYPES
+
+class JsonObjectScanner:
+    """
+    Incrementally finds the end of the first top-level JSON object in streamed text.
+    
+    Braces inside JSON strings, including escaped quotes, are not counted. A
+    balanced {...} that does not parse (e.g. "{namespace}" in free-text
+    reasoning ahead of the JSON) is skipped and scanning continues, as is one
+    rejected by `accept` when given (e.g. a Kubernetes event quoted in the
+    reasoning).
+    
+    Replies put the object in a ``` fence, so only an object after a fence
+    ends the scan. An accepted object before any fence is kept as the
+    fallback that split() returns if no fenced object follows.
+    """
+    
+    def __init__(self, accept: Optional[Callable[[Any], bool]] = None):
+        self.accept = accept
+        self._parts: List[str] = []
+        self._length = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._end = -1
+        self._fence_seen = False
+        # Last characters of text outside objects, for fences split across chunks
+        self._tail = ""
+        # (start, end) of the first accepted object before any fence
+        self._unfenced: Optional[Tuple[int, int]] = None
+    
+    def feed(self, chunk: str) -> int:
+        """
+        Scan the next chunk of text.
+        
+        Returns:
+            Index in the chunk just past the closing brace, or -1 if no object has closed yet
+        """
+        offset = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+        # Scanner state lives in locals; the loop jumps between significant
+        # characters with C-level searches rather than visiting each one
+        depth, in_string, escaped = self._depth, self._in_string, self._escaped
+        end = -1
+        index = 0
+        length = len(chunk)
+        if escaped and length:
+            # Escape sequence split across chunks
+            escaped = False
+            index = 1
+        while index < length:
+            if in_string:
+                match = _STRING_SPECIAL_RE.search(chunk, index)
+                if match is None:
+                    break
+                index = match.start()
+                if chunk[index] == "\\":
+                    if index + 1 == length:
+                        escaped = True
+                        break
+                    index += 2
+                    continue
+                in_string = False
+                index += 1
+            elif not depth:
+                brace = chunk.find("{", index)
+                if not self._fence_seen:
+                    text = self._tail + (chunk[index:] if brace == -1 else chunk[index:brace])
+                    self._fence_seen = "```" in text
+                    self._tail = "" if brace != -1 else text[-2:]
+                if brace == -1:
+                    break
+                index = brace
+                self._start = offset + index
+                depth = 1
+                index += 1
+            else:
+                match = _STRUCTURAL_RE.search(chunk, index)
+                if match is None:
+                    break
+                char = match.group()
+                index = match.end()
+                if char == '"':
+                    in_string = True
+                elif char == "{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if not depth and self._parses(offset + index):
+                        if not self._fence_seen:
+                            if self._unfenced is None:
+                                self._unfenced = (self._start, offset + index)
+                            continue
+                        end = index
+                        self._end = offset + end
+                        break
+        self._depth, self._in_string, self._escaped = depth, in_string, escaped
+        return end
+    
+    def split(self) -> Optional[Tuple[str, str]]:
+        """
+        Split the scanned text at the object.
+        
+        Returns:
+            (text before the object, the object), or None if no object has closed
+        """
+        if self._end != -1:
+            start, end = self._start, self._end
+        elif self._unfenced is not None:
+            start, end = self._unfenced
+        else:
+            return None
+        text = "".join(self._parts)
+        return text[:start], text[start:end]
+    
+    def _parses(self, end: int) -> bool:
+        """Check whether the candidate object ending at `end` is valid JSON (and accepted)."""
+        try:
+            obj = json.loads("".join(self._parts)[self._start:end])
+        except ValueError:
+            return False
+        return self.accept is None or self.accept(obj)
 
 class BaseLLM(ABC):
     """Abstract base class for LLM implementations."""
     
-    def __init__(self, model: Optional[str] = None):
+    # Transient provider errors retried with backoff (rate limits, overload)
+    RETRYABLE_ERRORS: Tuple[Type[BaseException], ...] = ()
+    
+    # Set by providers (via _on_close) to release shared clients
+    _finalizer: Optional[weakref.finalize] = None
+    
+    def __init__(self, model: Optional[str] = None, temperature: Optional[float] = None,
+                 cache: Optional[LLMCache] = response_cache,
+                 semantic_cache: Optional[SemanticLLMCache] = None):
+        """
+        Args:
+            model: Model name (provider default if None)
+            temperature: Sampling temperature (provider default if None)
+            cache: Exact-match response cache
+            semantic_cache: Optional embedding-similarity cache, e.g.
+                SemanticLLMCache(embed=openai_llm.embed)
+        
+        Both caches only serve deterministic requests (temperature 0).
+        """
         self.logger = logging.getLogger(f"k8s_analyzer.llm.{self.__class__.__name__.lower()}")
         self.model = model
+        # Providers fill in their default temperature in _initialize
+        self.temperature = temperature
+        self.cache = cache
+        self.semantic_cache = semantic_cache
         self._initialize()
     
+    def _on_close(self, release: Callable[[], None]) -> None:
+        """
+        Register the callback that releases this instance's shared resources.
+        
+        It runs exactly once: on close(), when the instance is garbage
+        collected, or at interpreter exit. It must not reference self.
+        """
+        self._finalizer = weakref.finalize(self, release)
+    
+    def close(self) -> None:
+        """Release shared connections held by this instance. Safe to call more than once."""
+        if self._finalizer is not None:
+            self._finalizer()
+    
+    def __enter__(self) -> "BaseLLM":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _lookup_exact(self, system_prompt: str, user_prompt: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (cache key, cached response) from the exact-match cache."""
+        if self.cache is None:
+            return None, None
+        key = LLMCache.make_key(self.model, system_prompt, user_prompt, self.temperature)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.logger.debug("LLM response cache hit (%s)", self.cache.stats)
+        return key, cached
+    
+    def _lookup_semantic(self, system_prompt: str, vector: Optional[Tuple[float, ...]]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (scope, cached response) from the semantic cache."""
+        if vector is None:
+            return None, None
+        scope = SemanticLLMCache.make_scope(self.model, system_prompt, self.temperature)
+        cached = self.semantic_cache.get(scope, vector)
+        if cached is not None:
+            self.logger.debug("LLM semantic cache hit (%s)", self.semantic_cache.stats)
+        return scope, cached
+    
+    def _embed_for_cache(self, user_prompt: str) -> Optional[Tuple[float, ...]]:
+        """Embed the prompt for the semantic cache; failures just skip it."""
+        if self.semantic_cache is None:
+            return None
+        try:
+            return self.semantic_cache.embed_prompt(user_prompt)
+        except Exception as e:
+            self.logger.warning("Skipping semantic cache, embedding failed: %s", e)
+            return None
+    
+    async def _aembed_for_cache(self, user_prompt: str) -> Optional[Tuple[float, ...]]:
+        """Async variant of _embed_for_cache, batched with concurrent lookups."""
+        if self.semantic_cache is None:
+            return None
+        try:
+            return await self.semantic_cache.aembed_prompt(user_prompt)
+        except Exception as e:
+            self.logger.warning("Skipping semantic cache, embedding failed: %s", e)
+            return None
+    
+    def _store(self, key: Optional[str], scope: Optional[str], vector: Optional[Tuple[float, ...]],
+               result: Dict[str, Any]) -> None:
+        if key is not None:
+            self.cache.set(key, result)
+        if scope is not None:
+            self.semantic_cache.set(scope, vector, result)
+    
+    def _cached(self, system_prompt: str, user_prompt: str,
+                compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Serve a response from the exact or semantic cache, or compute and store it."""
+        if self.temperature != 0:
+            return compute()
+        key, cached = self._lookup_exact(system_prompt, user_prompt)
+        if cached is not None:
+            return cached
+        vector = self._embed_for_cache(user_prompt)
+        scope, cached = self._lookup_semantic(system_prompt, vector)
+        if cached is not None:
+            return cached
+        result = compute()
+        self._store(key, scope, vector, result)
+        return result
+    
+    async def _acached(self, system_prompt: str, user_prompt: str,
+                       compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Async variant of _cached."""
+        if self.temperature != 0:
+            return await compute()
+        key, cached = self._lookup_exact(system_prompt, user_prompt)
+        if cached is not None:
+            return cached
+        vector = await self._aembed_for_cache(user_prompt)
+        scope, cached = self._lookup_semantic(system_prompt, vector)
+        if cached is not None:
+            return cached
+        result = await compute()
+        self._store(key, scope, vector, result)
+        return result
+    
     @abstractmethod
     def _initialize(self) -> None:
         """Initialize the LLM client and configuration."""
         pass
     
     @abstractmethod
-    def analyze(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+    def analyze(self, system_prompt: str, user_prompt: str,
+                on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
         """
         Analyze the prompts using the LLM.
         
         Args:
             system_prompt: Instructions for the LLM
             user_prompt: User query or data to analyze
+            on_chunk: Called with each text delta when the response is streamed
             
         Returns:
             Dict containing analysis results or error information
@@ -42,3 +438,137 @@ class BaseLLM(ABC):
             Dict containing parsed response or error information
         """
         pass
+    
+    @staticmethod
+    def _collect_stream(chunks: Iterable[str], on_chunk: Optional[ChunkCallback] = None) -> str:
+        """
+        Join streamed text deltas, stopping once a fenced ReAct decision
+        object (see is_decision) closes.
+        
+        Anything the model would generate after the object is never waited for.
+        The caller is responsible for closing the underlying stream.
+        """
+        feed = JsonObjectScanner(is_decision).feed
+        parts = []
+        append = parts.append
+        for chunk in chunks:
+            if not chunk:
+                continue
+            end = feed(chunk)
+            if end != -1:
+                chunk = chunk[:end]
+            append(chunk)
+            if on_chunk is not None:
+                on_chunk(chunk)
+            if end != -1:
+                break
+        return "".join(parts)
+    
+    @staticmethod
+    async def _acollect_stream(chunks: AsyncIterable[str], on_chunk: Optional[ChunkCallback] = None) -> str:
+        """Async variant of _collect_stream."""
+        feed = JsonObjectScanner(is_decision).feed
+        parts = []
+        append = parts.append
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            end = feed(chunk)
+            if end != -1:
+                chunk = chunk[:end]
+            append(chunk)
+            if on_chunk is not None:
+                on_chunk(chunk)
+            if end != -1:
+                break
+        return "".join(parts)
+    
+    @staticmethod
+    def _strip_fences(text: str) -> str:
+        """Remove a surrounding markdown code fence (```json ... ```) from a response."""
+        text = text.strip().removesuffix("```")
+        if text.startswith("```"):
+            text = text[3:].removeprefix("json")
+        return text.strip()
+    
+    def _backoff_delay(self, attempt: int, error: BaseException) -> float:
+        """
+        Seconds to wait before retry number `attempt` (1-based).
+        
+        Honors the server's Retry-After when given; otherwise exponential
+        backoff from RETRY_DELAY, capped at MAX_RETRY_DELAY, with jitter so
+        concurrent workers don't retry in lockstep.
+        """
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, MAX_RETRY_DELAY)
+        return min(MAX_RETRY_DELAY, RETRY_DELAY * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+    
+    def _retry(self, call: Callable[[], T]) -> T:
+        """
+        Run a provider call, retrying RETRYABLE_ERRORS up to MAX_RETRIES attempts.
+        
+        The last error is re-raised once attempts are exhausted.
+        """
+        retryable, max_retries = self.RETRYABLE_ERRORS, MAX_RETRIES
+        attempt = 0
+        while True:
+            try:
+                return call()
+            except retryable as e:
+                attempt += 1
+                if attempt >= max_retries:
+                    raise
+                delay = self._backoff_delay(attempt, e)
+                self.logger.warning("%s; retrying in %.1fs (%d/%d)", type(e).__name__, delay, attempt, max_retries)
+                time.sleep(delay)
+    
+    async def _aretry(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of _retry."""
+        retryable, max_retries = self.RETRYABLE_ERRORS, MAX_RETRIES
+        attempt = 0
+        while True:
+            try:
+                return await call()
+            except retryable as e:
+                attempt += 1
+                if attempt >= max_retries:
+                    raise
+                delay = self._backoff_delay(attempt, e)
+                self.logger.warning("%s; retrying in %.1fs (%d/%d)", type(e).__name__, delay, attempt, max_retries)
+                await asyncio.sleep(delay)
+    
+    async def aanalyze(self, system_prompt: str, user_prompt: str,
+                       on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
+        """
+        Async variant of analyze.
+        
+        The default runs analyze in a worker thread; providers with an async
+        SDK override this to await the request directly.
+        """
+        if on_chunk is None:
+            return await asyncio.to_thread(self.analyze, system_prompt, user_prompt)
+        return await asyncio.to_thread(self.analyze, system_prompt, user_prompt, on_chunk=on_chunk)
+    
+    async def abatch(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several (system_prompt, user_prompt) pairs concurrently.
+        
+        Args:
+            pairs: Prompt pairs to analyze
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Results in the same order as the pairs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aanalyze(system_prompt, user_prompt)
+        
+        return await asyncio.gather(*(run(system_prompt, user_prompt) for system_prompt, user_prompt in pairs))
@@ -0,0 +1,262 @@
+"""Response caching for LLM calls."""
+
+import asyncio
+import hashlib
+import json
+import math
+import operator
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import (
+    LLM_CACHE_SIZE,
+    LLM_CACHE_TTL,
+    LLM_EMBED_BATCH_SIZE,
+    LLM_EMBED_BATCH_WAIT,
+    LLM_SEMANTIC_CACHE_SIZE,
+    LLM_SEMANTIC_CACHE_THRESHOLD
+)
+
+# Embeds a batch of texts into vectors (e.g. OpenAILLM.embed)
+EmbedFn = Callable[[List[str]], List[Sequence[float]]]
+
+
+class LLMCache:
+    """
+    Thread-safe exact-match cache of LLM responses with LRU eviction and a TTL.
+
+    Keys are SHA-256 digests of the canonicalized request payload (see make_key),
+    so prompts of any size map to fixed-size keys.
+    """
+
+    def __init__(self, maxsize: int = LLM_CACHE_SIZE, ttl: float = LLM_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: Optional[str], system_prompt: str, user_prompt: str, temperature: float) -> str:
+        """Build the cache key for a request."""
+        payload = json.dumps(
+            {"m": model, "s": system_prompt, "u": user_prompt, "t": temperature},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Returns:
+            A copy of the cached response, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+def _normalize(vector: Sequence[float]) -> Tuple[float, ...]:
+    """Scale a vector to unit length so cosine similarity is a plain dot product."""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return tuple(x / norm for x in vector)
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent async embedding requests into batched embed calls.
+
+    The first request opens a batch that is sent after max_wait seconds, or
+    as soon as max_batch prompts have joined it, so N concurrent cache lookups
+    cost one embeddings round-trip instead of N. The embed function runs in a
+    worker thread.
+    """
+
+    def __init__(self, embed: EmbedFn, max_batch: int = LLM_EMBED_BATCH_SIZE,
+                 max_wait: float = LLM_EMBED_BATCH_WAIT):
+        self.embed = embed
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._texts: List[str] = []
+        self._futures: List["asyncio.Future[Sequence[float]]"] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def aembed(self, text: str) -> Sequence[float]:
+        """Embed one text as part of the next batch."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # A batch left over from a closed event loop can never be sent
+            self._texts, self._futures, self._timer = [], [], None
+            self._loop = loop
+        future = loop.create_future()
+        self._texts.append(text)
+        self._futures.append(future)
+        if len(self._texts) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Send the pending batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        texts, futures = self._texts, self._futures
+        self._texts, self._futures = [], []
+        if texts:
+            asyncio.ensure_future(self._send(texts, futures))
+
+    async def _send(self, texts: List[str], futures: List["asyncio.Future[Sequence[float]]"]) -> None:
+        try:
+            vectors = await asyncio.to_thread(self.embed, texts)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, vector in zip(futures, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+
+class SemanticLLMCache:
+    """
+    Embedding-similarity cache that serves responses for reworded prompts.
+
+    Entries are scoped by (model, system prompt, temperature), so only user
+    prompts asked under the same instructions are compared. A lookup returns
+    the most similar cached response if its cosine similarity reaches the
+    threshold. Search is a linear scan over unit vectors, which is adequate for
+    the few thousand entries an agent session produces.
+    """
+
+    def __init__(
+        self,
+        embed: EmbedFn,
+        threshold: float = LLM_SEMANTIC_CACHE_THRESHOLD,
+        maxsize: int = LLM_SEMANTIC_CACHE_SIZE,
+        ttl: float = LLM_CACHE_TTL
+    ):
+        self.embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # scope -> [(expires_at, unit vector, response)]
+        self._scopes: Dict[str, List[Tuple[float, Tuple[float, ...], Dict[str, Any]]]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._batcher: Optional[EmbeddingBatcher] = None
+
+    @staticmethod
+    def make_scope(model: Optional[str], system_prompt: str, temperature: float) -> str:
+        """Build the scope key under which user prompts are compared."""
+        return LLMCache.make_key(model, system_prompt, "", temperature)
+
+    def embed_prompt(self, user_prompt: str) -> Tuple[float, ...]:
+        """Embed and normalize a user prompt."""
+        return _normalize(self.embed([user_prompt])[0])
+
+    async def aembed_prompt(self, user_prompt: str) -> Tuple[float, ...]:
+        """Async variant of embed_prompt; concurrent calls share batched embed requests."""
+        if self._batcher is None:
+            self._batcher = EmbeddingBatcher(self.embed)
+        return _normalize(await self._batcher.aembed(user_prompt))
+
+    def get(self, scope: str, vector: Tuple[float, ...]) -> Optional[Dict[str, Any]]:
+        """
+        Find the closest cached response within a scope.
+
+        Returns:
+            A copy of the response tagged with cache_hit='semantic', or None
+        """
+        now = time.monotonic()
+        best_score = self.threshold
+        best = None
+        with self._lock:
+            entries = self._scopes.get(scope, [])
+            live = [entry for entry in entries if entry[0] >= now]
+            if len(live) != len(entries):
+                self._size -= len(entries) - len(live)
+                self._scopes[scope] = live
+            for _, cached_vector, response in live:
+                score = sum(map(operator.mul, vector, cached_vector))
+                if score >= best_score:
+                    best_score, best = score, response
+            if best is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        result = dict(best)
+        result["cache_hit"] = "semantic"
+        return result
+
+    def set(self, scope: str, vector: Tuple[float, ...], value: Dict[str, Any]) -> None:
+        """Store a response, evicting the oldest entry when full."""
+        with self._lock:
+            self._scopes.setdefault(scope, []).append((time.monotonic() + self.ttl, vector, dict(value)))
+            self._size += 1
+            while self._size > self.maxsize:
+                oldest_scope = min(
+                    (name for name, entries in self._scopes.items() if entries),
+                    key=lambda name: self._scopes[name][0][0]
+                )
+                self._scopes[oldest_scope].pop(0)
+                self._size -= 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._scopes.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": self._size}
+
+
+# Shared by all providers; the model is part of the key
+response_cache = LLMCache()
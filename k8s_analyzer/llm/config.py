@@ -1,6 +1,7 @@
 """Configuration settings for LLM providers."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 
 # OpenAI Configuration
@@ -17,13 +18,20 @@ RETRY_DELAY: int = 5  # seconds
 MAX_TOKENS: int = 3000
 TEMPERATURE: float = 0.5
 
-# LLM Provider Selection
+# LLM Provider Selection (provider names are canonically lowercase)
+_NORMALIZED_PROVIDERS = frozenset({"openai", "gemini"})
 LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "openai").lower()
 LLM_MODEL: Optional[str] = os.getenv("LLM_MODEL")
 
+@lru_cache(maxsize=1)
 def validate_config() -> None:
-    """Validate the configuration settings."""
-    if LLM_PROVIDER not in ["openai", "gemini"]:
+    """
+    Validate the configuration settings.
+    
+    The settings are fixed at import time, so a successful validation is
+    memoized; call validate_config.cache_clear() after changing them (e.g. in tests).
+    """
+    if LLM_PROVIDER not in _NORMALIZED_PROVIDERS:
         raise ValueError(f"Invalid LLM_PROVIDER: {LLM_PROVIDER}. Must be 'openai' or 'gemini'")
         
     if LLM_PROVIDER == "openai" and not OPENAI_API_KEY:
@@ -1,20 +1,68 @@
 """Google Gemini implementation of the LLM interface."""
 
-import json
-import time
-from typing import Dict, Any
-import google.generativeai as genai
-from google.generativeai.types import GenerateContentResponse
-from .base import BaseLLM
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, Optional
+from .base import _NON_JSON_TEMPLATE, BaseLLM, ChunkCallback, retrying
 from ..core.config import (
     GOOGLE_API_KEY,
     DEFAULT_GEMINI_MODEL,
     MAX_RETRIES,
-    RETRY_DELAY,
+    LLM_JSON_MODE,
+    LLM_STREAM,
     MAX_TOKENS,
-    TEMPERATURE
+    TEMPERATURE,
+    GEMINI_RPM,
+    GEMINI_TPM
 )
 from ..core.exceptions import LLMConfigError, LLMAPIError
+from .ratelimit import make_bucket
+
+# google.generativeai pulls in protobuf and gRPC, so it is imported on first
+# use rather than whenever the llm package is imported
+if TYPE_CHECKING:
+    import google.generativeai as genai
+    from google.generativeai.types import GenerateContentResponse
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional: fall back to the stdlib parser
+    from json import loads as _json_loads
+
+# Shared by all GeminiLLM instances, since the limits are per API key
+_RATE_LIMITER = make_bucket(GEMINI_RPM, GEMINI_TPM)
+
+# genai.configure sets up process-global transport state; do it only once.
+# The transport is left at its default (grpc for sync calls, grpc_asyncio for
+# generate_content_async): both multiplex concurrent requests over a single
+# HTTP/2 connection, and forcing "grpc" would break the async client.
+_GENAI = None
+# Live GeminiLLM instances; the SDK's cached clients are dropped after the last closes
+_GENAI_USERS = 0
+
+def _acquire_genai():
+    """Import and configure the Gemini SDK on first use, and count one more user."""
+    global _GENAI, _GENAI_USERS
+    if _GENAI is None:
+        import google.generativeai as genai
+        genai.configure(api_key=GOOGLE_API_KEY)
+        _GENAI = genai
+    _GENAI_USERS += 1
+    return _GENAI
+
+def _release_genai() -> None:
+    """Drop one user of the SDK, discarding its cached gRPC clients after the last."""
+    global _GENAI, _GENAI_USERS
+    _GENAI_USERS -= 1
+    if _GENAI_USERS <= 0 and _GENAI is not None:
+        _GENAI_USERS = 0
+        # The SDK has no close(); reconfiguring drops its default clients (and
+        # their channels) and the next instance starts from a clean configure
+        _GENAI.configure(api_key=GOOGLE_API_KEY)
+        _GENAI = None
+
+# Per-instance bound on models kept for distinct system prompts
+_MAX_SYSTEM_MODELS = 16
 
 class GeminiLLM(BaseLLM):
     """Google Gemini implementation of the LLM interface."""
@@ -25,72 +73,174 @@ class GeminiLLM(BaseLLM):
             raise LLMConfigError("GOOGLE_API_KEY environment variable not set")
             
         self.model = self.model or DEFAULT_GEMINI_MODEL
+        if self.temperature is None:
+            self.temperature = TEMPERATURE
         try:
-            genai.configure(api_key=GOOGLE_API_KEY)
+            self._genai = genai = _acquire_genai()
+            self._on_close(_release_genai)
+            from google.api_core import exceptions as google_exceptions
+            # Quota (429) and overload (503) errors are transient
+            self.RETRYABLE_ERRORS = (google_exceptions.ResourceExhausted, google_exceptions.ServiceUnavailable)
+            generation_config = {
+                "max_output_tokens": MAX_TOKENS,
+                "temperature": self.temperature
+            }
+            if LLM_JSON_MODE:
+                # Gemini 1.5+ returns bare JSON, so no fences to strip
+                generation_config["response_mime_type"] = "application/json"
+            self._generation_config = generation_config
             self.model_client = genai.GenerativeModel(
                 model_name=self.model,
-                generation_config={
-                    "max_output_tokens": MAX_TOKENS,
-                    "temperature": TEMPERATURE
-                }
+                generation_config=generation_config
             )
-            self.logger.info(f"Initialized Gemini client with model: {self.model}")
+            # system prompt -> GenerativeModel carrying it as system_instruction
+            self._system_models: "OrderedDict[str, genai.GenerativeModel]" = OrderedDict()
+            self.logger.info("Initialized Gemini client with model: %s", self.model)
         except Exception as e:
             raise LLMConfigError(f"Failed to initialize Gemini client: {e}")
     
-    def analyze(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+    def _model_for(self, system_prompt: str) -> "genai.GenerativeModel":
+        """
+        Get the model for a system prompt, creating it on first use.
+        
+        The system prompt is sent as the model's system_instruction rather than
+        prepended to every user prompt, so the stable prefix is identical across
+        calls and eligible for Gemini's prompt caching.
+        """
+        if not system_prompt:
+            return self.model_client
+        model = self._system_models.get(system_prompt)
+        if model is None:
+            model = self._genai.GenerativeModel(
+                model_name=self.model,
+                generation_config=self._generation_config,
+                system_instruction=system_prompt
+            )
+            self._system_models[system_prompt] = model
+            if len(self._system_models) > _MAX_SYSTEM_MODELS:
+                self._system_models.popitem(last=False)
+        else:
+            self._system_models.move_to_end(system_prompt)
+        return model
+    
+    def close(self) -> None:
+        """Drop this instance's models and release the shared SDK clients."""
+        self._system_models.clear()
+        super().close()
+    
+    def analyze(self, system_prompt: str, user_prompt: str,
+                on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
         """Analyze using Gemini's chat API."""
-        # Combine prompts as Gemini doesn't have separate system/user roles
-        combined_prompt = f"{system_prompt}\n\nUser Query: {user_prompt}"
+        return self._cached(system_prompt, user_prompt, lambda: self._analyze(system_prompt, user_prompt, on_chunk))
+    
+    def _analyze(self, system_prompt: str, user_prompt: str,
+                 on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
+        """Send the request to Gemini, retrying on API errors."""
+        model = self._model_for(system_prompt)
+        tokens = self._request_tokens(system_prompt, user_prompt)
         
-        retries = 0
-        while retries < MAX_RETRIES:
-            try:
-                self.logger.debug(f"Sending request to Gemini: {combined_prompt[:100]}...")
-                response = self.model_client.generate_content(combined_prompt)
+        try:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Sending request to Gemini: %s...", user_prompt[:100])
+            response = self._send(model, user_prompt, tokens)
+            if not LLM_STREAM:
                 return self.validate_response(response)
-                
-            except genai.types.BlockedPromptException as e:
-                raise LLMAPIError(f"Gemini blocked prompt: {e}")
-                
-            except genai.types.GenerateContentResponseError as e:
-                retries += 1
-                self.logger.warning(
-                    f"Gemini API error. Retrying in {RETRY_DELAY}s... ({retries}/{MAX_RETRIES})"
-                )
-                if retries >= MAX_RETRIES:
-                    raise LLMAPIError(f"Gemini API error after {MAX_RETRIES} retries: {e}")
-                time.sleep(RETRY_DELAY)
-                
-            except Exception as e:
-                raise LLMAPIError(f"Unexpected error during Gemini analysis: {e}")
+            # Stops iterating (and receiving) once the JSON object is complete
+            text = self._collect_stream((chunk.text for chunk in response), on_chunk)
+            return self._validate_text(text)
+        except Exception as e:
+            raise self._api_error(e)
+    
+    async def aanalyze(self, system_prompt: str, user_prompt: str,
+                       on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
+        """Analyze using Gemini's async API without blocking the event loop."""
+        return await self._acached(
+            system_prompt, user_prompt, lambda: self._aanalyze(system_prompt, user_prompt, on_chunk)
+        )
+    
+    async def _aanalyze(self, system_prompt: str, user_prompt: str,
+                        on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
+        """Send the request to Gemini asynchronously, retrying on API errors."""
+        model = self._model_for(system_prompt)
+        tokens = self._request_tokens(system_prompt, user_prompt)
+        
+        try:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Sending async request to Gemini: %s...", user_prompt[:100])
+            response = await self._asend(model, user_prompt, tokens)
+            if not LLM_STREAM:
+                return self.validate_response(response)
+            text = await self._acollect_stream(self._astream_text(response), on_chunk)
+            return self._validate_text(text)
+        except Exception as e:
+            raise self._api_error(e)
+    
+    @retrying
+    def _send(self, model: "genai.GenerativeModel", user_prompt: str, tokens: int) -> Any:
+        """Issue one generate_content request, paced by the rate limiter."""
+        if _RATE_LIMITER is not None:
+            _RATE_LIMITER.acquire(tokens)
+        return model.generate_content([user_prompt], stream=LLM_STREAM)
     
-    def validate_response(self, response: GenerateContentResponse) -> Dict[str, Any]:
+    @retrying
+    async def _asend(self, model: "genai.GenerativeModel", user_prompt: str, tokens: int) -> Any:
+        """Async variant of _send."""
+        if _RATE_LIMITER is not None:
+            await _RATE_LIMITER.aacquire(tokens)
+        return await model.generate_content_async([user_prompt], stream=LLM_STREAM)
+    
+    @staticmethod
+    async def _astream_text(response):
+        """Yield the text of each chunk of a streamed async response."""
+        async for chunk in response:
+            yield chunk.text
+    
+    @staticmethod
+    def _request_tokens(system_prompt: str, user_prompt: str) -> int:
+        """
+        Estimate the tokens a request may consume against the TPM budget.
+        
+        Uses ~4 characters per token rather than model_client.count_tokens,
+        which would cost an extra API round trip per request.
+        """
+        if _RATE_LIMITER is None or not _RATE_LIMITER.tpm:
+            return 0
+        return (len(system_prompt) + len(user_prompt)) // 4 + 1 + MAX_TOKENS
+    
+    def _api_error(self, error: Exception) -> LLMAPIError:
+        """Map an exception from a request to the LLMAPIError raised to callers."""
+        if isinstance(error, self._genai.types.BlockedPromptException):
+            return LLMAPIError(f"Gemini blocked prompt: {error}")
+        if isinstance(error, self.RETRYABLE_ERRORS):
+            return LLMAPIError(f"Gemini API error after {MAX_RETRIES} retries: {error}")
+        return LLMAPIError(f"Unexpected error during Gemini analysis: {error}")
+    
+    def validate_response(self, response: "GenerateContentResponse") -> Dict[str, Any]:
         """Validate and parse Gemini response."""
         try:
-            analysis = response.text.strip()
-            self.logger.debug(f"Received response from Gemini: {analysis[:100]}...")
+            analysis = response.text
+        except Exception as e:
+            raise LLMAPIError(f"Failed to validate Gemini response: {e}")
+        return self._validate_text(analysis)
+    
+    def _validate_text(self, analysis: str) -> Dict[str, Any]:
+        """Parse the text of a Gemini response, complete or streamed."""
+        try:
+            analysis = analysis.strip()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Received response from Gemini: %s...", analysis[:100])
             
-            # Clean up potential markdown formatting
-            cleaned_analysis = analysis
-            if cleaned_analysis.startswith("```json"):
-                cleaned_analysis = cleaned_analysis[7:]
-            if cleaned_analysis.startswith("```"):
-                cleaned_analysis = cleaned_analysis[3:]
-            if cleaned_analysis.endswith("```"):
-                cleaned_analysis = cleaned_analysis[:-3]
-            cleaned_analysis = cleaned_analysis.strip()
+            # Clean up potential markdown formatting (not emitted in JSON mode)
+            cleaned_analysis = analysis if LLM_JSON_MODE else self._strip_fences(analysis)
             
             try:
-                parsed_analysis = json.loads(cleaned_analysis)
+                parsed_analysis = _json_loads(cleaned_analysis)
                 return {"analysis": parsed_analysis, "success": True}
-            except json.JSONDecodeError:
-                self.logger.warning(f"Gemini response was not valid JSON: {analysis}")
-                return {
-                    "analysis": {"raw_output": analysis},
-                    "success": True,
-                    "warning": "Non-JSON response"
-                }
+            except ValueError:  # json and orjson decode errors both subclass it
+                self.logger.warning("Gemini response was not valid JSON: %s", analysis)
+                result = _NON_JSON_TEMPLATE.copy()
+                result["analysis"] = {"raw_output": analysis}
+                return result
                 
         except Exception as e:
             raise LLMAPIError(f"Failed to validate Gemini response: {e}") 
\ No newline at end of file
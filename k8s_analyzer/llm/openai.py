@@ -1,15 +1,134 @@
+import asyncio
 import json
+import logging
+import os
+import threading
 import time
-from typing import Dict, Any
-from openai import OpenAI, RateLimitError, APIError
-from .base import BaseLLM
+import weakref
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Sequence, Tuple
+from .base import (
+    _NON_JSON_TEMPLATE,
+    BaseLLM,
+    ChunkCallback,
+    close_http_client,
+    get_async_http_client,
+    get_http_client,
+    retrying
+)
 from ..core.config import (
     OPENAI_API_KEY,
     DEFAULT_OPENAI_MODEL,
+    LLM_EMBEDDING_MODEL,
+    LLM_JSON_MODE,
+    LLM_STREAM,
     MAX_RETRIES,
-    RETRY_DELAY
+    OPENAI_RPM,
+    OPENAI_TPM
 )
 from ..core.exceptions import LLMConfigError, LLMAPIError
+from .ratelimit import make_bucket
+
+# The openai SDK (and tiktoken) are imported on first use, so importing this
+# package stays cheap when another provider is selected
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional: fall back to the stdlib parser
+    from json import loads as _json_loads
+
+# Completion budget requested per call
+_MAX_COMPLETION_TOKENS = 3000
+
+# JSON mode makes the API return a bare JSON object, so no fences to strip.
+# Needs gpt-4-turbo/gpt-3.5-turbo-1106 or newer and a prompt that mentions JSON.
+_JSON_MODE_OPTIONS: Dict[str, Any] = {"response_format": {"type": "json_object"}} if LLM_JSON_MODE else {}
+
+# Batch API settings (see OpenAILLM.batch_analyze)
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_POLL_INTERVAL = 30
+_BATCH_FINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Shared by all OpenAILLM instances, since the limits are per API key
+_RATE_LIMITER = make_bucket(OPENAI_RPM, OPENAI_TPM)
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """
+    Load the tiktoken encoding for a model, or None if unavailable.
+    
+    Cached per model: building an encoding loads its BPE merge table, and a
+    failed (offline) load is not retried on every request.
+    """
+    try:
+        import tiktoken
+    except ImportError:  # Optional: token counts fall back to a length estimate
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encodings are downloaded on first use, which fails offline
+        return None
+
+def _count_tokens(model: str, text: str) -> int:
+    """Count prompt tokens with tiktoken, or estimate ~4 characters per token."""
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return len(text) // 4 + 1
+
+# Process-wide clients shared by every OpenAILLM so all instances reuse one
+# keep-alive pool. The model is chosen per request, so one client serves all.
+# SDK-level retries are off; BaseLLM._retry applies the backoff policy.
+_CLIENT: Optional["OpenAI"] = None
+# Live OpenAILLM instances using _CLIENT; its pool is closed when this drops to 0
+_CLIENT_USERS = 0
+_CLIENT_LOCK = threading.Lock()
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
+
+def _acquire_client() -> "OpenAI":
+    """Get the shared OpenAI client, creating it on first use, and count one more user."""
+    global _CLIENT, _CLIENT_USERS
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            from openai import OpenAI
+            _CLIENT = OpenAI(http_client=get_http_client("openai"), max_retries=0)
+        _CLIENT_USERS += 1
+        return _CLIENT
+
+def _release_client() -> None:
+    """Drop one user of the shared client, closing its connection pool after the last."""
+    global _CLIENT, _CLIENT_USERS
+    with _CLIENT_LOCK:
+        _CLIENT_USERS -= 1
+        if _CLIENT_USERS <= 0:
+            _CLIENT_USERS = 0
+            _CLIENT = None
+            close_http_client("openai")
+
+def _get_async_client() -> "AsyncOpenAI":
+    """Get the shared AsyncOpenAI client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        from openai import AsyncOpenAI
+        client = AsyncOpenAI(http_client=get_async_http_client("openai"), max_retries=0)
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+def _reset_clients() -> None:
+    """Drop the shared clients; a forked child must not reuse its parent's connections."""
+    global _CLIENT
+    _CLIENT = None
+    _ASYNC_CLIENTS.clear()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients)
 
 class OpenAILLM(BaseLLM):
     """OpenAI implementation of the LLM interface."""
@@ -19,75 +138,269 @@ class OpenAILLM(BaseLLM):
         if not OPENAI_API_KEY:
             raise LLMConfigError("OPENAI_API_KEY environment variable not set")
         
+        from openai import RateLimitError
+        self.RETRYABLE_ERRORS = (RateLimitError,)
         self.model = self.model or DEFAULT_OPENAI_MODEL
+        if self.temperature is None:
+            self.temperature = 0.5
         try:
-            self.client = OpenAI()
-            self.logger.info(f"Initialized OpenAI client with model: {self.model}")
+            self.client = _acquire_client()
+            self._on_close(_release_client)
+            self.logger.info("Initialized OpenAI client with model: %s", self.model)
         except Exception as e:
             raise LLMConfigError(f"Failed to initialize OpenAI client: {e}")
     
-    def analyze(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
-        """Analyze using OpenAI's chat completion API."""
-        messages = [
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a batch of texts in a single request.
+        
+        Suitable as the embed function of a SemanticLLMCache.
+        """
+        from openai import APIError
+        try:
+            response = self.client.embeddings.create(model=LLM_EMBEDDING_MODEL, input=texts)
+        except APIError as e:
+            raise LLMAPIError(f"OpenAI embeddings error: {e}")
+        return [item.embedding for item in response.data]
+    
+    def _request_tokens(self, system_prompt: str, user_prompt: str) -> int:
+        """Tokens a request may consume against the TPM budget (prompt + completion)."""
+        if _RATE_LIMITER is None or not _RATE_LIMITER.tpm:
+            return 0
+        return (
+            _count_tokens(self.model, system_prompt)
+            + _count_tokens(self.model, user_prompt)
+            + _MAX_COMPLETION_TOKENS
+        )
+    
+    @staticmethod
+    def _build_messages(system_prompt: str, user_prompt: str) -> List[Dict[str, str]]:
+        return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt}
         ]
+    
+    def analyze(self, system_prompt: str, user_prompt: str,
+                on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
+        """Analyze using OpenAI's chat completion API."""
+        return self._cached(system_prompt, user_prompt, lambda: self._analyze(system_prompt, user_prompt, on_chunk))
+    
+    def _analyze(self, system_prompt: str, user_prompt: str,
+                 on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
+        """Send the request to OpenAI, retrying on rate limits."""
+        messages = self._build_messages(system_prompt, user_prompt)
+        tokens = self._request_tokens(system_prompt, user_prompt)
         
-        retries = 0
-        while retries < MAX_RETRIES:
-            try:
-                self.logger.debug(f"Sending request to OpenAI: {messages}")
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    max_tokens=3000,
-                    temperature=0.5,
-                )
+        try:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Sending request to OpenAI: %s", messages)
+            response = self._send(messages, tokens)
+            if not LLM_STREAM:
                 return self.validate_response(response)
-                
-            except RateLimitError:
-                retries += 1
-                self.logger.warning(
-                    f"Rate limit exceeded. Retrying in {RETRY_DELAY}s... ({retries}/{MAX_RETRIES})"
-                )
-                if retries >= MAX_RETRIES:
-                    raise LLMAPIError(
-                        f"Rate limit exceeded after {MAX_RETRIES} retries. Please wait or reduce query scope."
-                    )
-                time.sleep(RETRY_DELAY)
-                
-            except APIError as e:
-                raise LLMAPIError(f"OpenAI API error: {e}")
-                
-            except Exception as e:
-                raise LLMAPIError(f"Unexpected error during OpenAI analysis: {e}")
+            # Closing the stream early drops the rest of the generation
+            with response as stream:
+                text = self._collect_stream(self._stream_text(stream), on_chunk)
+            return self._validate_text(text)
+        except Exception as e:
+            raise self._api_error(e)
+    
+    async def aanalyze(self, system_prompt: str, user_prompt: str,
+                       on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
+        """Analyze using OpenAI's chat completion API without blocking the event loop."""
+        return await self._acached(
+            system_prompt, user_prompt, lambda: self._aanalyze(system_prompt, user_prompt, on_chunk)
+        )
+    
+    async def _aanalyze(self, system_prompt: str, user_prompt: str,
+                        on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
+        """Send the request to OpenAI asynchronously, retrying on rate limits."""
+        messages = self._build_messages(system_prompt, user_prompt)
+        tokens = self._request_tokens(system_prompt, user_prompt)
+        
+        try:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Sending async request to OpenAI: %s", messages)
+            response = await self._asend(messages, tokens)
+            if not LLM_STREAM:
+                return self.validate_response(response)
+            async with response as stream:
+                text = await self._acollect_stream(self._astream_text(stream), on_chunk)
+            return self._validate_text(text)
+        except Exception as e:
+            raise self._api_error(e)
+    
+    @retrying
+    def _send(self, messages: List[Dict[str, str]], tokens: int) -> Any:
+        """Issue one chat completion request, paced by the rate limiter."""
+        if _RATE_LIMITER is not None:
+            _RATE_LIMITER.acquire(tokens)
+        return self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=_MAX_COMPLETION_TOKENS,
+            temperature=self.temperature,
+            stream=LLM_STREAM,
+            **_JSON_MODE_OPTIONS
+        )
+    
+    @retrying
+    async def _asend(self, messages: List[Dict[str, str]], tokens: int) -> Any:
+        """Async variant of _send."""
+        if _RATE_LIMITER is not None:
+            await _RATE_LIMITER.aacquire(tokens)
+        return await _get_async_client().chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=_MAX_COMPLETION_TOKENS,
+            temperature=self.temperature,
+            stream=LLM_STREAM,
+            **_JSON_MODE_OPTIONS
+        )
+    
+    @staticmethod
+    def _stream_text(stream):
+        """Yield the text deltas of a streamed chat completion."""
+        for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content
+    
+    @staticmethod
+    async def _astream_text(stream):
+        """Async variant of _stream_text."""
+        async for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content
+    
+    def batch_analyze(
+        self,
+        prompts: Sequence[Tuple[str, str]],
+        interactive: bool = False,
+        poll_interval: float = _BATCH_POLL_INTERVAL
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many (system_prompt, user_prompt) pairs through the OpenAI Batch API.
+        
+        Batches are billed at half the token price but may take up to 24 hours,
+        so this is meant for offline runs. With interactive=True the prompts are
+        sent concurrently through abatch instead. Must not be called from a
+        running event loop when interactive is set.
+        
+        Args:
+            prompts: Prompt pairs to analyze
+            interactive: Use concurrent chat completions instead of a batch
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Results in the same order as the prompts. Requests that failed inside
+            the batch yield {"success": False, "error": ...} instead of raising.
+        """
+        if interactive:
+            return asyncio.run(self.abatch(prompts))
+        if not prompts:
+            return []
+        from openai import APIError
+        from openai.types.chat import ChatCompletion
+        
+        lines = [
+            json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": _BATCH_ENDPOINT,
+                "body": {
+                    "model": self.model,
+                    "messages": self._build_messages(system_prompt, user_prompt),
+                    "max_tokens": _MAX_COMPLETION_TOKENS,
+                    "temperature": self.temperature,
+                    **_JSON_MODE_OPTIONS
+                }
+            })
+            for index, (system_prompt, user_prompt) in enumerate(prompts)
+        ]
+        
+        try:
+            input_file = self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode()),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=_BATCH_ENDPOINT,
+                completion_window="24h"
+            )
+            self.logger.info("Submitted OpenAI batch %s with %d requests", batch.id, len(lines))
+            
+            while batch.status not in _BATCH_FINAL_STATES:
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+                self.logger.debug("OpenAI batch %s status: %s", batch.id, batch.status)
+            
+            records = []
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id:
+                    records.extend(self.client.files.content(file_id).text.splitlines())
+        except APIError as e:
+            raise LLMAPIError(f"OpenAI batch error: {e}")
+        
+        if batch.status != "completed" and not records:
+            raise LLMAPIError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(lines)
+        for record in records:
+            if not record.strip():
+                continue
+            item = _json_loads(record)
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                error = item.get("error") or response.get("body", {}).get("error")
+                result = {"success": False, "error": f"OpenAI batch request failed: {error}"}
+            else:
+                try:
+                    result = self.validate_response(ChatCompletion.model_validate(response["body"]))
+                except LLMAPIError as e:
+                    result = {"success": False, "error": str(e)}
+            results[int(item["custom_id"])] = result
+        
+        missing = {"success": False, "error": f"No result returned by OpenAI batch (status {batch.status})"}
+        return [result if result is not None else dict(missing) for result in results]
+    
+    @staticmethod
+    def _api_error(error: Exception) -> LLMAPIError:
+        """Map an exception from a request to the LLMAPIError raised to callers."""
+        from openai import APIError, RateLimitError
+        if isinstance(error, RateLimitError):
+            return LLMAPIError(
+                f"Rate limit exceeded after {MAX_RETRIES} retries. Please wait or reduce query scope."
+            )
+        if isinstance(error, APIError):
+            return LLMAPIError(f"OpenAI API error: {error}")
+        return LLMAPIError(f"Unexpected error during OpenAI analysis: {error}")
     
     def validate_response(self, response: Any) -> Dict[str, Any]:
         """Validate and parse OpenAI response."""
         try:
-            analysis = response.choices[0].message.content.strip()
-            self.logger.debug(f"Received response from OpenAI: {analysis[:100]}...")
+            analysis = response.choices[0].message.content
+        except Exception as e:
+            raise LLMAPIError(f"Failed to validate OpenAI response: {e}")
+        return self._validate_text(analysis)
+    
+    def _validate_text(self, analysis: str) -> Dict[str, Any]:
+        """Parse the text of an OpenAI response, complete or streamed."""
+        try:
+            analysis = analysis.strip()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Received response from OpenAI: %s...", analysis[:100])
             
-            # Clean up potential markdown formatting
-            cleaned_analysis = analysis
-            if cleaned_analysis.startswith("```json"):
-                cleaned_analysis = cleaned_analysis[7:]
-            if cleaned_analysis.startswith("```"):
-                cleaned_analysis = cleaned_analysis[3:]
-            if cleaned_analysis.endswith("```"):
-                cleaned_analysis = cleaned_analysis[:-3]
-            cleaned_analysis = cleaned_analysis.strip()
+            # Clean up potential markdown formatting (not emitted in JSON mode)
+            cleaned_analysis = analysis if LLM_JSON_MODE else self._strip_fences(analysis)
             
             try:
-                parsed_analysis = json.loads(cleaned_analysis)
+                parsed_analysis = _json_loads(cleaned_analysis)
                 return {"analysis": parsed_analysis, "success": True}
-            except json.JSONDecodeError:
-                self.logger.warning(f"OpenAI response was not valid JSON: {analysis}")
-                return {
-                    "analysis": {"raw_output": analysis},
-                    "success": True,
-                    "warning": "Non-JSON response"
-                }
+            except ValueError:  # json and orjson decode errors both subclass it
+                self.logger.warning("OpenAI response was not valid JSON: %s", analysis)
+                result = _NON_JSON_TEMPLATE.copy()
+                result["analysis"] = {"raw_output": analysis}
+                return result
                 
         except Exception as e:
-            raise LLMAPIError(f"Failed to validate OpenAI response: {e}") 
\ No newline at end of file
+            raise LLMAPIError(f"Failed to validate OpenAI response: {e}")
@@ -0,0 +1,75 @@
+"""Client-side request/token rate limiting for LLM providers."""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Paces calls to stay under requests-per-minute and tokens-per-minute budgets.
+
+    Each budget is a bucket that refills continuously at limit/60 per second and
+    holds at most one minute's worth. A limit of 0 disables that budget.
+    acquire() blocks until both buckets can cover the call, so bursts are
+    spread out up front instead of being rejected with 429s and retried.
+    """
+
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take capacity for one request if available; otherwise return the seconds to wait."""
+        with self._lock:
+            self._refill(time.monotonic())
+            # A single call larger than the whole budget can only wait for a full bucket
+            tokens = min(tokens, self.tpm) if self.tpm else 0
+            wait = 0.0
+            if self.rpm and self._requests < 1:
+                wait = max(wait, (1 - self._requests) * 60 / self.rpm)
+            if self.tpm and self._tokens < tokens:
+                wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+            if wait:
+                return wait
+            if self.rpm:
+                self._requests -= 1
+            if self.tpm:
+                self._tokens -= tokens
+            return 0.0
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until one request using `tokens` tokens fits within the budgets."""
+        while True:
+            wait = self._try_acquire(tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """Async variant of acquire."""
+        while True:
+            wait = self._try_acquire(tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+def make_bucket(rpm: int, tpm: int) -> Optional[TokenBucket]:
+    """Build a bucket for the given limits, or None when both are disabled."""
+    if not rpm and not tpm:
+        return None
+    return TokenBucket(rpm=rpm, tpm=tpm)
@@ -1,7 +1,8 @@
 """ReAct module for K8s Analyzer."""
 
+from functools import lru_cache
 from typing import Type, Optional
-from .base import BaseReActAgent, AgentState
+from .base import BaseReActAgent, AgentState, Interaction
 from .agent import ReActAgent
 from .config import (
     MAX_ITERATIONS,
@@ -28,6 +29,7 @@ __all__ = [
     "BaseReActAgent",
     "ReActAgent",
     "AgentState",
+    "Interaction",
     "ReActError",
     "ReActConfigError",
     "ReActStateError",
@@ -45,6 +47,18 @@ __all__ = [
     "get_prompt_template"
 ]
 
+@lru_cache(maxsize=None)
+def _check_agent_class(agent_class: Type[BaseReActAgent]) -> None:
+    """
+    Raise ReActConfigError unless agent_class is a BaseReActAgent subclass.
+    
+    Classes that pass are remembered, so each is only checked once.
+    """
+    if not issubclass(agent_class, BaseReActAgent):
+        raise ReActConfigError(
+            f"Agent class {agent_class.__name__} must inherit from BaseReActAgent"
+        )
+
 def get_agent(
     agent_class: Optional[Type[BaseReActAgent]] = None,
     **kwargs
@@ -52,6 +66,9 @@ def get_agent(
     """
     Factory function to get a ReAct agent instance.
     
+    Every call returns a new agent, so callers never share state, logs or
+    approved actions.
+    
     Args:
         agent_class: Optional agent class override
         **kwargs: Additional configuration for the agent
@@ -63,8 +80,5 @@ def get_agent(
         ReActConfigError: If configuration is invalid
     """
     agent_class = agent_class or ReActAgent
-    if not issubclass(agent_class, BaseReActAgent):
-        raise ReActConfigError(
-            f"Agent class {agent_class.__name__} must inherit from BaseReActAgent"
-        )
+    _check_agent_class(agent_class)
     return agent_class(**kwargs)
@@ -1,17 +1,19 @@
 """ReAct agent implementation for K8s Analyzer."""
 
-import uuid
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import json
 import logging
-from typing import Dict, Any, List, Optional, Tuple, Type
+import logging.handlers
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Type
 from datetime import datetime
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.prompt import Confirm, Prompt
+from functools import cached_property
 import os
 import inspect
 import re
+import sys
+import time
 
 from .base import BaseReActAgent, AgentState
 from ..tools.result import ToolResult
@@ -19,6 +21,8 @@ from .config import (
     MAX_ITERATIONS,
     THOUGHT_PROCESS_TIMEOUT,
     ACTION_EXECUTION_TIMEOUT,
+    MAX_PARALLEL_ACTIONS,
+    TOOL_RESULT_CACHE_TTL,
     HITL_ENABLED,
     HITL_TIMEOUT,
     HITL_AUTO_APPROVE_SAFE_ACTIONS,
@@ -45,9 +49,83 @@ from .exceptions import (
 )
 from ..llm import get_llm, LLMError
 from ..tools import get_tool_registry, ToolError, ToolRegistry
-from ..llm.base import BaseLLM
+from ..llm.base import BaseLLM, JsonObjectScanner, is_decision
+from ..llm.cache import LLMCache
 from ..llm.exceptions import LLMResponseError
-from ..tools.result import ToolResultEncoder
+
+try:
+    import orjson
+    from orjson import loads as _json_loads
+except ImportError:  # Optional: fall back to the stdlib codec
+    orjson = None
+    from json import loads as _json_loads
+
+# Parsed decisions for deterministic prompts, keyed like BaseLLM._cached, so a
+# repeated step also skips searching and validating the reply
+decision_cache = LLMCache()
+
+# Fixed messages for aborts from the HITL prompt
+_ABORT_USER = "User aborted execution."
+_ABORT_INTERRUPT = "User aborted execution via KeyboardInterrupt."
+_ABORT_EOF = "Execution aborted due to closed input stream."
+
+# Separator around the HITL review panel
+_SEP = "-" * 40
+
+# Execution log records buffered before a write to the log file
+_EXECUTION_LOG_BUFFER = 1024
+
+# Stray fences around a bare JSON string
+_JSON_FENCE_RE = re.compile(r"^```json\s*|\s*```$", re.MULTILINE)
+
+
+def _accepts_on_chunk(llm: Any) -> bool:
+    """Whether the LLM's analyze() takes an on_chunk streaming callback."""
+    try:
+        return "on_chunk" in inspect.signature(llm.analyze).parameters
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """Convert a tool result to JSON-native types; other history values already are."""
+    return obj.to_dict() if isinstance(obj, ToolResult) else obj
+
+
+def _tool_default(obj: Any) -> Any:
+    """JSON default hook: ToolResult via to_dict(), datetimes as ISO strings, anything else as str()."""
+    if isinstance(obj, ToolResult):
+        return obj.to_dict()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _tool_description_lines(descriptions: Dict[str, Dict[str, Any]]) -> Iterator[str]:
+    """Yield the prompt lines describing each tool and its parameters."""
+    for name, desc_data in descriptions.items():
+        yield f"- `{name}`: {desc_data.get('description', 'No description')}"
+        parameters = desc_data.get('parameters')
+        if parameters:
+            # Simple parameter formatting
+            param_str = ", ".join(f"{k} ({v.get('type', 'any')})" for k, v in parameters.items())
+            yield f"  Parameters: {param_str}"
+
+
+def _dumps(value: Any, indent: bool = False) -> str:
+    """Serialize to JSON (compact, or 2-space indented), using orjson when installed."""
+    if orjson is not None:
+        # Dataclasses are passed through so ToolResult goes via to_dict()
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(value, default=_tool_default, option=option).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles these
+    if indent:
+        return json.dumps(value, indent=2, default=_tool_default)
+    return json.dumps(value, separators=(",", ":"), default=_tool_default)
 
 class ReActState:
     pass
@@ -59,21 +137,35 @@ class ReActAgent(BaseReActAgent):
     def __init__(self, llm: BaseLLM, tools: ToolRegistry):
         """Initialize the ReAct agent with pre-configured LLM and ToolRegistry."""
         self.logger = logging.getLogger("k8s_analyzer.react.agent")
-        self.console = Console()
         
         # Assign the provided llm and tools instances
         self.llm = llm
         self.tools = tools
+        # Streamed replies are scanned for the decision object as they arrive
+        self._stream_decisions = _accepts_on_chunk(llm)
+        # tool name -> whether its results may be reused (see _is_read_only)
+        self._read_only_tools: Dict[str, bool] = {}
             
         # Initialize state
         self.state: Optional[AgentState] = None
         # Add placeholder for execution_logger if needed immediately
         self.execution_logger = None 
+        # Path of the execution log file once analyze_question() has set it up
+        self.log_file: Optional[str] = None
+        # Built once and reused so the system prefix is byte-identical across
+        # iterations (and eligible for provider-side prompt caching)
+        self._system_prompt: Optional[str] = None
+        self._tool_descriptions: Optional[str] = None
+        # Registry version the two strings above were built from
+        self._tools_version: Optional[int] = None
+        # (context, rendered question/context lines) for the current analysis;
+        # the context does not change between iterations
+        self._prompt_header: Optional[Tuple[Dict[str, Any], str]] = None
         
     def initialize_state(self, session_id: Optional[str] = None, **kwargs) -> None:
         """Initialize or reset the agent state."""
         self.state = AgentState(
-            session_id=session_id or str(uuid.uuid4()),
+            session_id=session_id or os.urandom(8).hex(),
             history=[],
             context={},
             max_iterations=kwargs.get("max_iterations", MAX_ITERATIONS),
@@ -102,9 +194,121 @@ class ReActAgent(BaseReActAgent):
         Returns:
             A dictionary containing the final analysis result or an error.
         """
+        initial_context = self._start_analysis(question, context, log_dir)
+        feedback = initial_feedback
+
+        try:
+            for i in range(self.state.max_iterations):
+                try:
+                    final_answer, feedback = self._run_iteration(i, initial_context, feedback)
+                except Exception as e:
+                    return self._iteration_error(i, e)
+                if final_answer is not None:
+                    return final_answer # End of loop
+
+            return self._max_iterations_result()
+        finally:
+            # Write out buffered execution log records
+            self._flush_execution_log()
+
+    async def analyze_question_async(
+        self,
+        question: str,
+        context: Optional[Dict[str, Any]] = None,
+        log_dir: str = "logs",
+        initial_feedback: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of analyze_question.
+
+        LLM calls are awaited (bounded by THOUGHT_PROCESS_TIMEOUT) and tool
+        execution and HITL prompts run in worker threads, so several analyses
+        can share one event loop.
+        """
+        initial_context = self._start_analysis(question, context, log_dir)
+        feedback = initial_feedback
+
+        try:
+            for i in range(self.state.max_iterations):
+                try:
+                    final_answer, feedback = await self._arun_iteration(i, initial_context, feedback)
+                except Exception as e:
+                    return self._iteration_error(i, e)
+                if final_answer is not None:
+                    return final_answer
+
+            return self._max_iterations_result()
+        finally:
+            # Write out buffered execution log records
+            self._flush_execution_log()
+
+    def _run_iteration(
+        self,
+        iteration: int,
+        initial_context: Dict[str, Any],
+        feedback: Optional[str]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Run one ReAct step: prompt, decide, confirm and act.
+
+        Returns:
+            (final answer, None) to end the loop, or (None, feedback for the next step)
+        """
+        # 1. Build Prompts
+        system_prompt, user_prompt = self._build_prompts(iteration, initial_context, feedback)
+
+        # 2-3. Query the LLM and parse its decision
+        proposed_decision, feedback = self._get_decision(system_prompt, user_prompt)
+        if proposed_decision is None:
+            return None, feedback # Retry the loop with feedback
+
+        # 4. Process Decision (Final Answer or Action)
+        if self._is_final_answer(proposed_decision):
+            return proposed_decision, None
+
+        # 5. Get User Confirmation
+        actions = self._approve_actions(proposed_decision)
+
+        # 6. Execute Action(s); independent actions run concurrently
+        if len(actions) == 1:
+            outcomes = [self._run_action(actions[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(actions), MAX_PARALLEL_ACTIONS)) as pool:
+                outcomes = list(pool.map(self._run_action, actions))
+        return None, self._record_outcomes(actions, outcomes)
+
+    async def _arun_iteration(
+        self,
+        iteration: int,
+        initial_context: Dict[str, Any],
+        feedback: Optional[str]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Async variant of _run_iteration."""
+        system_prompt, user_prompt = self._build_prompts(iteration, initial_context, feedback)
+
+        proposed_decision, feedback = await self._aget_decision(system_prompt, user_prompt)
+        if proposed_decision is None:
+            return None, feedback
+
+        if self._is_final_answer(proposed_decision):
+            return proposed_decision, None
+
+        # Confirmation may block on console input
+        actions = await asyncio.to_thread(self._approve_actions, proposed_decision)
+
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(self._run_action, action) for action in actions)
+        )
+        return None, self._record_outcomes(actions, outcomes)
+
+    def _start_analysis(
+        self,
+        question: str,
+        context: Optional[Dict[str, Any]],
+        log_dir: str
+    ) -> Dict[str, Any]:
+        """Ensure state and the execution log exist, and build the initial context."""
         if not self.state or not self.state.session_id:
-             # Ensure state exists. Use ReActState if that's the correct class, else AgentState
-             # Assuming AgentState based on previous diff:
             self.state = AgentState()
         self.logger.info(f"Initialized/Using agent state with session {self.state.session_id}")
 
@@ -118,13 +322,16 @@ class ReActAgent(BaseReActAgent):
             # Prevent propagation to root logger if desired
             # self.execution_logger.propagate = False
             # Remove existing handlers to avoid duplicates if re-analyzing
-            for handler in self.execution_logger.handlers[:]:
-                handler.close()
-                self.execution_logger.removeHandler(handler)
-            file_handler = logging.FileHandler(log_file)
+            self._close_execution_log()
+            file_handler = logging.FileHandler(log_file, delay=True)
             formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
             file_handler.setFormatter(formatter)
-            self.execution_logger.addHandler(file_handler)
+            # Records are written in batches rather than one write per record;
+            # errors (and the end of each analysis) flush the buffer
+            self.execution_logger.addHandler(
+                logging.handlers.MemoryHandler(_EXECUTION_LOG_BUFFER, flushLevel=logging.ERROR, target=file_handler)
+            )
+            self.log_file = log_file
             self.logger.info(f"Execution log will be saved to: {log_file}")
         # --- End Execution Logging Setup ---
 
@@ -137,159 +344,373 @@ class ReActAgent(BaseReActAgent):
         initial_context["question"] = question
         # We'll add tool descriptions later
         initial_context["tools"] = "Tool descriptions placeholder."
+        self._prompt_header = None
+        return initial_context
 
-        feedback = initial_feedback
+    def _flush_execution_log(self) -> None:
+        """Write buffered execution log records to the log file."""
+        if self.execution_logger:
+            for handler in self.execution_logger.handlers:
+                handler.flush()
 
-        for i in range(self.state.max_iterations):
-            self.logger.info(f"Iteration {i+1}/{self.state.max_iterations}")
-            self.execution_logger.info(f"\n--- Iteration {i+1}/{self.state.max_iterations} ---")
+    def _close_execution_log(self) -> None:
+        """Flush and detach the execution logger's handlers, closing the log file."""
+        if not self.execution_logger:
+            return
+        for handler in self.execution_logger.handlers[:]:
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
+            self.execution_logger.removeHandler(handler)
 
-            try:
-                # <<< REPLACE PLACEHOLDER WITH CORE LOGIC >>>
-                # 1. Build Prompts
-                self.execution_logger.info("Building prompts...")
-                system_prompt = self._build_system_prompt()
-                user_prompt = self._build_user_prompt(initial_context, feedback=feedback)
-                feedback = None # Reset feedback after using it in the prompt
-                self.execution_logger.debug(f"System Prompt:\n{system_prompt}")
-                self.execution_logger.debug(f"User Prompt:\n{user_prompt}")
-
-                if not user_prompt or not user_prompt.strip():
-                    self.logger.error("User prompt content is empty or invalid. Cannot proceed.")
-                    self.execution_logger.error("User prompt content is empty or invalid.")
-                    raise ReActError("User prompt content is empty or invalid.")
-
-                # 2. Generate LLM Response
-                self.execution_logger.info("Querying LLM...")
-                # Use the analyze method from the LLM wrapper
-                # Ensure the LLM's analyze method is compatible (takes system_prompt, user_prompt)
-                # Check signature if needed (code removed for clarity, assume compatible)
-                llm_response_raw = self.llm.analyze(system_prompt=system_prompt, user_prompt=user_prompt)
-                
-                # Check if the response format indicates success or failure from the LLM wrapper itself
-                if isinstance(llm_response_raw, dict) and not llm_response_raw.get('success', True):
-                    error_msg = llm_response_raw.get('error', 'LLM analysis failed internally.')
-                    self.logger.error(f"LLM analysis returned failure: {error_msg}")
-                    self.execution_logger.error(f"LLM analysis returned failure: {error_msg}")
-                    # Provide feedback for retry or raise error
-                    feedback = f"The LLM analysis failed: {error_msg}. Please try again or adjust the approach."
-                    continue # Retry the loop
-                    
-                # Extract the actual string content to parse
-                # Assuming the successful response is a string or can be converted
-                if isinstance(llm_response_raw, dict):
-                     # Adapt based on actual LLM wrapper output structure
-                     llm_content = llm_response_raw.get('analysis', {}).get('raw_output') 
-                     if not llm_content: 
-                          llm_content = llm_response_raw.get('raw_output') # Try another common key
-                     if not llm_content:
-                          llm_content = str(llm_response_raw) # Fallback
-                else:
-                     llm_content = str(llm_response_raw)
-                     
-                self.execution_logger.info(f"LLM Raw Response Content:\n{llm_content}")
-
-                # 3. Extract Reasoning and Parse JSON Decision
-                reasoning_text, json_block = self._extract_reasoning_and_json(llm_content)
-                self.state.add_interaction("llm", reasoning_text if reasoning_text else llm_content) 
-                if reasoning_text:
-                    self.logger.info(f"LLM Reasoning: {reasoning_text}")
-                    self.execution_logger.info(f"LLM Reasoning:\n{reasoning_text}")
-                else:
-                    self.logger.warning("Could not extract separate reasoning from LLM response.")
-                    self.execution_logger.warning("Could not extract separate reasoning.")
+    def _log_json(self, value: Any) -> None:
+        """Write a value to the execution log as compact JSON, if INFO is enabled."""
+        if self.execution_logger.isEnabledFor(logging.INFO):
+            self.execution_logger.info(_dumps(value))
 
-                if not json_block:
-                    self.logger.error("LLM response did not contain a valid JSON block.")
-                    self.execution_logger.error("LLM response did not contain a valid JSON block.")
-                    feedback = "Your response did not contain the required JSON block. Please provide the action or final answer in the specified JSON format." 
-                    continue # Retry the loop with feedback
+    def _build_prompts(
+        self,
+        iteration: int,
+        initial_context: Dict[str, Any],
+        feedback: Optional[str]
+    ) -> Tuple[str, str]:
+        """Build the system and user prompts for one iteration."""
+        self.logger.info(f"Iteration {iteration+1}/{self.state.max_iterations}")
+        self.execution_logger.info(f"\n--- Iteration {iteration+1}/{self.state.max_iterations} ---")
 
-                proposed_decision = self._parse_llm_response(json_block)
-                self.execution_logger.info(f"Parsed Decision: {proposed_decision}")
-
-                # 4. Process Decision (Final Answer or Action)
-                if proposed_decision["type"] == "final_answer":
-                    self.logger.info(f"Final Answer Proposed: {proposed_decision.get('main_response', 'N/A')}")
-                    self.execution_logger.info(f"--- Final Answer Proposed ---")
-                    self.execution_logger.info(json.dumps(proposed_decision, indent=2))
-                    # Optionally format before returning
-                    # final_formatted = self._format_final_answer(proposed_decision)
-                    return proposed_decision # End of loop
-
-                elif proposed_decision["type"] == "action":
-                    action = proposed_decision["action"]
-                    self.logger.info(f"Action Proposed: Tool={action.get('tool')}, Params={action.get('parameters')}")
-                    self.execution_logger.info("--- Action Proposed ---")
-                    self.execution_logger.info(json.dumps(action, indent=2))
-
-                    # 5. Get User Confirmation
-                    confirmation = self._get_user_confirmation(action)
-                    # If confirmation is False (i.e., user said 'no'), ReActAbortError is raised inside the method
-                    self.logger.info(f"User approved action: {action}")
-                    self.execution_logger.info("User approved action.")
-
-                    # 6. Execute Action
-                    tool_name = action.get("tool")
-                    tool_params = action.get("parameters", {})
-                    self.execution_logger.info(f"Executing action: {tool_name} with params: {tool_params}")
-                    
-                    try:
-                        # Use ToolRegistry to execute
-                        result = self.tools.execute_tool(tool_name, **tool_params)
-                        
-                        self.logger.info(f"Action Result: {result}") # Log raw result
-                        self.execution_logger.info("--- Action Result ---")
-                        # Use ToolResultEncoder for JSON serialization
-                        self.execution_logger.info(json.dumps(result, indent=2, cls=ToolResultEncoder))
-                        
-                        # Add interaction with the result
-                        self.state.add_interaction("tool", result, action=action)
-                        
-                        if isinstance(result, ToolResult) and not result.success:
-                             self.logger.warning(f"Tool execution reported failure: {result.error}")
-                             feedback = f"The tool '{tool_name}' reported an error: {result.error}. Please analyze and proceed."
-                        elif isinstance(result, dict) and not result.get("success", True):
-                             error_msg = result.get("error", "Unknown error")
-                             self.logger.warning(f"Tool execution failed: {error_msg}")
-                             feedback = f"The tool '{tool_name}' failed: {error_msg}. Please analyze and proceed."
-                             
-                    except Exception as tool_exec_err:
-                        self.logger.error(f"Tool execution raised exception: {tool_exec_err}", exc_info=True)
-                        self.execution_logger.error(f"Tool execution raised exception: {tool_exec_err}", exc_info=True)
-                        error_result = {"success": False, "tool": tool_name, "error": str(tool_exec_err)}
-                        self.state.add_interaction("tool", error_result, action=action)
-                        self.execution_logger.info("--- Action Failed (Exception) ---")
-                        self.execution_logger.info(json.dumps(error_result, indent=2))
-                        feedback = f"Executing tool '{tool_name}' raised an error: {tool_exec_err}. Please analyze and proceed."
+        self.execution_logger.info("Building prompts...")
+        system_prompt = self._build_system_prompt()
+        user_prompt = self._build_user_prompt(initial_context, feedback=feedback)
+        self.execution_logger.debug("System Prompt:\n%s", system_prompt)
+        self.execution_logger.debug("User Prompt:\n%s", user_prompt)
 
-                else:
-                    # Should not happen if parsing is correct
-                    self.logger.error(f"Unknown decision type from LLM: {proposed_decision.get('type')}")
-                    self.execution_logger.error(f"Unknown decision type from LLM: {proposed_decision.get('type')}")
-                    raise LLMResponseError(f"Unknown decision type from LLM: {proposed_decision.get('type')}")
-                # <<< END OF CORE LOGIC >>>
-
-            except (LLMResponseError, ReActError, ReActAbortError) as e:
-                self.logger.error(f"Error in ReAct iteration {i+1}: {e}", exc_info=True)
-                self.execution_logger.error(f"--- Error in Iteration {i+1} ---")
-                self.execution_logger.error(f"{type(e).__name__}: {e}", exc_info=True)
-                if isinstance(e, ReActAbortError):
-                     return {"type": "error", "error_type": "UserAbort", "message": str(e)}
-                # Provide feedback for recoverable errors? Maybe retry?
-                # For now, return generic error for others
-                return {"type": "error", "error_type": type(e).__name__, "message": str(e)}
-            except Exception as e:
-                 self.logger.error(f"Unexpected error in ReAct iteration {i+1}: {e}", exc_info=True)
-                 self.execution_logger.error(f"--- Unexpected Error in Iteration {i+1} ---")
-                 self.execution_logger.error(f"Unexpected {type(e).__name__}: {e}", exc_info=True)
-                 return {"type": "error", "error_type": "UnexpectedError", "message": str(e)}
-
-        # --- Max Iterations Reached Handling --- 
+        if not user_prompt or not user_prompt.strip():
+            self.logger.error("User prompt content is empty or invalid. Cannot proceed.")
+            self.execution_logger.error("User prompt content is empty or invalid.")
+            raise ReActError("User prompt content is empty or invalid.")
+        return system_prompt, user_prompt
+
+    def _is_final_answer(self, proposed_decision: Dict[str, Any]) -> bool:
+        """Log and report whether the decision ends the loop."""
+        if proposed_decision["type"] != "final_answer":
+            return False
+        self.logger.info(f"Final Answer Proposed: {proposed_decision.get('main_response', 'N/A')}")
+        self.execution_logger.info(f"--- Final Answer Proposed ---")
+        self._log_json(proposed_decision)
+        self.state.add_interaction("final_answer", proposed_decision)
+        # Optionally format before returning
+        # final_formatted = self._format_final_answer(proposed_decision)
+        return True
+
+    def _approve_actions(self, proposed_decision: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get confirmation for an action or parallel_actions decision.
+
+        Returns:
+            The approved actions, in the order proposed
+
+        Raises:
+            LLMResponseError: If the decision type is unknown
+            ReActAbortError: If the user rejects an action
+        """
+        if proposed_decision["type"] == "action":
+            actions = [proposed_decision["action"]]
+        elif proposed_decision["type"] == "parallel_actions":
+            actions = proposed_decision["actions"]
+        else:
+            # Should not happen if parsing is correct
+            self.logger.error(f"Unknown decision type from LLM: {proposed_decision.get('type')}")
+            self.execution_logger.error(f"Unknown decision type from LLM: {proposed_decision.get('type')}")
+            raise LLMResponseError(f"Unknown decision type from LLM: {proposed_decision.get('type')}")
+        return [self._approve_action(action) for action in actions]
+
+    def _approve_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        """Log a proposed action and get confirmation for it (see _get_user_confirmation)."""
+        self.logger.info(f"Action Proposed: Tool={action.get('tool')}, Params={action.get('parameters')}")
+        self.execution_logger.info("--- Action Proposed ---")
+        self._log_json(action)
+
+        confirmation = self._get_user_confirmation(action)
+        # If confirmation is False (i.e., user said 'no'), ReActAbortError is raised inside the method
+        self.logger.info(f"User approved action: {action}")
+        self.execution_logger.info("User approved action.")
+        self.execution_logger.info(f"Executing action: {action.get('tool')} with params: {action.get('parameters', {})}")
+        return action
+
+    def _run_action(self, action: Dict[str, Any]) -> Any:
+        """
+        Execute an action, returning the exception instead of raising it.
+
+        Successful results of read-only tools are reused for identical calls
+        within TOOL_RESULT_CACHE_TTL seconds in the same session.
+        """
+        tool_name = action.get("tool")
+        tool_params = action.get("parameters", {})
+        cache_key = None
+        if TOOL_RESULT_CACHE_TTL > 0 and self._is_read_only(tool_name):
+            cache_key = (tool_name, json.dumps(tool_params, sort_keys=True, default=str))
+            cached = self.state.tool_results.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                self.execution_logger.info(f"Reusing cached result for {tool_name} (cache hit).")
+                return cached[1]
+        try:
+            # Use ToolRegistry to execute
+            result = self.tools.execute_tool(tool_name, **tool_params)
+        except Exception as tool_exec_err:
+            return tool_exec_err
+        if cache_key is not None and getattr(result, "success", False):
+            self.state.tool_results[cache_key] = (time.monotonic() + TOOL_RESULT_CACHE_TTL, result)
+        return result
+
+    def _is_read_only(self, tool_name: str) -> bool:
+        """Whether a tool only reads cluster state: listed in SAFE_ACTIONS or not dangerous."""
+        read_only = self._read_only_tools.get(tool_name)
+        if read_only is None:
+            if tool_name in SAFE_ACTIONS:
+                read_only = True
+            else:
+                try:
+                    read_only = self.tools.get_tool(tool_name).is_dangerous is False
+                except Exception:
+                    read_only = False # Unknown tools are never cached
+            self._read_only_tools[tool_name] = read_only
+        return read_only
+
+    def _record_outcomes(self, actions: List[Dict[str, Any]], outcomes: List[Any]) -> Optional[str]:
+        """
+        Add action results (or exceptions) to the history in the order proposed.
+
+        Returns:
+            Combined feedback for the next prompt, or None if every action succeeded
+        """
+        feedback = []
+        for action, outcome in zip(actions, outcomes):
+            if isinstance(outcome, Exception):
+                feedback.append(self._record_tool_error(action, outcome))
+            else:
+                feedback.append(self._record_tool_result(action, outcome))
+        return " ".join(item for item in feedback if item) or None
+
+    def _record_tool_result(self, action: Dict[str, Any], result: Any) -> Optional[str]:
+        """
+        Add a tool result to the history.
+
+        Returns:
+            Feedback for the next prompt if the tool reported a failure, else None
+        """
+        tool_name = action.get("tool")
+        self.logger.info(f"Action Result: {result}") # Log raw result
+        self.execution_logger.info("--- Action Result ---")
+
+        # Add interaction with the result
+        self._add_tool_interaction(action, result)
+
+        if self.state.result_success[-1] is not False:
+             return None
+        if isinstance(result, ToolResult):
+             self.logger.warning(f"Tool execution reported failure: {result.error}")
+             return f"The tool '{tool_name}' reported an error: {result.error}. Please analyze and proceed."
+        elif isinstance(result, dict):
+             error_msg = result.get("error", "Unknown error")
+             self.logger.warning(f"Tool execution failed: {error_msg}")
+             return f"The tool '{tool_name}' failed: {error_msg}. Please analyze and proceed."
+        return None
+
+    def _record_tool_error(self, action: Dict[str, Any], tool_exec_err: Exception) -> str:
+        """Add a failed tool execution to the history and return feedback for the next prompt."""
+        tool_name = action.get("tool")
+        # The traceback goes to the execution log only; the agent reports the error and moves on
+        self.logger.error("Tool execution raised exception: %s", tool_exec_err)
+        self.execution_logger.error("Tool execution raised exception: %s", tool_exec_err, exc_info=True)
+        error_result = {"success": False, "tool": tool_name, "error": str(tool_exec_err)}
+        self.execution_logger.info("--- Action Failed (Exception) ---")
+        self._add_tool_interaction(action, error_result)
+        return f"Executing tool '{tool_name}' raised an error: {tool_exec_err}. Please analyze and proceed."
+
+    def _add_tool_interaction(self, action: Dict[str, Any], result: Any) -> None:
+        """
+        Log a tool result and add it to the history.
+
+        The result is encoded once; the same compact JSON is written to the
+        execution log and kept on the entry for the prompt history.
+        """
+        encoded = _dumps(result)
+        self.execution_logger.info(encoded)
+        self.state.add_interaction("tool", result, action=action, encoded=encoded)
+
+    def _iteration_error(self, iteration: int, e: Exception) -> Dict[str, Any]:
+        """Log an error that ended the loop and build the error result."""
+        if isinstance(e, (LLMResponseError, ReActError, ReActAbortError)):
+            self.logger.error(f"Error in ReAct iteration {iteration+1}: {e}", exc_info=True)
+            self.execution_logger.error(f"--- Error in Iteration {iteration+1} ---")
+            self.execution_logger.error(f"{type(e).__name__}: {e}", exc_info=True)
+            if isinstance(e, ReActAbortError):
+                 return {"type": "error", "error_type": "UserAbort", "message": str(e)}
+            # Provide feedback for recoverable errors? Maybe retry?
+            # For now, return generic error for others
+            return {"type": "error", "error_type": type(e).__name__, "message": str(e)}
+        self.logger.error(f"Unexpected error in ReAct iteration {iteration+1}: {e}", exc_info=True)
+        self.execution_logger.error(f"--- Unexpected Error in Iteration {iteration+1} ---")
+        self.execution_logger.error(f"Unexpected {type(e).__name__}: {e}", exc_info=True)
+        return {"type": "error", "error_type": "UnexpectedError", "message": str(e)}
+
+    def _max_iterations_result(self) -> Dict[str, Any]:
+        """Error result for a loop that ran out of iterations."""
         self.logger.warning(f"Reached maximum iterations ({self.state.max_iterations}) without a final answer.")
-        # ... (Return MaxIterationsReached error as defined before) ...
         return {"type": "error", "error_type": "MaxIterationsReached", "message": "Max iterations reached."}
-        
+
+    def _get_decision(
+        self,
+        system_prompt: str,
+        user_prompt: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Query the LLM and parse its decision.
+
+        Deterministic (temperature 0) replies are cached per prompt pair as the
+        parsed decision, so a repeated step skips both the LLM call and parsing.
+
+        Returns:
+            (decision, None), or (None, feedback for the next iteration) when
+            the reply could not be used
+        """
+        cache_key = self._decision_cache_key(system_prompt, user_prompt)
+        cached = self._cached_decision(cache_key)
+        if cached is not None:
+            return cached, None
+
+        # 2. Generate LLM Response
+        self.execution_logger.info("Querying LLM...")
+        if not self._stream_decisions:
+            llm_response_raw = self.llm.analyze(system_prompt=system_prompt, user_prompt=user_prompt)
+            return self._decision_from_reply(llm_response_raw, cache_key=cache_key)
+        scanner = JsonObjectScanner(is_decision)
+        llm_response_raw = self.llm.analyze(system_prompt=system_prompt, user_prompt=user_prompt, on_chunk=scanner.feed)
+        return self._decision_from_reply(llm_response_raw, scanner, cache_key)
+
+    async def _aget_decision(
+        self,
+        system_prompt: str,
+        user_prompt: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Async variant of _get_decision, bounded by THOUGHT_PROCESS_TIMEOUT."""
+        cache_key = self._decision_cache_key(system_prompt, user_prompt)
+        cached = self._cached_decision(cache_key)
+        if cached is not None:
+            return cached, None
+
+        self.execution_logger.info("Querying LLM...")
+        scanner = JsonObjectScanner(is_decision) if self._stream_decisions else None
+        kwargs = {"on_chunk": scanner.feed} if scanner is not None else {}
+        try:
+            llm_response_raw = await asyncio.wait_for(
+                self.llm.aanalyze(system_prompt=system_prompt, user_prompt=user_prompt, **kwargs),
+                timeout=THOUGHT_PROCESS_TIMEOUT
+            )
+        except asyncio.TimeoutError as e:
+            raise ReActTimeoutError(f"LLM did not respond within {THOUGHT_PROCESS_TIMEOUT}s") from e
+        return self._decision_from_reply(llm_response_raw, scanner, cache_key)
+
+    def _decision_cache_key(self, system_prompt: str, user_prompt: str) -> Optional[str]:
+        """Key of a prompt pair in decision_cache, or None when the LLM's replies are not deterministic."""
+        if getattr(self.llm, "temperature", None) != 0:
+            return None
+        return LLMCache.make_key(getattr(self.llm, "model", None), system_prompt, user_prompt, 0)
+
+    def _cached_decision(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached decision for `cache_key` (recording its reasoning), or None."""
+        if cache_key is None:
+            return None
+        cached = decision_cache.get(cache_key)
+        if cached is None:
+            return None
+        self.execution_logger.info("Reusing cached LLM decision.")
+        self.state.add_interaction("llm", cached["reasoning"])
+        # Final answers are handed to the caller, so entries are never shared
+        return copy.deepcopy(cached["decision"])
+
+    def _decision_from_reply(
+        self,
+        llm_response_raw: Any,
+        scanner: Optional[JsonObjectScanner] = None,
+        cache_key: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Extract and parse the decision in an LLM reply (see _get_decision).
+
+        When the reply was streamed through `scanner`, the decision object was
+        already located as the chunks arrived; otherwise the text is searched.
+        A parsed decision is stored under `cache_key` when one is given.
+        """
+        # Check if the response format indicates success or failure from the LLM wrapper itself
+        if isinstance(llm_response_raw, dict) and not llm_response_raw.get('success', True):
+            error_msg = llm_response_raw.get('error', 'LLM analysis failed internally.')
+            self.logger.error(f"LLM analysis returned failure: {error_msg}")
+            self.execution_logger.error(f"LLM analysis returned failure: {error_msg}")
+            # Provide feedback for retry
+            return None, f"The LLM analysis failed: {error_msg}. Please try again or adjust the approach."
+            
+        # Extract the actual string content to parse
+        # Assuming the successful response is a string or can be converted
+        if isinstance(llm_response_raw, dict):
+             # Adapt based on actual LLM wrapper output structure
+             llm_content = llm_response_raw.get('analysis', {}).get('raw_output') 
+             if not llm_content: 
+                  llm_content = llm_response_raw.get('raw_output') # Try another common key
+             if not llm_content:
+                  llm_content = str(llm_response_raw) # Fallback
+        else:
+             llm_content = str(llm_response_raw)
+             
+        self.execution_logger.info(f"LLM Raw Response Content:\n{llm_content}")
+
+        # 3. Extract Reasoning and Parse JSON Decision
+        split = scanner.split() if scanner is not None else None
+        proposed_decision = None
+        if split is not None:
+            # Streaming stops at the closing brace, so a ```json fence is never closed
+            reasoning_text, json_block = self._strip_open_fence(split[0]), split[1]
+            try:
+                proposed_decision = self._parse_llm_response(json_block)
+            except LLMResponseError as e:
+                # The object the stream stopped at may not be the decision;
+                # search the text the way unstreamed replies are searched
+                self.logger.warning("Streamed decision object was invalid (%s); searching the full reply", e)
+                split = None
+        if split is None:
+            reasoning_text, json_block = self._extract_reasoning_and_json(llm_content)
+        self.state.add_interaction("llm", reasoning_text if reasoning_text else llm_content) 
+        if reasoning_text:
+            self.logger.info(f"LLM Reasoning: {reasoning_text}")
+            self.execution_logger.info(f"LLM Reasoning:\n{reasoning_text}")
+        else:
+            self.logger.warning("Could not extract separate reasoning from LLM response.")
+            self.execution_logger.warning("Could not extract separate reasoning.")
+
+        if not json_block:
+            self.logger.error("LLM response did not contain a valid JSON block.")
+            self.execution_logger.error("LLM response did not contain a valid JSON block.")
+            return None, "Your response did not contain the required JSON block. Please provide the action or final answer in the specified JSON format."
+
+        if proposed_decision is None:
+            try:
+                proposed_decision = self._parse_llm_response(json_block)
+            except LLMResponseError as e:
+                if scanner is None:
+                    raise
+                # A streamed reply may have been cut short at the wrong object; ask again
+                self.execution_logger.error(f"Could not parse streamed decision: {e}")
+                return None, f"Your JSON decision could not be parsed ({e}). Please provide the action or final answer in the specified JSON format."
+        self.execution_logger.info(f"Parsed Decision: {proposed_decision}")
+
+        if cache_key is not None:
+            decision_cache.set(cache_key, {
+                "reasoning": reasoning_text if reasoning_text else llm_content,
+                "decision": copy.deepcopy(proposed_decision)
+            })
+        return proposed_decision, None
+
     def propose_actions(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get next actions from the LLM."""
         try:
@@ -367,6 +788,10 @@ class ReActAgent(BaseReActAgent):
             if HITL_AUTO_APPROVE_SAFE_ACTIONS and tool_name in SAFE_ACTIONS:
                 return True
                 
+            from rich.panel import Panel
+            from rich.prompt import Confirm
+            from rich.syntax import Syntax
+
             if tool_name in DANGEROUS_ACTIONS:
                 self.console.print(
                     Panel(
@@ -380,7 +805,7 @@ class ReActAgent(BaseReActAgent):
             self.console.print("\nProposed action:")
             self.console.print(
                 Syntax(
-                    json.dumps(action, indent=2),
+                    _dumps(action, indent=True),
                     "json",
                     theme="monokai",
                     word_wrap=True
@@ -398,15 +823,13 @@ class ReActAgent(BaseReActAgent):
         formatted_history = []
 
         for entry in self.state.history:
-            action = entry.get("action", {})
-            result = entry.get("result", {}) # Get potentially non-serializable result
-
-            serializable_result = self._make_serializable(result) # Make it serializable
-
+            # Tool interactions hold the result as content, next to the action that produced it
+            if entry.role != "tool":
+                continue
             formatted_history.append({
-                "action": action, # Assuming action is already serializable (usually dict)
-                "result": serializable_result,
-                "timestamp": entry.get("timestamp", datetime.now().isoformat())
+                "action": entry.action or {}, # Assuming action is already serializable (usually dict)
+                "result": _to_jsonable(entry.content), # Make it serializable
+                "timestamp": entry.timestamp
             })
 
         return formatted_history
@@ -418,11 +841,11 @@ class ReActAgent(BaseReActAgent):
             
         # Look for final answer in history
         for entry in reversed(self.state.history):
-            if entry.get("final_answer"):
+            if entry.role == "final_answer":
                 return {
                     "success": True,
-                    "answer": entry.get("final_answer"),
-                    "timestamp": entry.get("timestamp", datetime.now().isoformat()),
+                    "answer": entry.content,
+                    "timestamp": entry.timestamp,
                     "metadata": {
                         "iterations": len(self.state.history),
                         "session_id": self.state.session_id
@@ -434,8 +857,8 @@ class ReActAgent(BaseReActAgent):
             last_entry = self.state.history[-1]
             return {
                 "success": True,
-                "answer": last_entry.get("observation", "Analysis complete, but no final answer was provided."),
-                "timestamp": last_entry.get("timestamp", datetime.now().isoformat()),
+                "answer": last_entry.content or "Analysis complete, but no final answer was provided.",
+                "timestamp": last_entry.timestamp,
                 "metadata": {
                     "iterations": len(self.state.history),
                     "session_id": self.state.session_id,
@@ -452,8 +875,24 @@ class ReActAgent(BaseReActAgent):
             }
         }
         
+    def invalidate_prompt_cache(self) -> None:
+        """Rebuild the system prompt on next use, e.g. after registering tools."""
+        self._system_prompt = None
+        self._tool_descriptions = None
+
+    def _sync_tools_version(self) -> None:
+        """Drop the cached prompt when tools were registered since it was built."""
+        version = getattr(self.tools, "version", None)
+        if version != self._tools_version:
+            self._tools_version = version
+            self.invalidate_prompt_cache()
+
     def _build_system_prompt(self) -> str:
-        """Constructs the system prompt using templates."""
+        """Constructs the system prompt using templates, once per tool registry version."""
+        self._sync_tools_version()
+        if self._system_prompt is not None:
+            return self._system_prompt
+
         base_template = get_prompt_template("base")
         tools_template = get_prompt_template("tools")
         format_template = get_prompt_template("format")
@@ -464,37 +903,17 @@ class ReActAgent(BaseReActAgent):
              tool_descriptions = "Tool descriptions are currently unavailable."
 
         # Combine templates
-        system_prompt = f"{base_template}\n{tools_template.format(tool_descriptions=tool_descriptions)}\n{format_template}"
-        return system_prompt
+        self._system_prompt = f"{base_template}\n{tools_template.format(tool_descriptions=tool_descriptions)}\n{format_template}"
+        return self._system_prompt
 
     def _build_user_prompt(self, initial_context: Dict[str, Any], feedback: Optional[str] = None) -> str:
         """Builds the user prompt including the question, context, and history."""
-        history_items = []
-        action_counter = 1
-
-        # Use the serializable history method
-        history = self._get_serializable_history()
-
-        for interaction in history:
-            # Only include tool interactions (action + result) in the prompt history
-            if interaction["role"] == "tool" and "action" in interaction:
-                action_str = json.dumps(interaction["action"], indent=2)
-                result_str = json.dumps(interaction["content"], indent=2, cls=ToolResultEncoder)
-
-                history_items.append(f"Action {action_counter}:\n```json\n{action_str}\n```")
-                history_items.append(f"Result:\n```json\n{result_str}\n```")
-                action_counter += 1
-
-        history_str = "\n\n".join(history_items)
-        # Sanitize context slightly for prompt display
-        prompt_context = {k: v for k, v in initial_context.items() if k != 'tools'} # Exclude redundant tool list
-        context_str = json.dumps(prompt_context, indent=2)
+        fragments = self._history_fragments()
 
         # Construct the final prompt string
         prompt_parts = [
-            f"Question: {initial_context.get('question', 'N/A')}",
-            f"\nContext:\n{context_str}",
-            f"\nAction History:\n{history_str}" if history_str else "\nAction History:\n(No actions taken yet)"
+            self._prompt_header_for(initial_context),
+            "\nAction History:\n" + "\n\n".join(fragments) if fragments else "\nAction History:\n(No actions taken yet)"
         ]
 
         # Add feedback if provided
@@ -510,28 +929,42 @@ class ReActAgent(BaseReActAgent):
 
         return user_prompt
 
+    def _prompt_header_for(self, initial_context: Dict[str, Any]) -> str:
+        """Render the question and context lines, once per analysis."""
+        if self._prompt_header is not None and self._prompt_header[0] is initial_context:
+            return self._prompt_header[1]
+        # Sanitize context slightly for prompt display
+        prompt_context = {k: v for k, v in initial_context.items() if k != 'tools'} # Exclude redundant tool list
+        header = f"Question: {initial_context.get('question', 'N/A')}\n\n\nContext:\n{_dumps(prompt_context, indent=True)}"
+        self._prompt_header = (initial_context, header)
+        return header
+
     def _parse_llm_response(self, llm_response_json_str: str) -> Dict[str, Any]:
         """Parses the JSON block from the LLM response into a dictionary."""
         try:
             # Clean the string: remove potential ```json ... ``` markers if present
-            cleaned_str = re.sub(r"^```json\s*|\s*```$", "", llm_response_json_str.strip(), flags=re.MULTILINE)
-            parsed = json.loads(cleaned_str)
+            cleaned_str = _JSON_FENCE_RE.sub("", llm_response_json_str.strip())
+            parsed = _json_loads(cleaned_str)
 
             if not isinstance(parsed, dict):
                 raise ValueError("Parsed JSON is not a dictionary.")
 
-            if "type" not in parsed or parsed["type"] not in ["action", "final_answer"]:
+            if "type" not in parsed or parsed["type"] not in ["action", "parallel_actions", "final_answer"]:
                  raise ValueError("Missing or invalid 'type' field in LLM response.")
 
             if parsed["type"] == "action":
                 if "action" not in parsed or not isinstance(parsed["action"], dict):
                      raise ValueError("Missing or invalid 'action' dictionary for type 'action'.")
-                if "tool" not in parsed["action"]:
-                     raise ValueError("Missing 'tool' field in 'action' dictionary.")
-                if "parameters" not in parsed["action"]:
-                     parsed["action"]["parameters"] = {} # Ensure parameters dict exists
-                elif not isinstance(parsed["action"]["parameters"], dict):
-                     raise ValueError("'parameters' field must be a dictionary.")
+                self._check_action_fields(parsed["action"])
+
+            elif parsed["type"] == "parallel_actions":
+                actions = parsed.get("actions")
+                if not isinstance(actions, list) or not actions:
+                     raise ValueError("Missing or empty 'actions' list for type 'parallel_actions'.")
+                for action in actions:
+                    if not isinstance(action, dict):
+                         raise ValueError("Each entry in 'actions' must be a dictionary.")
+                    self._check_action_fields(action)
 
             elif parsed["type"] == "final_answer":
                  required_keys = ["main_response", "confidence", "reasoning"]
@@ -544,39 +977,70 @@ class ReActAgent(BaseReActAgent):
             self.logger.info(f"Successfully parsed LLM response type: {parsed['type']}")
             return parsed
         except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to decode LLM JSON response: {e}\nResponse: {llm_response_json_str}", exc_info=True)
+            # Malformed replies are retried with feedback; the message says all a traceback would
+            self.logger.error("Failed to decode LLM JSON response: %s\nResponse: %s", e, llm_response_json_str)
             raise LLMResponseError(f"Invalid JSON format in LLM response: {e}") from e
         except ValueError as e:
-            self.logger.error(f"Invalid structure in LLM JSON response: {e}\nResponse: {llm_response_json_str}", exc_info=True)
+            self.logger.error("Invalid structure in LLM JSON response: %s\nResponse: %s", e, llm_response_json_str)
             raise LLMResponseError(f"Invalid JSON structure in LLM response: {e}") from e
         except Exception as e:
-             self.logger.error(f"Unexpected error parsing LLM response: {e}\nResponse: {llm_response_json_str}", exc_info=True)
+             self.logger.error("Unexpected error parsing LLM response: %s\nResponse: %s", e, llm_response_json_str, exc_info=True)
              raise LLMResponseError(f"Unexpected error parsing LLM response: {e}") from e
 
+    @staticmethod
+    def _check_action_fields(action: Dict[str, Any]) -> None:
+        """Validate an action dictionary in place, defaulting missing parameters."""
+        if "tool" not in action:
+             raise ValueError("Missing 'tool' field in 'action' dictionary.")
+        if isinstance(action["tool"], str):
+             action["tool"] = sys.intern(action["tool"]) # Cheap SAFE/DANGEROUS_ACTIONS lookups
+        if "parameters" not in action:
+             action["parameters"] = {} # Ensure parameters dict exists
+        elif not isinstance(action["parameters"], dict):
+             raise ValueError("'parameters' field must be a dictionary.")
+
+    @staticmethod
+    def _strip_open_fence(text: str) -> Optional[str]:
+        """Drop a trailing ```json / ``` fence opener from reasoning text preceding a JSON block."""
+        text = text.rstrip()
+        if text[-7:].lower() == "```json":
+            text = text[:-7]
+        elif text.endswith("```"):
+            text = text[:-3]
+        return text.strip() or None
+
     def _extract_reasoning_and_json(self, text: str) -> Tuple[Optional[str], Optional[str]]:
-        """Extracts reasoning text and the JSON block from LLM response."""
-        json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL | re.IGNORECASE)
-        if json_match:
-            json_block = json_match.group(1).strip()
-            reasoning_text = text[:json_match.start()].strip()
-            return reasoning_text if reasoning_text else None, json_block
-        else:
-            self.logger.warning("Could not find JSON block in LLM response.")
-            # Attempt to find *any* JSON object if ```json``` block is missing
-            try:
-                first_brace = text.find('{')
-                last_brace = text.rfind('}')
-                if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
-                    potential_json = text[first_brace:last_brace+1]
-                    # Quick validation
-                    json.loads(potential_json) 
-                    self.logger.info("Found JSON object without ```json``` markers.")
-                    reasoning = text[:first_brace].strip()
-                    return reasoning if reasoning else None, potential_json
-            except (json.JSONDecodeError, Exception):
-                pass # Ignore if parsing fails
-            # Fallback: return whole text as reasoning
-            return text.strip(), None
+        """
+        Extracts reasoning text and the JSON block from LLM response.
+
+        A single linear brace scan (see JsonObjectScanner) finds the first valid
+        JSON object, starting at the first code fence so that braces in the
+        reasoning cannot be mistaken for the decision; unfenced replies are
+        scanned from the start.
+        """
+        fence = text.find("```")
+        for start in ((fence, 0) if fence > 0 else (0,)):
+            scanner = JsonObjectScanner(is_decision)
+            scanner.feed(text[start:])
+            split = scanner.split()
+            if split is not None:
+                before, json_block = split
+                return self._strip_open_fence(text[:start] + before), json_block
+        self.logger.warning("Could not find JSON block in LLM response.")
+        # Fallback: return whole text as reasoning
+        return text.strip(), None
+
+    @cached_property
+    def console(self):
+        """Rich console for HITL prompts; Rich is only imported when one is shown."""
+        from rich.console import Console
+        return Console()
+
+    @cached_property
+    def _syntax_theme(self):
+        """Highlighting theme for the action details view, resolved once per agent."""
+        from rich.syntax import Syntax
+        return Syntax.get_theme("default")
 
     def _get_user_confirmation(self, action: Dict[str, Any]) -> bool:
         """Asks the user for confirmation before executing an action."""
@@ -596,8 +1060,21 @@ class ReActAgent(BaseReActAgent):
              self.logger.info(f"Auto-approving safe action: {tool_name}")
              return True
 
+        # Dangerous actions are always reviewed; others may have been approved
+        # for the session already (same tool, same parameter names)
+        approval_key = None
+        if not is_dangerous:
+            approval_key = (tool_name, frozenset(action.get("parameters") or {}))
+            if approval_key in self.state.approved_actions:
+                self.logger.info(f"Auto-approving action remembered for this session: {tool_name}")
+                self.execution_logger.info(f"HITL: {tool_name} approved by session policy.")
+                return True
+
+        from rich.panel import Panel
+        from rich.prompt import Prompt
+        from rich.syntax import Syntax
+
         # Display action details to the user
-        self.console.print("\n" + "-" * 40)
         title = "[bold yellow]Proposed Action for Review[/bold yellow]"
         if is_dangerous:
              title = "[bold red]⚠️ DANGEROUS Action for Review ⚠️[/bold red]"
@@ -606,23 +1083,37 @@ class ReActAgent(BaseReActAgent):
              
         panel_content = (
             f"[bold]Tool:[/bold] {action.get('tool', 'N/A')}\n"
-            f"[bold]Parameters:[/bold] {json.dumps(action.get('parameters', {}), indent=2)}\n"
+            f"[bold]Parameters:[/bold] {_dumps(action.get('parameters', {}))}\n"
             f"[bold]Reasoning:[/bold] {action.get('reasoning', 'N/A')}"
         )
-        self.console.print(Panel(panel_content, title=title, border_style="yellow" if not is_safe and not is_dangerous else ("red" if is_dangerous else "green")))
-        self.console.print("-" * 40)
+        # Render the whole review block, then write it to the terminal in one go
+        with self.console.capture() as capture:
+            self.console.print("\n" + _SEP)
+            self.console.print(Panel(panel_content, title=title, border_style="yellow" if not is_safe and not is_dangerous else ("red" if is_dangerous else "green")))
+            self.console.print(_SEP)
+        self.console.file.write(capture.get())
+        self.console.file.flush()
         
         # Loop for user input
+        details = None # Syntax view of the full action, built on first request
         while True:
             try:
+                choices = ["yes", "no", "details", "abort"]
+                if approval_key is not None:
+                    choices.insert(1, "always") # yes, and remember for this session
                 response = Prompt.ask(
                     "Approve execution?", 
-                    choices=["yes", "no", "details", "abort"],
+                    choices=choices,
                     default="yes"
                 ).lower()
                 
                 if response == "yes":
                     return True
+                elif response == "always":
+                    self.state.approved_actions.add(approval_key)
+                    self.logger.info(f"User approved {tool_name} for the rest of the session.")
+                    self.execution_logger.info(f"HITL: {tool_name} with parameters {sorted(approval_key[1])} approved for this session.")
+                    return True
                 elif response == "no":
                     # User rejected, provide feedback to LLM in next iteration
                     self.logger.info(f"User rejected action: {tool_name}")
@@ -630,87 +1121,53 @@ class ReActAgent(BaseReActAgent):
                     raise ReActAbortError(f"User rejected action: {tool_name}") # Raise specific error
                 elif response == "abort":
                      self.logger.info("User chose to abort the analysis.")
-                     raise ReActAbortError("User aborted execution.")
+                     raise ReActAbortError(_ABORT_USER)
                 elif response == "details":
                     # Show full JSON if requested
                     self.console.print("[bold]Full Action Details:[/bold]")
-                    self.console.print(Syntax(json.dumps(action, indent=2), "json", theme="default", line_numbers=True))
+                    if details is None:
+                        details = Syntax(_dumps(action, indent=True), "json", theme=self._syntax_theme, line_numbers=True)
+                    self.console.print(details)
                 else:
                      # Should not happen with Prompt.ask choices
                      self.console.print("[red]Invalid input.[/red]") 
                      
             except KeyboardInterrupt:
                  self.logger.warning("User interrupted confirmation prompt. Aborting.")
-                 raise ReActAbortError("User aborted execution via KeyboardInterrupt.")
+                 raise ReActAbortError(_ABORT_INTERRUPT) from None
             except EOFError:
                  self.logger.warning("EOFError encountered during user input. Aborting.")
-                 raise ReActAbortError("Execution aborted due to closed input stream.")
-
-    def _make_serializable(self, data: Any) -> Any:
-        """Attempts to make various data types JSON serializable."""
-        # Handle ToolResult first if it's directly passed
-        if isinstance(data, ToolResult):
-             try:
-                  return data.to_dict() # Assuming ToolResult has a to_dict method
-             except AttributeError:
-                  self.logger.warning("ToolResult object does not have a to_dict method. Converting to string.")
-                  return str(data)
-             except Exception as e:
-                  self.logger.error(f"Error converting ToolResult to dict: {e}", exc_info=True)
-                  return f"Error serializing ToolResult: {e}"
-        
-        # Handle dictionaries, potentially containing ToolResult
-        elif isinstance(data, dict):
-            serializable_dict = {}
-            for k, v in data.items():
-                serializable_dict[k] = self._make_serializable(v)
-            return serializable_dict
-        
-        # Handle lists
-        elif isinstance(data, list):
-            return [self._make_serializable(item) for item in data]
-        
-        # Basic types that are already serializable
-        elif isinstance(data, (str, int, float, bool, type(None))):
-            return data
-        
-        # Fallback: Convert unknown types to string after attempting direct serialization
-        else:
-            try:
-                 json.dumps(data)
-                 return data # If it works, return as is
-            except (TypeError, OverflowError):
-                 self.logger.warning(f"Data of type {type(data)} is not directly JSON serializable. Converting to string.")
-                 return str(data)
-
-    def _get_serializable_history(self) -> List[Dict[str, Any]]:
-        """Returns the interaction history in a serializable format."""
-        serializable_history = []
-        # Adjust based on whether self.state is ReActState or AgentState
-        history_list = self.state.history if hasattr(self.state, 'history') else []
-        
-        for interaction in history_list:
-            # Ensure interaction is a dictionary before proceeding
-            if not isinstance(interaction, dict):
-                 self.logger.warning(f"Skipping non-dictionary item in history: {interaction}")
-                 continue
-                 
-            role = interaction.get("role")
-            content = interaction.get("content")
-            action = interaction.get("action") # May be None
-            
-            serializable_content = self._make_serializable(content)
-            entry = {"role": role, "content": serializable_content}
-            
-            if action:
-                 serializable_action = self._make_serializable(action)
-                 entry["action"] = serializable_action
-                 
-            serializable_history.append(entry)
-        return serializable_history
+                 raise ReActAbortError(_ABORT_EOF) from None
+
+    def _history_fragments(self) -> List[str]:
+        """
+        Serialize tool interactions added since the last call into prompt blocks.
+
+        Each action/result pair is dumped once, compactly, and appended to
+        state.history_fragments, so building a prompt is O(new entries) rather
+        than re-serializing the whole history every iteration.
+        """
+        state = self.state
+        history = state.history
+        fragments = state.history_fragments
+        upto = state.fragments_upto
+        # Only include tool interactions (action + result) in the prompt history
+        for role, tool, interaction in zip(state.roles[upto:], state.action_tools[upto:], history[upto:]):
+            if role != "tool" or tool is None:
+                continue
+            action_str = _dumps(interaction.action)
+            result_str = interaction.encoded or _dumps(interaction.content)
+            # Two blocks per action, matching the "\n\n" separator used between them
+            fragments.append(f"Action {len(fragments) // 2 + 1}:\n```json\n{action_str}\n```")
+            fragments.append(f"Result:\n```json\n{result_str}\n```")
+        state.fragments_upto = len(history)
+        return fragments
 
     def _get_tool_descriptions(self) -> str:
-        """Gets formatted descriptions of all registered tools."""
+        """Gets formatted descriptions of all registered tools (cached once available)."""
+        self._sync_tools_version()
+        if self._tool_descriptions is not None:
+            return self._tool_descriptions
         try:
             # Assuming self.tools is the ToolRegistry instance
             descriptions = self.tools.get_tool_descriptions()
@@ -718,17 +1175,8 @@ class ReActAgent(BaseReActAgent):
                 self.logger.warning("No tool descriptions found in ToolRegistry.")
                 return "No tool descriptions available."
             
-            formatted_desc = []
-            for name, desc_data in descriptions.items():
-                description = desc_data.get('description', 'No description')
-                parameters = desc_data.get('parameters')
-                formatted_desc.append(f"- `{name}`: {description}")
-                if parameters:
-                    # Simple parameter formatting
-                    param_str = ", ".join([f"{k} ({v.get('type', 'any')})" for k, v in parameters.items()])
-                    formatted_desc.append(f"  Parameters: {param_str}")
-            
-            return "\n".join(formatted_desc) if formatted_desc else "No tool descriptions available."
+            self._tool_descriptions = "\n".join(_tool_description_lines(descriptions))
+            return self._tool_descriptions
         except Exception as e:
             self.logger.error(f"Failed to get tool descriptions: {e}", exc_info=True)
             return "Error retrieving tool descriptions."
@@ -739,7 +1187,7 @@ class ReActAgent(BaseReActAgent):
         if self.state and self.state.session_id:
             self.logger.info(f"Resetting agent state from session {self.state.session_id}")
 
-        new_session_id = str(uuid.uuid4())
+        new_session_id = os.urandom(8).hex()
         self.state = AgentState(
             session_id=new_session_id,
             history=[],
@@ -750,14 +1198,11 @@ class ReActAgent(BaseReActAgent):
             start_time=datetime.now()
         )
 
-        # Ensure execution logger is setup *after* state is reset
-        # Assuming _setup_execution_logger uses self.state.session_id
-        if hasattr(self, '_setup_execution_logger'):
-             self.execution_logger = self._setup_execution_logger(self.state.session_id)
-        else:
-             # Placeholder if the method isn't defined yet or handled elsewhere
-             self.execution_logger = logging.getLogger(f"execution_{new_session_id}")
-             # Add basic configuration if needed, e.g., handler, formatter
+        # Drop the previous session's execution logger so analyze_question()
+        # attaches a file handler for the new session ID
+        self._close_execution_log()
+        self.execution_logger = None
+        self.log_file = None
 
         # Log the *new* session ID
         self.logger.info(f"Agent state reset. New session ID: {self.state.session_id}")
\ No newline at end of file
@@ -1,42 +1,90 @@
 """Base interface for ReAct agents."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, FrozenSet, Optional, List, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+import os
+import sys
+import time
 
-@dataclass
+from .config import MAX_ITERATIONS
+
+# slots=True needs Python 3.10+; on 3.9 the dataclasses keep their __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _result_success(content: Any) -> Optional[bool]:
+    """Success flag of a tool result (ToolResult or result dict), if it has one."""
+    if isinstance(content, dict):
+        return content.get("success", True)
+    return getattr(content, "success", None)
+
+@dataclass(**_DATACLASS_SLOTS)
+class Interaction:
+    """One step of the agent's history."""
+    role: str             # e.g., 'llm', 'tool', 'final_answer'
+    content: Any          # The response text, tool result dict, etc.
+    timestamp_ns: int     # Wall-clock time.time_ns(); see timestamp for the ISO form
+    action: Optional[Dict[str, Any]] = None  # The action that led to a tool result
+    # Compact JSON of a tool result, encoded once for the log and the prompt
+    encoded: Optional[str] = None
+
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 local time of the step, formatted on demand."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict form used for serialization."""
+        result = {"role": self.role, "content": self.content, "timestamp": self.timestamp}
+        if self.action:
+            result["action"] = self.action
+        return result
+
+@dataclass(**_DATACLASS_SLOTS)
 class AgentState:
     """State of the ReAct agent during analysis."""
-    session_id: str
-    history: List[Dict[str, Any]]
-    context: Dict[str, Any]
-    max_iterations: int
+    session_id: str = field(default_factory=lambda: os.urandom(8).hex())
+    history: List[Interaction] = field(default_factory=list)
+    context: Dict[str, Any] = field(default_factory=dict)
+    max_iterations: int = MAX_ITERATIONS
     current_iteration: int = 0
     last_tool_result: Optional[Any] = None
     start_time: datetime = field(default_factory=datetime.now)
     last_llm_reasoning: Optional[str] = None
-    
+    # Pre-serialized "Action N / Result" prompt blocks, appended as tool
+    # interactions are added so prompts never re-serialize the whole history
+    history_fragments: List[str] = field(default_factory=list)
+    # Number of history entries already covered by history_fragments
+    fragments_upto: int = 0
+    # Column view of history (one slot per entry) for scans that only need
+    # the role, the tool called and whether it succeeded
+    roles: List[str] = field(default_factory=list)
+    action_tools: List[Optional[str]] = field(default_factory=list)
+    result_success: List[Optional[bool]] = field(default_factory=list)
+    # (tool, parameter names) the user approved for the rest of the session
+    approved_actions: Set[Tuple[str, FrozenSet[str]]] = field(default_factory=set)
+    # (tool, canonical parameters) -> (expires at, result) for read-only tools
+    tool_results: Dict[Tuple[str, str], Tuple[float, Any]] = field(default_factory=dict)
+
     @property
     def has_reached_max_iterations(self) -> bool:
         """Check if the agent has reached maximum iterations."""
         return self.current_iteration >= self.max_iterations
 
-    def add_interaction(self, role: str, content: Any, action: Optional[Dict] = None):
+    def add_interaction(
+        self,
+        role: str,
+        content: Any,
+        action: Optional[Dict] = None,
+        encoded: Optional[str] = None
+    ):
         """Adds an interaction step to the history."""
-        interaction = {
-            "role": role,       # e.g., 'llm', 'tool', 'user_feedback'
-            "content": content,   # The response text, tool result dict, etc.
-            "timestamp": datetime.now().isoformat()
-        }
-        if action: # Include the action that led to a tool result
-             interaction["action"] = action
-             
-        # Ensure history exists before appending
-        if self.history is None:
-             self.history = []
-             
+        interaction = Interaction(role, content, time.time_ns(), action or None, encoded)
         self.history.append(interaction)
+        self.roles.append(role)
+        self.action_tools.append(action.get("tool") if action else None)
+        self.result_success.append(_result_success(content) if role == "tool" else None)
 
     # Example method (if needed later)
     # def get_last_observation(self) -> Optional[Any]:
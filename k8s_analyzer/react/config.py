@@ -2,11 +2,16 @@
 
 from typing import Dict, Any
 import os
+import sys
 
 # Agent Configuration
 MAX_ITERATIONS: int = int(os.getenv("REACT_MAX_ITERATIONS", "10"))
 THOUGHT_PROCESS_TIMEOUT: int = int(os.getenv("REACT_THOUGHT_TIMEOUT", "30"))
 ACTION_EXECUTION_TIMEOUT: int = int(os.getenv("REACT_ACTION_TIMEOUT", "60"))
+# Upper bound on tools run concurrently for one "parallel_actions" decision
+MAX_PARALLEL_ACTIONS: int = int(os.getenv("REACT_MAX_PARALLEL_ACTIONS", "4"))
+# Seconds a read-only tool result is reused for an identical call in a session (0 disables)
+TOOL_RESULT_CACHE_TTL: float = float(os.getenv("REACT_TOOL_CACHE_TTL", "30"))
 
 # System Prompts
 BASE_SYSTEM_PROMPT: str = """You are an AI agent analyzing a Kubernetes cluster.
@@ -38,6 +43,14 @@ ACTION_FORMAT_PROMPT: str = """When proposing actions, use this JSON format:
     }
 }
 
+To run several independent actions at once (e.g. reading different resources):
+{
+    "type": "parallel_actions",
+    "actions": [
+        {"tool": "tool_name", "parameters": {}, "reasoning": "Why this action is needed"}
+    ]
+}
+
 For final answers:
 {
     "type": "final_answer",
@@ -55,7 +68,7 @@ HITL_AUTO_APPROVE_SAFE_ACTIONS: bool = os.getenv("REACT_HITL_AUTO_APPROVE_SAFE",
 AUTO_APPROVE_ACTIONS: bool = os.getenv("REACT_AUTO_APPROVE_ACTIONS", "false").lower() == "true"
 
 # Safe Actions (can be auto-approved if configured)
-SAFE_ACTIONS: list[str] = [
+SAFE_ACTIONS: frozenset[str] = frozenset({
     "get_pods",
     "get_nodes",
     "get_services",
@@ -63,27 +76,33 @@ SAFE_ACTIONS: list[str] = [
     "describe_node",
     "get_events",
     "get_logs"
-]
+})
 
 # Dangerous Actions (always require HITL)
-DANGEROUS_ACTIONS: list[str] = [
+DANGEROUS_ACTIONS: frozenset[str] = frozenset({
     "delete_pod",
     "drain_node",
     "scale_deployment",
     "rollback_deployment",
     "exec_pod"
-]
+})
+
+# Every action with a fixed HITL policy
+_ALL_ACTIONS: frozenset[str] = SAFE_ACTIONS | DANGEROUS_ACTIONS
 
 # Presentation Configuration
 DISPLAY_THOUGHT_PROCESS: bool = os.getenv("REACT_DISPLAY_THOUGHTS", "true").lower() == "true"
 DISPLAY_TOOL_OUTPUTS: bool = os.getenv("REACT_DISPLAY_OUTPUTS", "true").lower() == "true"
 MAX_OUTPUT_WIDTH: int = int(os.getenv("REACT_OUTPUT_WIDTH", "100"))
 
+# Templates by name, built once; the strings are interned so callers can
+# compare them by identity
+_TEMPLATES: Dict[str, str] = {
+    "base": sys.intern(BASE_SYSTEM_PROMPT),
+    "tools": sys.intern(TOOL_DESCRIPTION_PROMPT),
+    "format": sys.intern(ACTION_FORMAT_PROMPT)
+}
+
 def get_prompt_template(template_name: str) -> str:
     """Get a prompt template by name."""
-    templates = {
-        "base": BASE_SYSTEM_PROMPT,
-        "tools": TOOL_DESCRIPTION_PROMPT,
-        "format": ACTION_FORMAT_PROMPT
-    }
-    return templates.get(template_name, "")
+    return _TEMPLATES.get(template_name, "")
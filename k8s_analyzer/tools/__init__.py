@@ -1,10 +1,10 @@
 """Tools module for K8s Analyzer."""
 
 from typing import Dict, Type, Optional, List, Any
-from .base import BaseTool, ToolContext
+from .base import BaseTool, ToolContext, run_tools_parallel
 from .kubectl import KubectlTool
 from .result import ToolResult
-from .config import validate_config, get_environment_config
+from .config import validate_config, get_environment_config, TOOL_INSTANCE_CACHE_SIZE
 from .exceptions import (
     ToolError,
     ToolConfigError,
@@ -23,6 +23,7 @@ __all__ = [
     "BaseTool",
     "ToolResult",
     "ToolContext",
+    "run_tools_parallel",
     "KubectlTool",
     "ToolError",
     "ToolConfigError",
@@ -36,15 +37,27 @@ __all__ = [
     "ToolStateError"
 ]
 
+def _class_attribute(tool_class: Type[BaseTool], name: str) -> Any:
+    """A plain class attribute, or None when only an instance can provide it (e.g. a property)."""
+    value = getattr(tool_class, name, None)
+    if hasattr(type(value), '__get__'):
+        return None
+    return value
+
 class ToolRegistry:
     """Registry for managing and accessing tools."""
     
     def __init__(self):
         """Initialize the tool registry."""
-        self._tools: Dict[str, BaseTool] = {}
+        # Instances by name, or (name, kwargs) for tools built with extra
+        # configuration; kept in least- to most-recently-used order
+        self._tools: Dict[Any, BaseTool] = {}
         self._tool_classes: Dict[str, Type[BaseTool]] = {
             "kubectl": KubectlTool
         }
+        # Bumped on every registration; consumers key cached descriptions on it
+        self.version = 0
+        self._descriptions: Optional[Dict[str, Dict[str, Any]]] = None
         validate_config()
     
     def register_tool(self, name: str, tool_class: Type[BaseTool]) -> None:
@@ -67,6 +80,8 @@ class ToolRegistry:
             )
             
         self._tool_classes[name] = tool_class
+        self.version += 1
+        self._descriptions = None
     
     def get_tool(self, name: str, **kwargs) -> BaseTool:
         """
@@ -83,9 +98,19 @@ class ToolRegistry:
             ToolNotFoundError: If tool is not found
             ToolConfigError: If tool configuration fails
         """
+        # Instances built with different kwargs are cached separately
+        key: Any = name
+        if kwargs:
+            try:
+                key = (name, frozenset(kwargs.items()))
+            except TypeError:
+                key = None # Unhashable configuration; always build a new instance
+
         # Return cached instance if available
-        if name in self._tools:
-            return self._tools[name]
+        tool = self._tools.get(key) if key is not None else None
+        if tool is not None:
+            self._tools[key] = self._tools.pop(key, tool) # Re-insert as most recently used
+            return tool
             
         # Create new instance
         tool_class = self._tool_classes.get(name)
@@ -96,10 +121,14 @@ class ToolRegistry:
             # Add environment config to kwargs
             kwargs.update(get_environment_config())
             tool = tool_class(**kwargs)
-            self._tools[name] = tool
-            return tool
         except Exception as e:
             raise ToolConfigError(f"Failed to initialize tool {name}: {e}")
+        if key is not None:
+            self._tools[key] = tool
+            if len(self._tools) > TOOL_INSTANCE_CACHE_SIZE:
+                # Evict the least recently used instance
+                del self._tools[next(iter(self._tools))]
+        return tool
     
     def list_tools(self) -> List[BaseTool]:
         """
@@ -118,24 +147,37 @@ class ToolRegistry:
         return list(self._tool_classes.keys())
     
     def get_tool_descriptions(self) -> Dict[str, Dict[str, Any]]:
-        """Get descriptions of all registered tools."""
+        """Get descriptions of all registered tools (shared until the next registration)."""
+        if self._descriptions is not None:
+            return self._descriptions
         descriptions = {}
-        for name in self._tool_classes.keys():
+        complete = True
+        for name, tool_class in self._tool_classes.items():
             try:
-                # Get tool instance (creates if needed)
-                tool = self.get_tool(name)
+                # Plain class attributes are read without constructing the tool
+                description = _class_attribute(tool_class, 'description')
+                parameters = _class_attribute(tool_class, 'parameters')
+                if description is None or parameters is None:
+                    # Get tool instance (creates if needed)
+                    tool = self.get_tool(name)
+                    description = getattr(tool, 'description', 'No description available.')
+                    parameters = getattr(tool, 'parameters', {}) # Assuming parameters schema is an attribute
                 descriptions[name] = {
-                    "description": getattr(tool, 'description', 'No description available.'),
-                    "parameters": getattr(tool, 'parameters', {}), # Assuming parameters schema is an attribute
+                    "description": description,
+                    "parameters": parameters,
                     # Add more details if needed, e.g., expected input/output
                 }
             except Exception as e:
                  # Log or handle error if a tool fails to initialize during description retrieval
                  print(f"Warning: Could not get description for tool '{name}': {e}") # Basic warning
+                 complete = False
                  descriptions[name] = {
                      "description": f"Error retrieving description: {e}",
                      "parameters": {}
                  }
+        if complete:
+            # Failed tools are retried on the next call
+            self._descriptions = descriptions
         return descriptions
         
     def execute_tool(self, name: str, **parameters) -> ToolResult:
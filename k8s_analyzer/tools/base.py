@@ -1,7 +1,8 @@
 """Base interface and utilities for K8s Analyzer tools."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, TypeVar, Generic, Union
+from typing import Dict, Any, Optional, List, Sequence, TypeVar, Generic, Union
 from dataclasses import dataclass, field
 import logging
 import subprocess
@@ -174,6 +175,16 @@ class BaseTool(Generic[T], ABC):
             self.logger.error(f"Unexpected error: {e}", exc_info=True)
             return self._create_error_result(f"Unexpected error: {e}", start_time)
     
+    async def execute_async(self, **kwargs) -> ToolResult:
+        """
+        Async variant of execute.
+        
+        The tool runs in a worker thread, so several tools awaited together
+        (see run_tools_parallel) overlap their waits on kubectl and the API
+        server.
+        """
+        return await asyncio.to_thread(self.execute, **kwargs)
+    
     def _check_permissions(self) -> None:
         """
         Check if required permissions are available.
@@ -248,3 +259,22 @@ class BaseTool(Generic[T], ABC):
         except Exception as e:
             self.logger.error(f"Failed to execute kubectl command '{full_command}': {e}", exc_info=True)
             raise ToolExecutionError(f"Failed to execute kubectl command: {e}")
+
+
+async def run_tools_parallel(
+    tools: Sequence[BaseTool],
+    kwargs_list: Sequence[Dict[str, Any]]
+) -> List[ToolResult]:
+    """
+    Execute several tools concurrently.
+    
+    Args:
+        tools: Tools to run
+        kwargs_list: Parameters for each tool, in the same order
+        
+    Returns:
+        The ToolResults, in the order of `tools`
+    """
+    return list(await asyncio.gather(
+        *(tool.execute_async(**kwargs) for tool, kwargs in zip(tools, kwargs_list))
+    ))
@@ -1,11 +1,14 @@
 """Configuration settings for K8s Analyzer tools."""
 
 import os
+from functools import lru_cache
 from typing import Dict, Any
 
 # Tool Registry Configuration
 TOOL_REGISTRY_CACHE_TTL: int = int(os.getenv("TOOL_REGISTRY_CACHE_TTL", "300"))  # seconds
 TOOL_REGISTRY_REFRESH_ON_ERROR: bool = os.getenv("TOOL_REGISTRY_REFRESH_ON_ERROR", "true").lower() == "true"
+# Tool instances kept by the registry before the least recently used is dropped
+TOOL_INSTANCE_CACHE_SIZE: int = int(os.getenv("TOOL_INSTANCE_CACHE_SIZE", "32"))
 
 # Tool Execution Configuration
 TOOL_EXECUTION_TIMEOUT: int = int(os.getenv("TOOL_EXECUTION_TIMEOUT", "60"))  # seconds
@@ -19,6 +22,10 @@ KUBECTL_CONTEXT: str = os.getenv("KUBECTL_CONTEXT", "kind-orchestrator")
 KUBECTL_NAMESPACE: str = os.getenv("KUBECTL_NAMESPACE", "default")
 KUBECTL_TIMEOUT: int = int(os.getenv("KUBECTL_TIMEOUT", "30"))  # seconds
 KUBECTL_MAX_LINES: int = int(os.getenv("KUBECTL_MAX_LINES", "1000"))
+# Events churn quickly, so cached event lists expire sooner than other reads
+KUBECTL_EVENTS_CACHE_TTL: int = int(os.getenv("KUBECTL_EVENTS_CACHE_TTL", "10"))  # seconds
+# Keep-alive connections held by the shared Kubernetes API client
+KUBE_API_POOL_SIZE: int = int(os.getenv("KUBE_API_POOL_SIZE", "32"))
 
 # Resource Limits
 TOOL_MEMORY_LIMIT: int = int(os.getenv("TOOL_MEMORY_LIMIT", "512"))  # MB
@@ -52,8 +59,15 @@ TOOL_ENV_CONFIGS: Dict[str, Dict[str, Any]] = {
     }
 }
 
+@lru_cache(maxsize=1)
 def get_environment_config() -> Dict[str, Any]:
-    """Get configuration for current environment."""
+    """
+    Get configuration for current environment.
+    
+    The result is computed once per process; call
+    get_environment_config.cache_clear() after changing the environment
+    configuration at runtime. Callers must not mutate the returned dict.
+    """
     return TOOL_ENV_CONFIGS.get(TOOL_ENVIRONMENT, TOOL_ENV_CONFIGS["production"])
 
 def validate_config() -> None:
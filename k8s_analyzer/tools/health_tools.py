@@ -1,9 +1,84 @@
 import logging
-from typing import Dict, Any, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
 from .base import BaseTool, ToolContext, ToolResult, ToolExecutionError
 from .kubectl import KubectlTool # Assuming KubectlTool might be useful or needed later
 
+# Queries shared by the single-purpose tools and HealthSnapshotTool; identical
+# parameters let them reuse each other's cached kubectl results
+# Nodes are fetched as "<name>=<Ready status>" lines rather than full objects
+_NODES_QUERY = {
+    "command": "get",
+    "resource": "nodes",
+    "projection": '{range .items[*]}{.metadata.name}={.status.conditions[?(@.type=="Ready")].status}{"\\n"}{end}',
+}
+# Warnings only, served from the API server's watch cache (resourceVersion=0)
+# rather than a quorum read of every event in etcd. No server-side limit: a
+# limited list is the first page in key order, not the newest events, so the
+# list is trimmed to _MAX_EVENTS by _recent_events instead
+_EVENTS_QUERY = {
+    "command": "get",
+    "resource": "events",
+    "all_namespaces": True,
+    "field_selector": "type=Warning",
+    "resource_version": "0",
+    "resource_version_match": "NotOlderThan",
+    "json_output": True,
+}
+# Warning events returned by the event tools, newest first
+_MAX_EVENTS = 200
+
+_shared_kubectl: Optional[KubectlTool] = None
+_shared_kubectl_lock = threading.Lock()
+
+def _get_kubectl() -> KubectlTool:
+    """KubectlTool shared by the health tools, so they share its result cache."""
+    global _shared_kubectl
+    with _shared_kubectl_lock:
+        if _shared_kubectl is None:
+            _shared_kubectl = KubectlTool()
+        return _shared_kubectl
+
+def _result_data(result: ToolResult) -> Any:
+    """Unwrap the kubectl output from a KubectlTool.execute result."""
+    if not result.success:
+        raise ToolExecutionError(result.error)
+    # execute() wraps the ToolResult returned by KubectlTool._execute
+    inner = result.data
+    return inner.data if isinstance(inner, ToolResult) else inner
+
+def _event_time(event: Dict[str, Any]) -> str:
+    """Time an event was last seen, as the ISO 8601 string the API returns."""
+    return (event.get("lastTimestamp") or event.get("eventTime")
+            or (event.get("metadata") or {}).get("creationTimestamp") or "")
+
+def _recent_events(events: Any) -> Any:
+    """
+    Sort an event list newest first and keep the first _MAX_EVENTS items, in place.
+
+    Dropped items are counted in metadata.remainingItemCount, as the API
+    server does for a truncated list.
+    """
+    if not isinstance(events, dict) or not events.get("items"):
+        return events
+    items = events["items"]
+    items.sort(key=_event_time, reverse=True)
+    if len(items) > _MAX_EVENTS:
+        events["metadata"] = {**(events.get("metadata") or {}), "remainingItemCount": len(items) - _MAX_EVENTS}
+        del items[_MAX_EVENTS:]
+    return events
+
+def _parse_node_ready(output: str) -> Dict[str, str]:
+    """Parse _NODES_QUERY output into {node name: Ready condition status}."""
+    nodes = {}
+    for line in output.splitlines():
+        name, sep, status = line.partition("=")
+        if sep:
+            nodes[name] = status or "Unknown"
+    return nodes
+
 
 class CheckNodeStatusTool(BaseTool):
     """Tool to check the status of Kubernetes nodes."""
@@ -27,7 +102,7 @@ class CheckNodeStatusTool(BaseTool):
     def _initialize(self) -> None:
         """Initialize any resources if needed."""
         self.logger = logging.getLogger(f"k8s_analyzer.tools.{self.name}")
-        self.kubectl = KubectlTool() # Instantiate KubectlTool helper
+        self.kubectl = _get_kubectl() # Shared KubectlTool helper
         self.logger.info(f"Initialized {self.name}")
 
     def validate_parameters(self, parameters: Dict[str, Any]) -> None:
@@ -37,14 +112,14 @@ class CheckNodeStatusTool(BaseTool):
         self.logger.debug(f"Parameters validated for {self.name}")
         # Add more specific validation if parameters are introduced later
 
-    def _execute(self, context: ToolContext) -> Dict[str, Any]:
+    def _execute(self, context: ToolContext) -> Dict[str, str]:
         """Execute the node status check using kubectl."""
         self.logger.info(f"Executing {self.name}")
         try:
             # Use the instantiated KubectlTool
-            result_data = self.kubectl.execute(command="get", resource="nodes", json_output=True)
+            nodes = _parse_node_ready(_result_data(self.kubectl.execute(**_NODES_QUERY)))
             self.logger.info(f"{self.name} executed successfully.")
-            return result_data # Return the dictionary output from kubectl
+            return nodes # Node name -> Ready status ("True", "False" or "Unknown")
         except Exception as e:
             self.logger.error(f"Error executing {self.name}: {e}", exc_info=True)
             # Re-raise as ToolExecutionError for the base class handler
@@ -73,7 +148,7 @@ class CheckClusterEventsTool(BaseTool):
     def _initialize(self) -> None:
         """Initialize any resources if needed."""
         self.logger = logging.getLogger(f"k8s_analyzer.tools.{self.name}")
-        self.kubectl = KubectlTool() # Instantiate KubectlTool helper
+        self.kubectl = _get_kubectl() # Shared KubectlTool helper
         self.logger.info(f"Initialized {self.name}")
 
     def validate_parameters(self, parameters: Dict[str, Any]) -> None:
@@ -88,11 +163,63 @@ class CheckClusterEventsTool(BaseTool):
         try:
             # Use the instantiated KubectlTool
             # Consider fetching events across all namespaces or limiting scope/time
-            result_data = self.kubectl.execute(command="get", resource="events", all_namespaces=True, json_output=True)
+            result_data = self.kubectl.execute(**_EVENTS_QUERY)
+            if result_data.success:
+                _recent_events(_result_data(result_data))
             self.logger.info(f"{self.name} executed successfully.")
             return result_data # Return the dictionary output
         except Exception as e:
             self.logger.error(f"Error executing {self.name}: {e}", exc_info=True)
             raise ToolExecutionError(f"Failed to get cluster events: {e}")
 
+class HealthSnapshotTool(BaseTool):
+    """Tool to fetch node status and cluster events together."""
+
+    @property
+    def name(self) -> str:
+        return "health_snapshot"
+
+    @property
+    def description(self) -> str:
+        return "Retrieves node status and recent cluster-wide events in one step, fetched concurrently."
+
+    @property
+    def required_permissions(self) -> List[str]:
+        return ["nodes/list", "events/list"]
+
+    @property
+    def is_dangerous(self) -> bool:
+        return False # This tool only reads information
+
+    def _initialize(self) -> None:
+        """Initialize any resources if needed."""
+        self.logger = logging.getLogger(f"k8s_analyzer.tools.{self.name}")
+        self.kubectl = _get_kubectl() # Shared KubectlTool helper
+        self.logger.info(f"Initialized {self.name}")
+
+    def validate_parameters(self, parameters: Dict[str, Any]) -> None:
+        """Validate parameters. This tool takes no parameters."""
+        if parameters:
+             raise ValueError(f"{self.name} does not accept any parameters.")
+
+    def _execute(self, context: ToolContext) -> Dict[str, Any]:
+        """
+        Run the node and event queries concurrently.
+
+        The results land in the shared kubectl cache, so CheckNodeStatusTool
+        and CheckClusterEventsTool calls shortly afterwards reuse them.
+        """
+        self.logger.info(f"Executing {self.name}")
+        try:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                nodes = pool.submit(self.kubectl.execute, **_NODES_QUERY)
+                events = pool.submit(self.kubectl.execute, **_EVENTS_QUERY)
+                return {
+                    "nodes": _parse_node_ready(_result_data(nodes.result())),
+                    "events": _recent_events(_result_data(events.result()))
+                }
+        except Exception as e:
+            self.logger.error(f"Error executing {self.name}: {e}", exc_info=True)
+            raise ToolExecutionError(f"Failed to get health snapshot: {e}")
+
 # --- Add more specific tool classes below as needed --- 
\ No newline at end of file
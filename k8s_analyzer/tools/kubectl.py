@@ -1,10 +1,14 @@
 """Kubectl tool implementation for K8s Analyzer."""
 
-import subprocess
-import shlex
+import copy
 import json
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+import logging
+import shlex
+import subprocess
+import threading
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime
 
 from .base import BaseTool, ToolContext
@@ -19,11 +23,95 @@ from .config import (
     KUBECTL_NAMESPACE,
     KUBECTL_TIMEOUT,
     KUBECTL_MAX_LINES,
+    KUBE_API_POOL_SIZE,
+    KUBECTL_EVENTS_CACHE_TTL,
+    TOOL_REGISTRY_CACHE_TTL,
     TOOL_ALLOWED_NAMESPACES,
     TOOL_RESTRICTED_RESOURCES
 )
 from .result import ToolResult
 
+try:
+    import ijson
+except ImportError:  # Optional: stream_items falls back to json.load
+    ijson = None
+
+# Resources listed through the typed API: resource -> (API group, list call
+# across all namespaces or for a cluster-scoped kind, namespaced list call)
+_API_LIST_CALLS: Dict[str, Tuple[str, str, Optional[str]]] = {
+    "pods": ("core", "list_pod_for_all_namespaces", "list_namespaced_pod"),
+    "nodes": ("core", "list_node", None),
+    "services": ("core", "list_service_for_all_namespaces", "list_namespaced_service"),
+    "events": ("core", "list_event_for_all_namespaces", "list_namespaced_event"),
+    "namespaces": ("core", "list_namespace", None),
+    "configmaps": ("core", "list_config_map_for_all_namespaces", "list_namespaced_config_map"),
+    "persistentvolumes": ("core", "list_persistent_volume", None),
+    "persistentvolumeclaims": (
+        "core", "list_persistent_volume_claim_for_all_namespaces", "list_namespaced_persistent_volume_claim"
+    ),
+    "deployments": ("apps", "list_deployment_for_all_namespaces", "list_namespaced_deployment"),
+    "statefulsets": ("apps", "list_stateful_set_for_all_namespaces", "list_namespaced_stateful_set"),
+    "daemonsets": ("apps", "list_daemon_set_for_all_namespaces", "list_namespaced_daemon_set"),
+    "replicasets": ("apps", "list_replica_set_for_all_namespaces", "list_namespaced_replica_set"),
+}
+
+# kubectl flags with a typed-API equivalent; any other flag uses the kubectl path
+_API_LIST_OPTIONS: Dict[str, str] = {
+    "field_selector": "field_selector",
+    "field-selector": "field_selector",
+    "label_selector": "label_selector",
+    "selector": "label_selector",
+    "limit": "limit",
+    "resource_version": "resource_version",
+    "resource_version_match": "resource_version_match",
+}
+_API_ALL_NAMESPACES = frozenset({"all_namespaces", "all-namespaces", "A"})
+# List options `kubectl get` has no flag for; only the typed API applies them
+_API_ONLY_OPTIONS = frozenset({"limit", "resource_version", "resource_version_match"})
+
+# Pooled ApiClient per kube context (None when it could not be created),
+# shared by every KubectlTool and the health tools built on it
+_SHARED_API_CLIENTS: Dict[Optional[str], Any] = {}
+_SHARED_API_LOCK = threading.Lock()
+
+def _shared_api_client(context: Optional[str], logger: logging.Logger) -> Any:
+    """
+    Get the process-wide ApiClient for a kube context, creating it on first use.
+
+    The client's urllib3 pool keeps up to KUBE_API_POOL_SIZE connections
+    alive, so concurrent tools reuse established TLS connections.
+
+    Returns:
+        The ApiClient, or None if the kubernetes package or a cluster
+        configuration is unavailable
+    """
+    with _SHARED_API_LOCK:
+        if context in _SHARED_API_CLIENTS:
+            return _SHARED_API_CLIENTS[context]
+        api_client = None
+        try:
+            from kubernetes import client, config
+        except ImportError:
+            logger.info("Kubernetes client module not installed, using kubectl")
+        else:
+            try:
+                configuration = client.Configuration()
+                try:
+                    config.load_kube_config(context=context, client_configuration=configuration)
+                except Exception:
+                    config.load_incluster_config(client_configuration=configuration)
+                configuration.connection_pool_maxsize = KUBE_API_POOL_SIZE
+                api_client = client.ApiClient(configuration)
+                logger.info("Initialized Kubernetes API client")
+            except Exception as e:
+                logger.warning("Failed to initialize Kubernetes API client, using kubectl: %s", e)
+        _SHARED_API_CLIENTS[context] = api_client
+        return api_client
+
+# Commands whose results are cached, and the number of results kept per tool
+_CACHED_VERBS = frozenset({"get", "describe"})
+_RESULT_CACHE_SIZE = 256
+
 @dataclass
 class KubectlConfig:
     """Configuration for kubectl tool."""
@@ -55,6 +143,13 @@ class KubectlTool(BaseTool[KubectlConfig]):
     def _initialize(self) -> None:
         """Initialize kubectl configuration."""
         self._config = self._config or KubectlConfig()
+        # Typed API clients, created on the first list request (see _get_apis)
+        self._apis_loaded = False
+        self._api_client = None
+        self._apis: Dict[str, Any] = {}
+        # Recent results of read commands: cache key -> (expires at, result), oldest first
+        self._result_cache: Dict[str, Tuple[float, ToolResult]] = {}
+        self._result_cache_lock = threading.Lock()
         
         # Verify kubectl is available
         try:
@@ -116,12 +211,21 @@ class KubectlTool(BaseTool[KubectlConfig]):
                     f"Access to resource {resource} is restricted"
                 )
     
-    def _execute(self, context: ToolContext) -> ToolResult:
-        """Execute kubectl command."""
-        command = context.parameters.get("command")
-        resource = context.parameters.get("resource")
-        namespace = context.parameters.get("namespace", self._config.namespace)
-        output_format = context.parameters.get("output", "json")
+    def _build_command(self, parameters: Dict[str, Any]) -> Tuple[List[str], bool]:
+        """
+        Build the kubectl argument list for the given parameters.
+        
+        Returns:
+            Tuple of (command parts, whether JSON output was requested)
+        """
+        command = parameters.get("command")
+        resource = parameters.get("resource")
+        namespace = parameters.get("namespace", self._config.namespace)
+        output_format = parameters.get("output", "json")
+        # A jsonpath projection makes kubectl return only the fields the caller needs
+        projection = parameters.get("projection")
+        if projection:
+            output_format = f"jsonpath={projection}"
         json_output = output_format.lower() == "json"
         
         # Build full command with context and namespace
@@ -148,17 +252,222 @@ class KubectlTool(BaseTool[KubectlConfig]):
 
         # Add any other parameters (flags, options)
         # Ensure we don't re-add handled params or the flag derived from 'output'/'json_output'
-        handled_params = {"command", "resource", "namespace", "output", "json_output"}
-        for key, value in context.parameters.items():
-            if key not in handled_params:
+        handled_params = {"command", "resource", "namespace", "output", "json_output", "projection"}
+        for key, value in parameters.items():
+            if key not in handled_params and key not in _API_ONLY_OPTIONS:
+                # Python-style keys map to kubectl flags (field_selector -> --field-selector)
+                flag = f"-{key}" if len(key) == 1 else f"--{key.replace('_', '-')}"
                 # Handle boolean flags (like --all-namespaces)
                 if isinstance(value, bool) and value:
-                    cmd_parts.append(f"--{key}")
+                    cmd_parts.append(flag)
                 # Handle key-value options (like --field-selector)
                 elif not isinstance(value, bool) and value is not None:
                      # Basic quoting for safety, might need refinement
                      quoted_value = shlex.quote(str(value))
-                     cmd_parts.append(f"--{key}={quoted_value}")
+                     cmd_parts.append(f"{flag}={quoted_value}")
+        
+        return cmd_parts, json_output
+    
+    def stream_items(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Run a kubectl list command and yield its 'items' one at a time.
+        
+        With ijson installed, items are parsed incrementally from kubectl's
+        stdout so large lists never exist as a single string or parse tree;
+        otherwise the output is decoded with json.load straight from the pipe.
+        
+        Args:
+            **kwargs: Same parameters as execute(); output is forced to JSON
+            
+        Yields:
+            Each entry of the list's 'items' array
+            
+        Raises:
+            ToolValidationError: If the parameters are invalid
+            ToolExecutionError: If kubectl fails or its output is not valid JSON
+        """
+        self.validate_parameters(kwargs)
+        kwargs["output"] = "json"
+        cmd_parts, _ = self._build_command(kwargs)
+        full_cmd = " ".join(cmd_parts)
+        self.logger.debug(f"Streaming kubectl command: {full_cmd}")
+        
+        process = subprocess.Popen(cmd_parts, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        completed = False
+        try:
+            try:
+                if ijson is not None:
+                    yield from ijson.items(process.stdout, "items.item", use_float=True)
+                else:
+                    yield from json.load(process.stdout).get("items", [])
+            except ValueError as parse_err:  # json.JSONDecodeError and ijson.JSONError
+                # Empty or truncated stdout usually means kubectl itself failed
+                process.wait(timeout=self._config.timeout)
+                if process.returncode != 0:
+                    error_output = process.stderr.read().decode(errors="replace").strip()
+                    raise ToolExecutionError(
+                        f"kubectl command failed with exit code {process.returncode}: {error_output}"
+                    )
+                raise ToolExecutionError(f"Failed to parse kubectl output as JSON: {parse_err}")
+            
+            process.wait(timeout=self._config.timeout)
+            if process.returncode != 0:
+                error_output = process.stderr.read().decode(errors="replace").strip()
+                raise ToolExecutionError(
+                    f"kubectl command failed with exit code {process.returncode}: {error_output}"
+                )
+            completed = True
+        except subprocess.TimeoutExpired:
+            raise ToolExecutionError(f"kubectl command timed out after {self._config.timeout} seconds")
+        finally:
+            # The consumer may stop iterating early; don't leave kubectl running
+            if not completed and process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.stderr.close()
+            process.wait()
+    
+    def _get_apis(self) -> bool:
+        """
+        Create the typed Kubernetes API clients once per tool instance.
+
+        The ApiClient underneath is shared process-wide (see _shared_api_client),
+        so list requests reuse one keep-alive connection pool instead of
+        forking kubectl.
+
+        Returns:
+            True if the API clients are available, False to fall back to kubectl
+        """
+        if self._apis_loaded:
+            return self._api_client is not None
+        self._apis_loaded = True
+
+        self._api_client = _shared_api_client(self._config.context or None, self.logger)
+        if self._api_client is None:
+            return False
+        from kubernetes import client
+        self._apis = {
+            "core": client.CoreV1Api(self._api_client),
+            "apps": client.AppsV1Api(self._api_client),
+        }
+        return True
+
+    def _list_via_api(self, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Serve a plain `get <resource>` list through the typed API.
+
+        Returns:
+            The list in kubectl's `-o json` shape, or None if the request has
+            no typed API mapping or the API client is unavailable
+
+        Raises:
+            ToolExecutionError: If the API request fails
+        """
+        if parameters.get("projection") or str(parameters.get("output", "json")).lower() != "json":
+            return None
+        parts = shlex.split(parameters.get("command") or "")
+        if parameters.get("resource"):
+            parts.append(parameters["resource"])
+        if len(parts) != 2 or parts[0] != "get":
+            return None
+        calls = _API_LIST_CALLS.get(parts[1].lower())
+        if calls is None:
+            return None
+
+        all_namespaces = False
+        options: Dict[str, Any] = {}
+        for key, value in parameters.items():
+            if key in ("command", "resource", "namespace", "output", "json_output"):
+                continue
+            if key in _API_ALL_NAMESPACES:
+                all_namespaces = bool(value)
+            elif key in _API_LIST_OPTIONS:
+                if value is not None:
+                    options[_API_LIST_OPTIONS[key]] = value
+            else:
+                return None # A flag only kubectl understands
+
+        if not self._get_apis():
+            return None
+        group, all_call, namespaced_call = calls
+        api = self._apis[group]
+        namespace = parameters.get("namespace", self._config.namespace)
+        try:
+            if namespaced_call and namespace and not all_namespaces:
+                result = getattr(api, namespaced_call)(namespace, **options)
+            else:
+                result = getattr(api, all_call)(**options)
+        except Exception as e:
+            raise ToolExecutionError(f"Kubernetes API request for {parts[1]} failed: {e}")
+        return self._api_client.sanitize_for_serialization(result)
+
+    def _cache_key(self, parameters: Dict[str, Any]) -> Tuple[Optional[str], float]:
+        """
+        Result cache key and TTL for a request.
+
+        Returns:
+            (key, ttl), or (None, 0) for requests whose results are not cached
+        """
+        parts = shlex.split(parameters.get("command") or "")
+        if not parts or parts[0] not in _CACHED_VERBS:
+            return None, 0
+        resource = str(parameters.get("resource") or (parts[1] if len(parts) > 1 else "")).lower()
+        ttl = KUBECTL_EVENTS_CACHE_TTL if resource in ("events", "event", "ev") else TOOL_REGISTRY_CACHE_TTL
+        if ttl <= 0:
+            return None, 0
+        key = json.dumps(
+            [self._config.context, parameters.get("namespace", self._config.namespace), parameters],
+            sort_keys=True,
+            default=str
+        )
+        return key, ttl
+
+    def _execute(self, context: ToolContext) -> ToolResult:
+        """
+        Execute kubectl command.
+
+        Results of read commands are reused for identical requests within
+        the cache TTL; pass _cache_bypass=True to force a fresh read. Each
+        hit gets its own copy of the data, so callers may modify it.
+        """
+        parameters = dict(context.parameters)
+        bypass = parameters.pop("_cache_bypass", False)
+        key, ttl = self._cache_key(parameters)
+        if key is not None and not bypass:
+            with self._result_cache_lock:
+                entry = self._result_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                cached = entry[1]
+                return replace(cached, data=copy.deepcopy(cached.data), metadata={**cached.metadata, "cached": True})
+
+        result = self._run(parameters)
+        if key is not None:
+            with self._result_cache_lock:
+                cache = self._result_cache
+                cache.pop(key, None)
+                # Stored as its own copy; the caller keeps the original
+                cache[key] = (time.monotonic() + ttl, replace(result, data=copy.deepcopy(result.data)))
+                while len(cache) > _RESULT_CACHE_SIZE:
+                    # Drop the oldest entry
+                    del cache[next(iter(cache))]
+        return result
+
+    def _run(self, parameters: Dict[str, Any]) -> ToolResult:
+        """Run a request through the typed API or the kubectl binary."""
+        # Plain list requests skip the kubectl process when the API client is available
+        start_time = datetime.now()
+        data = self._list_via_api(parameters)
+        if data is not None:
+            return ToolResult(
+                success=True,
+                data=data,
+                error=None,
+                execution_time=(datetime.now() - start_time).total_seconds(),
+                timestamp=datetime.now(),
+                metadata={"tool": "kubectl", "command": parameters.get("command"), "source": "api"}
+            )
+
+        cmd_parts, json_output = self._build_command(parameters)
 
         # Log the command for debugging
         full_cmd = " ".join(cmd_parts)
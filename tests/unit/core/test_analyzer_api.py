@@ -0,0 +1,117 @@
+"""Unit tests for the analyzer's typed Kubernetes API path."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from k8s_analyzer.core.analyzer import EnhancedClusterAnalyzer
+from k8s_analyzer.tools.config import KUBECTL_CONTEXT
+
+def _container(cpu_limit=None, memory_limit=None):
+    """Build a minimal container spec with the given limits."""
+    limits = {}
+    if cpu_limit:
+        limits["cpu"] = cpu_limit
+    if memory_limit:
+        limits["memory"] = memory_limit
+    return SimpleNamespace(resources=SimpleNamespace(limits=limits))
+
+def _pod(namespace, name, cpu_limit=None, memory_limit=None, containers=None):
+    """Build a minimal pod object as returned by the typed API."""
+    return SimpleNamespace(
+        metadata=SimpleNamespace(namespace=namespace, name=name),
+        spec=SimpleNamespace(containers=containers or [_container(cpu_limit, memory_limit)])
+    )
+
+@pytest.fixture
+def api_client():
+    """Fixture patching the shared ApiClient and the typed API classes."""
+    with patch("k8s_analyzer.core.analyzer._shared_api_client") as shared, \
+         patch("kubernetes.client.CoreV1Api") as core, \
+         patch("kubernetes.client.AppsV1Api"), \
+         patch("kubernetes.client.CustomObjectsApi") as custom:
+        yield SimpleNamespace(shared=shared, core=core.return_value, metrics=custom.return_value)
+
+class TestAnalyzerTypedApi:
+    """Test cases for the analyzer's typed API path."""
+    
+    def test_pressure_points_via_metrics_api(self, api_client):
+        """Test pod usage from metrics.k8s.io is compared with container limits."""
+        api_client.metrics.list_cluster_custom_object.return_value = {"items": [
+            {"metadata": {"namespace": "default", "name": "busy"},
+             "containers": [{"usage": {"cpu": "950000000n", "memory": "100Mi"}}]},
+            {"metadata": {"namespace": "default", "name": "idle"},
+             "containers": [{"usage": {"cpu": "10m", "memory": "10Mi"}}]},
+        ]}
+        api_client.core.list_pod_for_all_namespaces.return_value = SimpleNamespace(items=[
+            _pod("default", "busy", cpu_limit="1", memory_limit="1Gi"),
+            _pod("default", "idle", cpu_limit="1"),
+        ])
+        analyzer = EnhancedClusterAnalyzer(agent=MagicMock())
+        
+        result = analyzer.analyze_pressure_points()
+        
+        assert result.success
+        assert [(p.resource_name, p.metric_name, p.severity) for p in result.pressure_points] == [
+            ("busy", "cpu", "warning")
+        ]
+        assert result.pressure_points[0].current_value == pytest.approx(950.0)
+        assert result.pressure_points[0].threshold == pytest.approx(1000.0)
+        kwargs = api_client.core.list_pod_for_all_namespaces.call_args.kwargs
+        assert kwargs["field_selector"] == "status.phase=Running"
+        assert kwargs["resource_version"] == "0"
+    
+    def test_unlimited_container_has_no_pod_limit(self, api_client):
+        """Test a pod with an unlimited sidecar is not compared with a partial limit."""
+        api_client.metrics.list_cluster_custom_object.return_value = {"items": [
+            {"metadata": {"namespace": "default", "name": "sidecar-pod"},
+             "containers": [{"usage": {"cpu": "100m"}}, {"usage": {"cpu": "2"}}]},
+        ]}
+        api_client.core.list_pod_for_all_namespaces.return_value = SimpleNamespace(items=[
+            _pod("default", "sidecar-pod", containers=[_container(cpu_limit="1"), _container()]),
+        ])
+        analyzer = EnhancedClusterAnalyzer(agent=MagicMock())
+        
+        result = analyzer.analyze_pressure_points()
+        
+        assert result.success
+        assert result.pressure_points == []
+        assert analyzer._fetch_pod_metrics_via_api()["items"][0]["limits"] == {}
+    
+    def test_uses_kubectl_context(self, api_client):
+        """Test the API client is created for the same context as the kubectl tools."""
+        analyzer = EnhancedClusterAnalyzer(agent=MagicMock())
+        
+        assert analyzer._get_k8s_apis()
+        assert api_client.shared.call_args.args[0] == (KUBECTL_CONTEXT or None)
+    
+    def test_list_resource_via_api(self, api_client):
+        """Test resource lists are returned in kubectl's JSON shape."""
+        api_client.shared.return_value.sanitize_for_serialization.return_value = {"items": [{"kind": "Node"}]}
+        analyzer = EnhancedClusterAnalyzer(agent=MagicMock())
+        
+        assert analyzer._list_resource_via_api("nodes") == {"items": [{"kind": "Node"}]}
+        api_client.core.list_node.assert_called_once_with()
+        assert analyzer._list_resource_via_api("customresources") is None
+    
+    def test_injected_kubectl_skips_api(self, api_client):
+        """Test a kubectl tool passed in through tools= is used instead of the API."""
+        kubectl = MagicMock()
+        kubectl.name = "kubectl"
+        del kubectl.stream_items
+        kubectl.execute.return_value = {"items": []}
+        analyzer = EnhancedClusterAnalyzer(agent=MagicMock(), tools=[kubectl])
+        
+        result = analyzer.analyze_pressure_points()
+        
+        assert result.success
+        api_client.shared.assert_not_called()
+        kubectl.execute.assert_called_once_with(command="top", resource="pods", all_namespaces=True)
+    
+    def test_no_cluster_config_falls_back(self, api_client):
+        """Test the API path is skipped when no shared client can be created."""
+        api_client.shared.return_value = None
+        analyzer = EnhancedClusterAnalyzer(agent=MagicMock())
+        
+        assert analyzer._list_resource_via_api("pods") is None
+        assert analyzer._fetch_pod_metrics_via_api() is None
@@ -1,5 +1,6 @@
 """Unit tests for the base LLM implementation."""
 
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock
 from typing import Dict, Any, Optional
@@ -12,7 +13,7 @@ from k8s_analyzer.llm.exceptions import (
     LLMResponseError,
     LLMTimeoutError
 )
-from k8s_analyzer.llm.base import BaseLLM
+from k8s_analyzer.llm.base import BaseLLM, JsonObjectScanner, is_decision, retrying
 
 # Mock these classes for testing
 class LLMResponse:
@@ -247,4 +248,130 @@ class TestBaseLLM:
         
         assert response1.cache_key == response2.cache_key
         assert response1.is_cached is False
-        assert response2.is_cached is True 
\ No newline at end of file
+        assert response2.is_cached is True
+    
+    def test_async_batch_analysis(self):
+        """TC4_015: Test concurrent batch analysis preserves order."""
+        llm = MockLLM()
+        
+        results = asyncio.run(llm.abatch([("system", "a"), ("system", "b")], max_concurrency=1))
+        
+        assert len(results) == 2
+        assert all(result["final_answer"] == "Test answer" for result in results)
+    
+    @patch("k8s_analyzer.llm.base.random.uniform", return_value=1.0)
+    @patch("k8s_analyzer.llm.base.time.sleep")
+    def test_retry_with_backoff(self, mock_sleep, mock_uniform):
+        """TC4_016: Test transient errors are retried with growing delays."""
+        llm = MockLLM()
+        llm.RETRYABLE_ERRORS = (LLMTimeoutError,)
+        call = MagicMock(side_effect=[LLMTimeoutError("busy"), LLMTimeoutError("busy"), "ok"])
+        
+        assert llm._retry(call) == "ok"
+        assert call.call_count == 3
+        assert [args[0] for args, _ in mock_sleep.call_args_list] == [5, 10]
+    
+    @patch("k8s_analyzer.llm.base.time.sleep")
+    def test_retry_honors_retry_after(self, mock_sleep):
+        """TC4_017: Test Retry-After overrides the computed backoff."""
+        llm = MockLLM()
+        llm.RETRYABLE_ERRORS = (LLMTimeoutError,)
+        error = LLMTimeoutError("rate limited")
+        error.response = MagicMock(headers={"retry-after": "7"})
+        call = MagicMock(side_effect=[error, error, error])
+        
+        with pytest.raises(LLMTimeoutError):
+            llm._retry(call)
+        assert [args[0] for args, _ in mock_sleep.call_args_list] == [7.0, 7.0]
+    
+    def test_strip_fences(self):
+        """TC4_018: Test markdown fences around JSON output are removed."""
+        assert BaseLLM._strip_fences('```json\n{"a": 1}\n```') == '{"a": 1}'
+        assert BaseLLM._strip_fences('```\n[1]\n```\n') == '[1]'
+        assert BaseLLM._strip_fences('{"a": "```"}') == '{"a": "```"}'
+    
+    def test_collect_stream_stops_at_object_end(self):
+        """TC4_019: Test streamed text is cut once the first JSON object closes."""
+        chunks = iter(['Check {namespace}\n```json\n{"type": "action", "a": "}', '", "b": {"c": 1}}', "never read"])
+        received = []
+        
+        text = BaseLLM._collect_stream(chunks, received.append)
+        
+        assert text == 'Check {namespace}\n```json\n{"type": "action", "a": "}", "b": {"c": 1}}'
+        assert "".join(received) == text
+        assert next(chunks) == "never read"
+    
+    def test_collect_stream_skips_json_in_reasoning(self):
+        """TC4_023: Test valid JSON in the reasoning does not end the stream early."""
+        chunks = iter([
+            'I will check pods with selector {"app": "nginx"} first.\n```json\n',
+            '{"type": "final_answer", "content": "done"}',
+            "never read"
+        ])
+        
+        text = BaseLLM._collect_stream(chunks)
+        
+        assert text.endswith('{"type": "final_answer", "content": "done"}')
+        assert next(chunks) == "never read"
+        scanner = JsonObjectScanner(is_decision)
+        scanner.feed(text)
+        assert scanner.split()[1] == '{"type": "final_answer", "content": "done"}'
+    
+    def test_collect_stream_skips_typed_json_in_reasoning(self):
+        """TC4_024: Test a quoted object with a non-decision type does not end the stream."""
+        reply = (
+            'The pod has {"type": "Warning", "reason": "BackOff"} and an example '
+            '{"type": "action", "action": {}} in its notes.\n```json\n'
+            '{"type": "final_answer", "main_response": "restart loop"}\n```'
+        )
+        # Small chunks split the fence and the objects across deltas
+        chunks = iter([reply[i:i + 5] for i in range(0, len(reply), 5)] + ["never read"])
+        
+        text = BaseLLM._collect_stream(chunks)
+        
+        assert text.endswith('{"type": "final_answer", "main_response": "restart loop"}')
+        assert list(chunks)[-1] == "never read"
+    
+    def test_scanner_unfenced_fallback(self):
+        """TC4_025: Test an unfenced decision is returned once the text ends."""
+        scanner = JsonObjectScanner(is_decision)
+        
+        assert scanner.feed('{"type": "Warning"} then {"type": "action", "action": {}} done') == -1
+        assert scanner.split() == ('{"type": "Warning"} then ', '{"type": "action", "action": {}}')
+    
+    def test_scanner_split(self):
+        """TC4_022: Test the scanner splits streamed text into preamble and object."""
+        scanner = JsonObjectScanner()
+        assert scanner.feed('Check {ns}\n```json\n{"a":') == -1
+        assert scanner.split() is None
+        
+        assert scanner.feed(' 1} trailing') == 3
+        assert scanner.split() == ('Check {ns}\n```json\n', '{"a": 1}')
+    
+    @patch("k8s_analyzer.llm.base.time.sleep")
+    def test_retrying_decorator(self, mock_sleep):
+        """TC4_020: Test @retrying applies the retry policy to a method."""
+        class FlakyLLM(MockLLM):
+            RETRYABLE_ERRORS = (LLMTimeoutError,)
+            calls = 0
+            
+            @retrying
+            def send(self, value):
+                FlakyLLM.calls += 1
+                if FlakyLLM.calls < 2:
+                    raise LLMTimeoutError("busy")
+                return value
+        
+        assert FlakyLLM().send("ok") == "ok"
+        assert FlakyLLM.calls == 2
+        assert mock_sleep.call_count == 1
+    
+    def test_close_releases_once(self):
+        """TC4_021: Test close() and the context manager release resources exactly once."""
+        release = MagicMock()
+        
+        with MockLLM() as llm:
+            llm._on_close(release)
+        llm.close()
+        
+        release.assert_called_once_with()
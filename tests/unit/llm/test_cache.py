@@ -0,0 +1,140 @@
+"""Unit tests for the LLM response cache."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from k8s_analyzer.llm.cache import EmbeddingBatcher, LLMCache, SemanticLLMCache
+
+
+@pytest.fixture
+def cache():
+    """Fixture for a small response cache."""
+    return LLMCache(maxsize=2, ttl=60)
+
+
+# Toy embeddings: prompts about pods point one way, nodes another
+_VECTORS = {
+    "list pods": [1.0, 0.1, 0.0],
+    "show pods": [0.9, 0.12, 0.0],
+    "list nodes": [0.0, 0.1, 1.0],
+}
+
+
+@pytest.fixture
+def semantic_cache():
+    """Fixture for a semantic cache over toy embeddings."""
+    return SemanticLLMCache(
+        embed=lambda texts: [_VECTORS[text] for text in texts],
+        threshold=0.95,
+        maxsize=2,
+        ttl=60
+    )
+
+
+class TestLLMCache:
+    """Test cases for LLMCache class."""
+
+    def test_key_is_deterministic(self):
+        """Identical payloads map to the same key; any field change alters it."""
+        key = LLMCache.make_key("model", "system", "user", 0)
+        assert key == LLMCache.make_key("model", "system", "user", 0)
+        assert key != LLMCache.make_key("model", "system", "other", 0)
+        assert key != LLMCache.make_key("other", "system", "user", 0)
+
+    def test_hit_and_miss_counters(self, cache):
+        """Lookups are counted and hits return the stored response."""
+        assert cache.get("k") is None
+        cache.set("k", {"analysis": {}, "success": True})
+
+        assert cache.get("k") == {"analysis": {}, "success": True}
+        assert cache.stats == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_returns_copies(self, cache):
+        """Mutating a returned response does not affect the cached entry."""
+        cache.set("k", {"success": True})
+        cache.get("k")["success"] = False
+
+        assert cache.get("k") == {"success": True}
+
+    def test_lru_eviction(self, cache):
+        """The least recently used entry is evicted when full."""
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")
+        cache.set("c", {"v": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("c") == {"v": 3}
+
+    def test_ttl_expiry(self, cache):
+        """Entries past their TTL are treated as misses."""
+        with patch("k8s_analyzer.llm.cache.time.monotonic", return_value=0):
+            cache.set("k", {"v": 1})
+        with patch("k8s_analyzer.llm.cache.time.monotonic", return_value=61):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+
+class TestSemanticLLMCache:
+    """Test cases for SemanticLLMCache class."""
+
+    def test_similar_prompt_hits(self, semantic_cache):
+        """A rewording above the similarity threshold returns the cached response."""
+        scope = SemanticLLMCache.make_scope("model", "system", 0)
+        semantic_cache.set(scope, semantic_cache.embed_prompt("list pods"), {"answer": "pods"})
+
+        hit = semantic_cache.get(scope, semantic_cache.embed_prompt("show pods"))
+
+        assert hit == {"answer": "pods", "cache_hit": "semantic"}
+
+    def test_dissimilar_prompt_misses(self, semantic_cache):
+        """Prompts below the threshold are misses."""
+        scope = SemanticLLMCache.make_scope("model", "system", 0)
+        semantic_cache.set(scope, semantic_cache.embed_prompt("list pods"), {"answer": "pods"})
+
+        assert semantic_cache.get(scope, semantic_cache.embed_prompt("list nodes")) is None
+        assert semantic_cache.stats["misses"] == 1
+
+    def test_scopes_are_isolated(self, semantic_cache):
+        """Entries cached under another system prompt are never returned."""
+        vector = semantic_cache.embed_prompt("list pods")
+        semantic_cache.set(SemanticLLMCache.make_scope("model", "system", 0), vector, {"answer": "pods"})
+
+        assert semantic_cache.get(SemanticLLMCache.make_scope("model", "other", 0), vector) is None
+
+    def test_oldest_entry_evicted(self, semantic_cache):
+        """The oldest entry is evicted when full."""
+        scope = SemanticLLMCache.make_scope("model", "system", 0)
+        for prompt in ("list pods", "list nodes", "show pods"):
+            semantic_cache.set(scope, semantic_cache.embed_prompt(prompt), {"answer": prompt})
+
+        assert len(semantic_cache) == 2
+        assert semantic_cache.get(scope, semantic_cache.embed_prompt("list pods"))["answer"] == "show pods"
+
+
+class TestEmbeddingBatcher:
+    """Test cases for EmbeddingBatcher class."""
+
+    def test_concurrent_requests_share_one_call(self):
+        """Concurrent embeds are sent as one batch and resolved in order."""
+        calls = []
+
+        def embed(texts):
+            calls.append(list(texts))
+            return [_VECTORS[text] for text in texts]
+
+        batcher = EmbeddingBatcher(embed, max_batch=8, max_wait=0.01)
+
+        async def run():
+            return await asyncio.gather(*(batcher.aembed(text) for text in ("list pods", "list nodes")))
+
+        assert asyncio.run(run()) == [_VECTORS["list pods"], _VECTORS["list nodes"]]
+        assert calls == [["list pods", "list nodes"]]
+
+    def test_full_batch_is_sent_immediately(self):
+        """Reaching max_batch sends without waiting for the timer."""
+        batcher = EmbeddingBatcher(lambda texts: [_VECTORS[text] for text in texts], max_batch=1, max_wait=60)
+
+        assert asyncio.run(asyncio.wait_for(batcher.aembed("list pods"), timeout=5)) == _VECTORS["list pods"]
@@ -0,0 +1,78 @@
+"""Unit tests for the LLM token-bucket rate limiter."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from k8s_analyzer.llm.ratelimit import TokenBucket, make_bucket
+
+
+@pytest.fixture
+def clock():
+    """Fixture for a controllable monotonic clock."""
+    now = [0.0]
+    with patch("k8s_analyzer.llm.ratelimit.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket class."""
+
+    def test_disabled_limits(self):
+        """No bucket is built when both limits are off."""
+        assert make_bucket(0, 0) is None
+        assert isinstance(make_bucket(60, 0), TokenBucket)
+
+    def test_burst_within_budget(self, clock):
+        """Calls within the per-minute budget are not delayed."""
+        bucket = TokenBucket(rpm=2, tpm=1000)
+
+        assert bucket._try_acquire(400) == 0
+        assert bucket._try_acquire(400) == 0
+
+    def test_request_budget_wait(self, clock):
+        """Exceeding RPM reports the time until one request refills."""
+        bucket = TokenBucket(rpm=60)
+        assert bucket._try_acquire(0) == 0
+
+        for _ in range(59):
+            bucket._try_acquire(0)
+
+        assert bucket._try_acquire(0) == pytest.approx(1.0)
+        clock[0] += 1.0
+        assert bucket._try_acquire(0) == 0
+
+    def test_token_budget_wait(self, clock):
+        """Exceeding TPM reports the time until enough tokens refill."""
+        bucket = TokenBucket(tpm=600)
+        bucket._try_acquire(600)
+
+        assert bucket._try_acquire(100) == pytest.approx(10.0)
+
+    def test_oversized_request_waits_for_full_bucket(self, clock):
+        """A call larger than the whole TPM budget is clamped instead of waiting forever."""
+        bucket = TokenBucket(tpm=100)
+
+        assert bucket._try_acquire(1000) == 0
+
+    @patch("k8s_analyzer.llm.ratelimit.time.sleep")
+    def test_acquire_sleeps_until_capacity(self, mock_sleep, clock):
+        """acquire() sleeps for the reported wait, then proceeds."""
+        bucket = TokenBucket(rpm=60)
+        for _ in range(60):
+            bucket.acquire()
+
+        def advance(seconds):
+            clock[0] += seconds
+        mock_sleep.side_effect = advance
+
+        bucket.acquire()
+        mock_sleep.assert_called_once_with(pytest.approx(1.0))
+
+    def test_async_acquire(self, clock):
+        """aacquire() takes capacity without blocking when available."""
+        bucket = TokenBucket(rpm=1)
+
+        asyncio.run(bucket.aacquire())
+
+        assert bucket._try_acquire(0) > 0
@@ -110,8 +110,8 @@ class TestReActAgent:
         assert len(agent.state.history) == 2
         
         # Verify history structure
-        assert agent.state.history[0]["role"] == "user"
-        assert agent.state.history[1]["role"] == "assistant"
+        assert agent.state.history[0].role == "user"
+        assert agent.state.history[1].role == "assistant"
     
     def test_action_execution(self, agent, mock_tool):
         """TC5_007: Test action execution."""
@@ -0,0 +1,81 @@
+"""Unit tests for extracting the ReAct agent's decision from LLM replies."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from k8s_analyzer.llm.base import JsonObjectScanner, is_decision
+from k8s_analyzer.react.agent import ReActAgent, decision_cache
+
+_VALID = '{"type": "final_answer", "main_response": "ok", "confidence": 0.9, "reasoning": "r"}'
+
+@pytest.fixture
+def agent():
+    """Fixture for an agent with a fresh state."""
+    agent = ReActAgent(llm=MagicMock(), tools=MagicMock())
+    agent.initialize_state(session_id="test-session")
+    agent.execution_logger = MagicMock()
+    return agent
+
+def _streamed(text):
+    """A scanner that has seen `text` as a streamed reply."""
+    scanner = JsonObjectScanner(is_decision)
+    scanner.feed(text)
+    return scanner
+
+class TestDecisionFromReply:
+    """Test cases for ReActAgent._decision_from_reply."""
+    
+    def test_invalid_streamed_object_falls_back_to_full_text(self, agent):
+        """Test an unusable streamed object falls back to searching the reply."""
+        reply = f"Checked.\n```json\n{_VALID}\n```"
+        scanner = _streamed('Checked.\n```json\n{"type": "final_answer"}')
+        
+        decision, feedback = agent._decision_from_reply(reply, scanner)
+        
+        assert feedback is None
+        assert decision["main_response"] == "ok"
+    
+    def test_unparseable_streamed_reply_asks_again(self, agent):
+        """Test a streamed reply with no usable decision yields retry feedback."""
+        reply = 'Checked.\n```json\n{"type": "final_answer"}'
+        
+        decision, feedback = agent._decision_from_reply(reply, _streamed(reply))
+        
+        assert decision is None
+        assert "could not be parsed" in feedback
+
+class TestDecisionCache:
+    """Test cases for the parsed-decision cache."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        decision_cache.clear()
+        yield
+        decision_cache.clear()
+    
+    def test_deterministic_decision_is_reused(self, agent):
+        """Test a repeated prompt pair skips the LLM call and parsing."""
+        agent.llm.temperature = 0
+        agent.llm.model = "test-model"
+        agent.llm.analyze.return_value = f"Checked.\n```json\n{_VALID}\n```"
+        
+        first, _ = agent._get_decision("system", "user")
+        with patch.object(agent, "_parse_llm_response") as parse:
+            second, feedback = agent._get_decision("system", "user")
+        
+        assert feedback is None
+        assert second == first and second is not first
+        agent.llm.analyze.assert_called_once()
+        parse.assert_not_called()
+        assert [entry.role for entry in agent.state.history] == ["llm", "llm"]
+    
+    def test_sampled_decision_is_not_cached(self, agent):
+        """Test replies at a non-zero temperature are parsed every time."""
+        agent.llm.temperature = 0.7
+        agent.llm.analyze.return_value = f"Checked.\n```json\n{_VALID}\n```"
+        
+        agent._get_decision("system", "user")
+        agent._get_decision("system", "user")
+        
+        assert agent.llm.analyze.call_count == 2
+        assert len(decision_cache) == 0
@@ -0,0 +1,55 @@
+"""Unit tests for the ReAct agent's history formatting."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from k8s_analyzer.react.agent import ReActAgent
+from k8s_analyzer.tools.result import ToolResult
+
+@pytest.fixture
+def agent():
+    """Fixture for an agent with a fresh state."""
+    agent = ReActAgent(llm=MagicMock(), tools=MagicMock())
+    agent.initialize_state(session_id="test-session")
+    return agent
+
+class TestFormatHistory:
+    """Test cases for ReActAgent.format_history."""
+    
+    def test_tool_results_are_formatted(self, agent):
+        """Test tool results come through paired with their actions."""
+        action = {"tool": "kubectl", "parameters": {"command": "get pods"}}
+        agent.state.add_interaction("llm", "I should list pods.")
+        agent.state.add_interaction("tool", ToolResult(success=True, data={"items": ["p1"]}), action=action)
+        
+        history = agent.format_history()
+        
+        assert len(history) == 1
+        assert history[0]["action"] == action
+        assert history[0]["result"]["success"] is True
+        assert history[0]["result"]["data"] == {"items": ["p1"]}
+        assert history[0]["timestamp"] == agent.state.history[1].timestamp
+
+class TestGetFinalAnswer:
+    """Test cases for ReActAgent.get_final_answer."""
+    
+    def test_final_answer_from_history(self, agent):
+        """Test the recorded final answer decision is returned."""
+        decision = {"type": "final_answer", "main_response": "All pods are healthy."}
+        agent.state.add_interaction("llm", "Pods look fine.")
+        agent.state.add_interaction("final_answer", decision)
+        
+        answer = agent.get_final_answer()
+        
+        assert answer["success"] is True
+        assert answer["answer"] == decision
+        assert answer["metadata"]["session_id"] == "test-session"
+    
+    def test_falls_back_to_last_entry(self, agent):
+        """Test the last entry is returned when no final answer was recorded."""
+        agent.state.add_interaction("llm", "Still investigating.")
+        
+        answer = agent.get_final_answer()
+        
+        assert answer["answer"] == "Still investigating."
+        assert answer["metadata"]["is_final"] is False
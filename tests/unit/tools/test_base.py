@@ -1,9 +1,10 @@
 """Unit tests for the base tool implementation."""
 
+import asyncio
 import pytest
 from datetime import datetime
 from typing import Dict, Any, List
-from k8s_analyzer.tools.base import BaseTool, ToolResult, ToolContext
+from k8s_analyzer.tools.base import BaseTool, ToolResult, ToolContext, run_tools_parallel
 from k8s_analyzer.tools.exceptions import (
     ToolError,
     ToolValidationError,
@@ -118,6 +119,16 @@ class TestBaseTool:
         expected = f"{tool.name}: {tool.description}"
         assert str(tool) == expected
 
+    def test_run_tools_parallel(self):
+        """Test tools run concurrently return results in order."""
+        tools = [MockTool(), MockTool(should_fail=True), MockTool()]
+        kwargs_list = [{"test_param": "a"}, {"test_param": "b"}, {"test_param": "c"}]
+
+        results = asyncio.run(run_tools_parallel(tools, kwargs_list))
+
+        assert [result.success for result in results] == [True, False, True]
+        assert results[2].data == {"result": "c"}
+
 class TestToolResult:
     """Test cases for ToolResult class."""
     
@@ -0,0 +1,79 @@
+"""Unit tests for the cluster health tools."""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from k8s_analyzer.tools.health_tools import (
+    CheckClusterEventsTool,
+    CheckNodeStatusTool,
+    HealthSnapshotTool,
+    _EVENTS_QUERY,
+    _parse_node_ready
+)
+from k8s_analyzer.tools.result import ToolResult
+
+_NODE_LINES = "node-a=True\nnode-b=False\n"
+_EVENTS = {"items": [{"type": "Warning", "reason": "BackOff"}]}
+
+def _kubectl_result(data):
+    """Wrap data the way KubectlTool.execute returns it."""
+    return ToolResult(success=True, data=ToolResult(success=True, data=data))
+
+@pytest.fixture
+def kubectl():
+    """Fixture for a mocked shared KubectlTool."""
+    kubectl = MagicMock()
+    kubectl.execute.side_effect = lambda **kwargs: _kubectl_result(
+        _NODE_LINES if kwargs["resource"] == "nodes" else _EVENTS
+    )
+    with patch("k8s_analyzer.tools.health_tools._get_kubectl", return_value=kubectl):
+        yield kubectl
+
+class TestHealthTools:
+    """Test cases for the health tools."""
+    
+    def test_parse_node_ready(self):
+        """TC9_001: Test name=status lines are parsed; a missing status is Unknown."""
+        assert _parse_node_ready("a=True\nb=\n\nmalformed\n") == {"a": "True", "b": "Unknown"}
+    
+    def test_check_node_status(self, kubectl):
+        """TC9_002: Test node status is fetched with the Ready projection."""
+        result = CheckNodeStatusTool().execute()
+        
+        assert result.success
+        assert result.data == {"node-a": "True", "node-b": "False"}
+        assert "projection" in kubectl.execute.call_args.kwargs
+    
+    def test_health_snapshot(self, kubectl):
+        """TC9_003: Test the snapshot returns nodes and events from both queries."""
+        result = HealthSnapshotTool().execute()
+        
+        assert result.success
+        assert result.data == {"nodes": {"node-a": "True", "node-b": "False"}, "events": _EVENTS}
+        assert sorted(call.kwargs["resource"] for call in kubectl.execute.call_args_list) == ["events", "nodes"]
+    
+    def test_health_snapshot_failure(self, kubectl):
+        """TC9_004: Test a failed kubectl query fails the snapshot."""
+        kubectl.execute.side_effect = lambda **kwargs: ToolResult(success=False, error="forbidden")
+        
+        result = HealthSnapshotTool().execute()
+        
+        assert not result.success
+        assert "forbidden" in result.error
+    
+    def test_cluster_events_newest_first(self, kubectl):
+        """TC9_005: Test events are sorted newest first and trimmed client-side."""
+        events = {"metadata": {}, "items": [
+            {"reason": "Old", "lastTimestamp": "2024-01-01T00:00:00Z"},
+            {"reason": "New", "eventTime": "2024-01-03T00:00:00.000000Z"},
+            {"reason": "Mid", "lastTimestamp": "2024-01-02T00:00:00Z"},
+        ]}
+        kubectl.execute.side_effect = lambda **kwargs: _kubectl_result(events)
+        
+        with patch("k8s_analyzer.tools.health_tools._MAX_EVENTS", 2):
+            result = CheckClusterEventsTool().execute()
+        
+        data = result.data.data.data
+        assert [event["reason"] for event in data["items"]] == ["New", "Mid"]
+        assert data["metadata"]["remainingItemCount"] == 1
+        assert "limit" not in _EVENTS_QUERY
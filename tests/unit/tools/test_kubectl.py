@@ -1,9 +1,11 @@
 """Unit tests for the Kubectl tool implementation."""
 
 import pytest
+import io
 import json
 from unittest.mock import patch, MagicMock
-from k8s_analyzer.tools.kubectl import KubectlTool, KubectlConfig
+from k8s_analyzer.tools.kubectl import KubectlTool, KubectlConfig, _shared_api_client
+from k8s_analyzer.tools.config import KUBECTL_EVENTS_CACHE_TTL, TOOL_REGISTRY_CACHE_TTL
 from k8s_analyzer.tools.exceptions import (
     ToolValidationError,
     ToolExecutionError,
@@ -22,9 +24,8 @@ def kubectl_config():
         path="/usr/local/bin/kubectl"
     )
 
-@pytest.fixture
-def kubectl_tool(kubectl_config):
-    """Fixture for kubectl tool instance."""
+def _make_tool(kubectl_config):
+    """Create a kubectl tool with the version check at initialization mocked."""
     with patch("subprocess.run") as mock_run:
         # Mock successful initialization
         mock_run.return_value = MagicMock(
@@ -32,9 +33,27 @@ def kubectl_tool(kubectl_config):
             stdout=json.dumps({"clientVersion": {"gitVersion": "v1.22.0"}}),
             stderr=""
         )
-        tool = KubectlTool(config=kubectl_config)
-        mock_run.reset_mock()  # Reset after initialization
-        return tool
+        return KubectlTool(config=kubectl_config)
+
+@pytest.fixture
+def kubectl_tool(kubectl_config):
+    """Fixture for kubectl tool instance."""
+    # Without an API client, list requests go through the mocked subprocess
+    # rather than to the cluster of a local kubeconfig
+    with patch("k8s_analyzer.tools.kubectl._shared_api_client", return_value=None):
+        yield _make_tool(kubectl_config)
+
+@pytest.fixture
+def api_tool(kubectl_config):
+    """Fixture for kubectl tool instance with a mocked typed API client."""
+    api_client = MagicMock()
+    api_client.sanitize_for_serialization.side_effect = lambda result: {"items": [result]}
+    with patch("k8s_analyzer.tools.kubectl._shared_api_client", return_value=api_client), \
+         patch("kubernetes.client.CoreV1Api") as core_api, \
+         patch("kubernetes.client.AppsV1Api"):
+        tool = _make_tool(kubectl_config)
+        tool.core_api = core_api.return_value
+        yield tool
 
 class TestKubectlTool:
     """Test cases for KubectlTool class."""
@@ -180,4 +199,161 @@ class TestKubectlTool:
         mock_run.side_effect = Exception("Failed to access kubectl binary")
         
         with pytest.raises(ToolExecutionError, match="Failed to initialize kubectl"):
-            KubectlTool(config=KubectlConfig(path="/nonexistent/kubectl")) 
\ No newline at end of file
+            KubectlTool(config=KubectlConfig(path="/nonexistent/kubectl"))
+    
+    @patch("subprocess.Popen")
+    def test_stream_items(self, mock_popen, kubectl_tool):
+        """TC2_013: Test streaming list items from kubectl output."""
+        process = mock_popen.return_value
+        process.stdout = io.BytesIO(json.dumps({"items": [{"metadata": {"name": "a"}}, {"metadata": {"name": "b"}}]}).encode())
+        process.stderr = io.BytesIO(b"")
+        process.returncode = 0
+        process.poll.return_value = 0
+        
+        items = list(kubectl_tool.stream_items(command="get", resource="pods"))
+        
+        assert [item["metadata"]["name"] for item in items] == ["a", "b"]
+        cmd_args = mock_popen.call_args[0][0]
+        assert cmd_args[-2:] == ["-o", "json"]
+    
+    @patch("subprocess.Popen")
+    def test_stream_items_error(self, mock_popen, kubectl_tool):
+        """TC2_014: Test streaming when kubectl fails."""
+        process = mock_popen.return_value
+        process.stdout = io.BytesIO(b"")
+        process.stderr = io.BytesIO(b"Error: pods not found")
+        process.returncode = 1
+        process.poll.return_value = 1
+        
+        with pytest.raises(ToolExecutionError, match="pods not found"):
+            list(kubectl_tool.stream_items(command="get", resource="pods"))
+
+    def test_build_command_list_options(self, kubectl_tool):
+        """TC2_015: Test list options map to kubectl flags; API-only options are dropped."""
+        cmd_parts, _ = kubectl_tool._build_command({
+            "command": "get",
+            "resource": "events",
+            "all_namespaces": True,
+            "field_selector": "type=Warning",
+            "limit": 200,
+            "resource_version": "0",
+        })
+        
+        assert "--all-namespaces" in cmd_parts
+        assert "--field-selector=type=Warning" in cmd_parts
+        assert not any(part.startswith(("--limit", "--resource")) for part in cmd_parts)
+    
+    def test_build_command_projection(self, kubectl_tool):
+        """TC2_016: Test a projection is passed to kubectl as jsonpath output."""
+        cmd_parts, json_output = kubectl_tool._build_command({
+            "command": "get",
+            "resource": "nodes",
+            "projection": "{.items[*].metadata.name}",
+        })
+        
+        assert cmd_parts[-2:] == ["-o", "jsonpath={.items[*].metadata.name}"]
+        assert not json_output
+
+class TestKubectlCache:
+    """Test cases for the kubectl result cache."""
+    
+    @pytest.fixture
+    def mock_run(self):
+        """Fixture for a subprocess.run returning an empty pod list."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps({"items": []}), stderr="")
+            yield mock_run
+    
+    def test_cache_hit(self, mock_run, kubectl_tool):
+        """TC2_021: Test an identical read is served from the cache as a copy."""
+        first = kubectl_tool.execute(command="get", resource="pods")
+        first.data.data["items"].append("modified")
+        
+        second = kubectl_tool.execute(command="get", resource="pods")
+        
+        mock_run.assert_called_once()
+        assert second.data.metadata["cached"] is True
+        assert second.data.data == {"items": []}
+        second.data.data["items"].append("modified")
+        assert kubectl_tool.execute(command="get", resource="pods").data.data == {"items": []}
+    
+    def test_cache_expiry(self, mock_run, kubectl_tool):
+        """TC2_022: Test entries past their TTL are fetched again; events expire sooner."""
+        with patch("k8s_analyzer.tools.kubectl.time.monotonic", return_value=0):
+            kubectl_tool.execute(command="get", resource="pods")
+            kubectl_tool.execute(command="get", resource="events")
+        with patch("k8s_analyzer.tools.kubectl.time.monotonic", return_value=KUBECTL_EVENTS_CACHE_TTL + 1):
+            kubectl_tool.execute(command="get", resource="pods")
+            assert mock_run.call_count == 2
+            kubectl_tool.execute(command="get", resource="events")
+            assert mock_run.call_count == 3
+        with patch("k8s_analyzer.tools.kubectl.time.monotonic", return_value=TOOL_REGISTRY_CACHE_TTL + 1):
+            kubectl_tool.execute(command="get", resource="pods")
+            assert mock_run.call_count == 4
+    
+    def test_cache_bypass(self, mock_run, kubectl_tool):
+        """TC2_023: Test _cache_bypass forces a fresh read."""
+        kubectl_tool.execute(command="get", resource="pods")
+        
+        result = kubectl_tool.execute(command="get", resource="pods", _cache_bypass=True)
+        
+        assert mock_run.call_count == 2
+        assert "cached" not in result.data.metadata
+        assert "--_cache_bypass" not in mock_run.call_args[0][0]
+    
+    def test_cache_eviction(self, mock_run, kubectl_tool):
+        """TC2_024: Test the oldest entry is evicted when the cache is full."""
+        with patch("k8s_analyzer.tools.kubectl._RESULT_CACHE_SIZE", 1):
+            kubectl_tool.execute(command="get", resource="pods")
+            kubectl_tool.execute(command="get", resource="services")
+            kubectl_tool.execute(command="get", resource="pods")
+        
+        assert mock_run.call_count == 3
+        assert len(kubectl_tool._result_cache) == 1
+
+class TestKubectlApi:
+    """Test cases for list requests served through the typed API."""
+    
+    @patch("subprocess.run")
+    def test_namespaced_list(self, mock_run, api_tool):
+        """TC2_017: Test a namespaced list uses the namespaced API call."""
+        api_tool.core_api.list_namespaced_pod.return_value = "pod-list"
+        
+        result = api_tool.execute(command="get", resource="pods", label_selector="app=web")
+        
+        assert result.success
+        assert result.data.data == {"items": ["pod-list"]}
+        assert result.data.metadata["source"] == "api"
+        api_tool.core_api.list_namespaced_pod.assert_called_once_with("default", label_selector="app=web")
+        mock_run.assert_not_called()
+    
+    @patch("subprocess.run")
+    def test_all_namespaces_list(self, mock_run, api_tool):
+        """TC2_018: Test all_namespaces selects the cluster-wide API call."""
+        api_tool.execute(command="get", resource="pods", all_namespaces=True)
+        
+        api_tool.core_api.list_pod_for_all_namespaces.assert_called_once_with()
+        api_tool.core_api.list_namespaced_pod.assert_not_called()
+        mock_run.assert_not_called()
+    
+    @patch("subprocess.run")
+    def test_unknown_flag_falls_back_to_kubectl(self, mock_run, api_tool):
+        """TC2_019: Test flags without an API equivalent use the kubectl binary."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps({"items": []}), stderr="")
+        
+        result = api_tool.execute(command="get", resource="pods", sort_by=".metadata.name")
+        
+        assert result.success
+        mock_run.assert_called_once()
+        assert "--sort-by=.metadata.name" in mock_run.call_args[0][0]
+        api_tool.core_api.list_namespaced_pod.assert_not_called()
+    
+    def test_shared_api_client_caches_failure(self):
+        """TC2_020: Test a context without cluster configuration is only tried once."""
+        with patch.dict("k8s_analyzer.tools.kubectl._SHARED_API_CLIENTS", clear=True), \
+             patch("kubernetes.config.load_kube_config", side_effect=Exception("no kubeconfig")) as load_kube, \
+             patch("kubernetes.config.load_incluster_config", side_effect=Exception("not in cluster")):
+            logger = MagicMock()
+            assert _shared_api_client("missing", logger) is None
+            assert _shared_api_client("missing", logger) is None
+            load_kube.assert_called_once()
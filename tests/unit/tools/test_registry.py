@@ -170,4 +170,43 @@ class TestToolRegistry:
         tool = registry.get_tool("mock")
         
         assert isinstance(tool, MockTool)
-        assert tool.name == "mock" 
\ No newline at end of file
+        assert tool.name == "mock" 
+
+    def test_tool_descriptions_cached_per_version(self, registry):
+        """TC3_013: Test descriptions are reused until a tool is registered."""
+        registry.register_tool("mock", MockTool)
+        descriptions = registry.get_tool_descriptions()
+        version = registry.version
+
+        assert registry.get_tool_descriptions() is descriptions
+
+        registry.register_tool("mock2", MockTool)
+        assert registry.version == version + 1
+        assert set(registry.get_tool_descriptions()) == {"mock", "mock2"}
+
+    def test_tool_descriptions_from_class_attributes(self, registry):
+        """TC3_014: Test class-level descriptions do not instantiate the tool."""
+        class StaticMockTool(MockTool):
+            description = "Static description"
+            parameters = {"namespace": {"type": "string"}}
+
+        registry.register_tool("static", StaticMockTool)
+        registry.register_tool("mock", MockTool)
+        descriptions = registry.get_tool_descriptions()
+
+        assert descriptions["static"]["description"] == "Static description"
+        assert "static" not in registry._tools
+        assert descriptions["mock"]["description"] == "Mock tool description"
+        assert "mock" in registry._tools
+
+    def test_tool_cache_is_bounded(self, registry):
+        """TC3_015: Test the least recently used instance is evicted when full."""
+        registry.register_tool("mock", MockTool)
+        with patch("k8s_analyzer.tools.TOOL_INSTANCE_CACHE_SIZE", 2):
+            first = registry.get_tool("mock", config="a")
+            registry.get_tool("mock")
+            assert registry.get_tool("mock", config="a") is first
+            registry.get_tool("mock", config="b")
+
+        assert len(registry._tools) == 2
+        assert "mock" not in registry._tools